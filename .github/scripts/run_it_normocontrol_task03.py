@@ -7,8 +7,10 @@ It:
 - Maps GitHub username -> student directory via `students/students.csv`.
 - Ensures the PR changes include the target file:
     `students/<Student>/task_03/Пояснительная_записка.docx`
-- Runs `scripts/standards_verification/check_it_docx.py` for that single file.
-- Collects generated markdown reports from `normocontrol_reports/`.
+- Runs `scripts/standards_verification/check_it_docx.py` for that single file
+  (via the resident `normocontrol_server.py` when `NORMOCONTROL_SERVER_URL` is set,
+  falling back to a subprocess).
+- Reads the checker's JSON result (`--json-out`) to locate the markdown report in `normocontrol_reports/`.
 - Writes a ready-to-post PR comment body to `.github/it_normocontrol_comment.md`.
 - Writes a machine-readable result to `.github/it_normocontrol_result.json`.
 
@@ -22,9 +24,10 @@ from __future__ import annotations
 import csv
 import json
 import os
-import re
 import subprocess
 import sys
+import tempfile
+import urllib.error
 import urllib.request
 from dataclasses import dataclass
 from pathlib import Path
@@ -208,58 +211,90 @@ def _truncate_for_comment(text: str, limit: int) -> str:
     return truncated
 
 
-def _detect_new_report(before: set[Path], after: set[Path]) -> Path | None:
-    """Return the newest report file created between two snapshots."""
+def _check_run_from_result(docx_path: Path, result: dict | None, stdout: str, stderr: str, exit_code: int) -> CheckRun:
+    """Build a CheckRun from the checker's machine-readable result payload."""
 
-    new_files = [p for p in after - before if p.is_file()]
-    if not new_files:
+    if result is None:
+        return CheckRun(
+            docx_path=docx_path,
+            exit_code=exit_code,
+            report_path=None,
+            report_text="",
+            stdout=stdout,
+            stderr=stderr,
+        )
+
+    report_path = Path(result["report_path"]) if result.get("report_path") else None
+    report_text = _read_text(report_path) if report_path and report_path.exists() else ""
+
+    return CheckRun(
+        docx_path=docx_path,
+        exit_code=int(result.get("exit_code", exit_code)),
+        report_path=report_path,
+        report_text=report_text,
+        stdout=stdout,
+        stderr=stderr,
+    )
+
+
+def _run_checker_via_server(server_url: str, docx_path: Path) -> CheckRun | None:
+    """Check a .docx file on the resident normocontrol server.
+
+    Returns None if the server is unreachable or answers with an error,
+    so the caller can fall back to a subprocess run.
+    """
+
+    request = urllib.request.Request(
+        f"{server_url.rstrip('/')}/check",
+        data=json.dumps({"path": str(docx_path)}).encode("utf-8"),
+        headers={"Content-Type": "application/json"},
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=300) as response:
+            result = json.load(response)
+    except (urllib.error.URLError, OSError, ValueError):
         return None
 
-    return max(new_files, key=lambda p: p.stat().st_mtime)
+    summary = result.get("report", {}).get("summary", {})
+    stdout = (
+        f"Report: {result.get('report_path')}\n"
+        f"Issues: {summary.get('total_issues', 0)} "
+        f"(errors={summary.get('errors', 0)}, warnings={summary.get('warnings', 0)})\n"
+    )
+    return _check_run_from_result(docx_path, result, stdout, "", int(result.get("exit_code", 1)))
 
 
 def _run_checker(root: Path, docx_path: Path) -> CheckRun:
-    """Run the checker script for a given .docx file."""
+    """Run the checker for a given .docx file (server if available, else subprocess).
 
-    checker = root / "scripts" / "standards_verification" / "check_it_docx.py"
-    reports_dir = root / "normocontrol_reports"
-    reports_dir.mkdir(parents=True, exist_ok=True)
+    The subprocess writes its result as JSON to a private `--json-out` file,
+    so no report directory scanning is needed and concurrent runs cannot mix up reports.
+    """
 
-    before = set(reports_dir.glob("it_normocontrol_report_*.md"))
+    server_url = os.environ.get("NORMOCONTROL_SERVER_URL")
+    if server_url:
+        run = _run_checker_via_server(server_url, docx_path)
+        if run is not None:
+            return run
 
-    proc = subprocess.run(
-        [sys.executable, str(checker), str(docx_path)],
-        cwd=str(root),
-        text=True,
-        capture_output=True,
-    )
+    checker = root / "scripts" / "standards_verification" / "check_it_docx.py"
 
-    after = set(reports_dir.glob("it_normocontrol_report_*.md"))
-    report_path = _detect_new_report(before, after)
+    with tempfile.TemporaryDirectory(prefix="it_normocontrol_") as tmp_dir:
+        json_out = Path(tmp_dir) / "result.json"
 
-    report_text = ""
-    if report_path and report_path.exists():
-        report_text = _read_text(report_path)
+        proc = subprocess.run(
+            [sys.executable, str(checker), str(docx_path), "--json-out", str(json_out)],
+            cwd=str(root),
+            text=True,
+            capture_output=True,
+        )
 
-    # Fallback: try to parse report path from stdout
-    if not report_text:
-        match = re.search(r"Report:\s*(.+?it_normocontrol_report_\d{8}_\d{6}\.md)", proc.stdout, flags=re.DOTALL)
-        if match:
-            guessed = Path(match.group(1).strip())
-            if not guessed.is_absolute():
-                guessed = (root / guessed).resolve()
-            if guessed.exists():
-                report_path = guessed
-                report_text = _read_text(guessed)
+        try:
+            result = json.loads(json_out.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            result = None
 
-    return CheckRun(
-        docx_path=docx_path,
-        exit_code=int(proc.returncode),
-        report_path=report_path,
-        report_text=report_text,
-        stdout=proc.stdout,
-        stderr=proc.stderr,
-    )
+    return _check_run_from_result(docx_path, result, proc.stdout, proc.stderr, int(proc.returncode))
 
 
 def _format_comment(runs: list[CheckRun]) -> tuple[str, int]:
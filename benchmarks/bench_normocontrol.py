@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""Throughput benchmark of the IT normocontrol pipeline.
+
+Times `check_it_docx` on synthetic explanatory notes of 10/100/500 pages
+(see `synthetic_docx.py`) end-to-end and per phase:
+
+- `unzip` — reading every archive member;
+- `parse` — one streaming pass over `word/document.xml` without checks;
+- `check:<name>` — every registered check and view (`check_it_docx.CHECKS`),
+  plus the shared scan itself (`check:(scan document.xml)`);
+- `report` — rendering the markdown report;
+- `end_to_end` — `check_it_docx` with the result cache disabled;
+
+and records the peak RSS of a fresh process per document size. Each size
+is measured in its own subprocess; phase times are the best of `--repeat`
+runs.
+
+Results are compared with `benchmarks/baseline.json`: a time above
+`baseline * (1 + --tolerance)` (and more than `--min-delta-ms` slower) or
+an RSS above `baseline * (1 + --rss-tolerance)` is a regression and makes
+the exit code 1. So is a baseline mismatch: a measured size or phase the
+baseline does not have, or a baseline phase that was not measured
+(checks were added, renamed or removed since the baseline). Baselines are machine specific; refresh them with
+`--update-baseline` after intended changes or on a new machine.
+
+Usage (from the repository root):
+
+    python benchmarks/bench_normocontrol.py
+    python benchmarks/bench_normocontrol.py --sizes 10 100 --repeat 5
+    python benchmarks/bench_normocontrol.py --update-baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import json
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+REPO_ROOT = BENCHMARKS_DIR.parent
+CHECKER_DIR = REPO_ROOT / "scripts" / "standards_verification"
+DATA_DIR = BENCHMARKS_DIR / ".data"
+BASELINE_PATH = BENCHMARKS_DIR / "baseline.json"
+
+DEFAULT_SIZES = (10, 100, 500)
+
+
+def _best_of(repeat: int, action) -> float:
+    """Best wall time of `repeat` calls, in seconds."""
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        action()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure(pages: int, repeat: int) -> dict:
+    """Measure all phases for one document size in the current process."""
+
+    sys.path.insert(0, str(CHECKER_DIR))
+    sys.path.insert(0, str(REPO_ROOT))
+    sys.path.insert(0, str(BENCHMARKS_DIR))
+
+    import check_it_docx as checker
+    from synthetic_docx import synthetic_docx
+    from tests.helpers.parsed_docx import ParsedDocx
+
+    docx_path = synthetic_docx(DATA_DIR, pages)
+    config = checker.load_it_normocontrol_config(checker._standards_md_path(REPO_ROOT))
+    phases: dict[str, float] = {}
+
+    def unzip() -> None:
+        with zipfile.ZipFile(docx_path) as archive:
+            for name in archive.namelist():
+                archive.read(name)
+
+    def parse() -> None:
+        with ParsedDocx(docx_path) as parsed:
+            parsed.scan()
+
+    phases["unzip"] = _best_of(repeat, unzip)
+    phases["parse"] = _best_of(repeat, parse)
+
+    report = None
+    with tempfile.TemporaryDirectory(prefix="normocontrol_bench_") as tmp_dir, contextlib.redirect_stdout(io.StringIO()):
+        report_dir = Path(tmp_dir)
+
+        for _ in range(repeat):
+            report = checker._new_report(config)
+            profile = checker.run_checks(docx_path, docx_path.name, report, config, profile=True)
+            for timing in profile.timings.values():
+                key = f"check:{timing.name}"
+                phases[key] = min(phases.get(key, float("inf")), timing.seconds)
+
+        phases["report"] = _best_of(
+            repeat, lambda: checker.write_markdown_report(report, report_dir, "bench_report")
+        )
+        phases["end_to_end"] = _best_of(
+            repeat, lambda: checker.check_it_docx(docx_path, report_dir, use_cache=False)
+        )
+
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS.
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_rss_mb = peak_rss / (1024 * 1024) if sys.platform == "darwin" else peak_rss / 1024
+
+    return {
+        "document_bytes": docx_path.stat().st_size,
+        "phases_ms": {name: round(seconds * 1000, 2) for name, seconds in sorted(phases.items())},
+        "peak_rss_mb": round(peak_rss_mb, 1),
+    }
+
+
+def _run_size(pages: int, repeat: int) -> dict:
+    """Measure one size in a fresh interpreter (isolated peak RSS and warm-up)."""
+
+    completed = subprocess.run(
+        [sys.executable, str(Path(__file__).resolve()), "--measure", str(pages), "--repeat", str(repeat)],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return json.loads(completed.stdout)
+
+
+def compare(results: dict, baseline: dict, tolerance: float, rss_tolerance: float, min_delta_ms: float) -> list[str]:
+    """Regression and baseline mismatch messages of `results` against `baseline`."""
+
+    regressions = []
+    for size, result in results.items():
+        base = baseline.get("sizes", {}).get(size)
+        if base is None:
+            regressions.append(f"{size} p: not in the baseline (baseline mismatch)")
+            continue
+        for phase in sorted(base["phases_ms"].keys() - result["phases_ms"].keys()):
+            regressions.append(f"{size} p, {phase}: in the baseline but not measured (baseline mismatch)")
+        for phase, ms in result["phases_ms"].items():
+            base_ms = base["phases_ms"].get(phase)
+            if base_ms is None:
+                regressions.append(f"{size} p, {phase}: not in the baseline (baseline mismatch)")
+                continue
+            if ms > base_ms * (1 + tolerance) and ms - base_ms > min_delta_ms:
+                regressions.append(f"{size} p, {phase}: {ms:.1f} ms (baseline {base_ms:.1f} ms)")
+        base_rss = base.get("peak_rss_mb")
+        if base_rss and result["peak_rss_mb"] > base_rss * (1 + rss_tolerance):
+            regressions.append(f"{size} p, peak RSS: {result['peak_rss_mb']:.1f} MB (baseline {base_rss:.1f} MB)")
+    return regressions
+
+
+def format_results(results: dict, baseline: dict) -> str:
+    """Plain-text table: phase times per size with the change against the baseline."""
+
+    lines = []
+    for size, result in results.items():
+        base = baseline.get("sizes", {}).get(size, {})
+        base_phases = base.get("phases_ms", {})
+        lines.append(f"{size} стр. ({result['document_bytes'] / 1024:.0f} КБ), peak RSS {result['peak_rss_mb']:.1f} МБ")
+        lines.append(f"  {'phase':<32} {'ms':>9} {'baseline':>9} {'change':>8}")
+        for phase, ms in sorted(result["phases_ms"].items(), key=lambda item: -item[1]):
+            base_ms = base_phases.get(phase)
+            change = f"{(ms / base_ms - 1) * 100:+.0f}%" if base_ms else ""
+            base_text = f"{base_ms:.1f}" if base_ms is not None else "—"
+            lines.append(f"  {phase:<32} {ms:>9.1f} {base_text:>9} {change:>8}")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    """CLI entrypoint."""
+
+    parser = argparse.ArgumentParser(description="Benchmark of the IT normocontrol pipeline")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="Document sizes in pages")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per phase (best time is kept)")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="Baseline JSON to compare with")
+    parser.add_argument("--update-baseline", action="store_true", help="Write the measured results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed relative slowdown (default: 0.25)")
+    parser.add_argument("--rss-tolerance", type=float, default=0.20, help="Allowed relative RSS growth (default: 0.20)")
+    parser.add_argument("--min-delta-ms", type=float, default=10.0, help="Ignore slowdowns below this many ms (default: 10)")
+    parser.add_argument("--json-out", type=Path, metavar="PATH", help="Also write the measured results to PATH")
+    parser.add_argument("--measure", type=int, metavar="PAGES", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        print(json.dumps(measure(args.measure, args.repeat)))
+        return 0
+
+    results = {}
+    for pages in args.sizes:
+        print(f"… {pages} стр.", file=sys.stderr)
+        results[str(pages)] = _run_size(pages, args.repeat)
+
+    document = {
+        "machine": {"python": platform.python_version(), "platform": platform.platform()},
+        "repeat": args.repeat,
+        "sizes": results,
+    }
+    if args.json_out:
+        args.json_out.write_text(json.dumps(document, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    baseline = {}
+    if args.baseline.is_file():
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+
+    print(format_results(results, baseline))
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(document, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        print(f"✓ Baseline written: {args.baseline}")
+        return 0
+
+    if not baseline:
+        print(f"Baseline not found: {args.baseline} (run with --update-baseline)")
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance, args.rss_tolerance, args.min_delta_ms)
+    if regressions:
+        print("Regressions:")
+        for regression in regressions:
+            print(f"  - {regression}")
+        return 1
+
+    print("✓ No regressions against the baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
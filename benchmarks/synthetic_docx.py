@@ -0,0 +1,205 @@
+"""Synthetic explanatory-note .docx files for normocontrol benchmarks.
+
+`generate_docx(path, pages)` writes a document shaped like a student
+explanatory note: title page, abstract, contents, numbered chapters with
+many short runs per paragraph, tables and figures with captions, citations,
+conclusion, references and appendices. Formatting follows the IT checklist
+(page margins, Times New Roman 14 pt, 1.25 cm first-line indent, single
+spacing), so the checks walk the same code paths as on real documents.
+
+Page counts are nominal: about `PARAGRAPHS_PER_PAGE` body paragraphs of
+~500 characters per page, with a table or a figure every few pages.
+"""
+
+from __future__ import annotations
+
+import random
+import struct
+import zlib
+from io import BytesIO
+from pathlib import Path
+
+from docx import Document
+from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from docx.shared import Cm, Mm, Pt
+
+
+# Bump when the generated content changes (cached files are regenerated).
+GENERATOR_VERSION = 1
+
+PARAGRAPHS_PER_PAGE = 5
+PAGES_PER_CHAPTER = 10
+TABLE_EVERY_PAGES = 4
+FIGURE_EVERY_PAGES = 5
+REFERENCES = 20
+
+_WORDS = (
+    "система модуль данные запрос сервер клиент интерфейс приложение архитектура компонент "
+    "база таблица поле индекс транзакция сервис маршрут контроллер шаблон пользователь роль "
+    "доступ проверка отчёт документ параметр функция метод класс объект тестирование развёртывание"
+).split()
+
+
+def _png(width: int = 64, height: int = 48) -> bytes:
+    """Minimal grayscale PNG (python-docx reads the size from the IHDR chunk)."""
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF)
+
+    rows = b"".join(b"\x00" + bytes((x * 4) % 256 for x in range(width)) for _ in range(height))
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 0, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(rows))
+        + chunk(b"IEND", b"")
+    )
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    text = " ".join(rng.choice(_WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+def _body_paragraph(document, rng: random.Random, citation: int | None = None):
+    """A justified body paragraph made of many short runs (mixed emphasis, as Word splits runs)."""
+
+    paragraph = document.add_paragraph()
+    for index in range(12):
+        run = paragraph.add_run(_sentence(rng, 5) + " ")
+        run.bold = index % 7 == 3
+        run.italic = index % 5 == 2
+    if citation is not None:
+        paragraph.add_run(f"[{citation}].")
+    return paragraph
+
+
+def _heading(document, text: str, page_break: bool = False):
+    paragraph = document.add_paragraph(style="Heading 1")
+    if page_break:
+        paragraph.paragraph_format.page_break_before = True
+    paragraph.add_run(text)
+    return paragraph
+
+
+def _caption(document, text: str):
+    paragraph = document.add_paragraph()
+    paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    paragraph.paragraph_format.first_line_indent = Cm(0)
+    run = paragraph.add_run(text)
+    run.font.size = Pt(12)
+    return paragraph
+
+
+def _table(document, rng: random.Random, number: int) -> None:
+    caption = document.add_paragraph()
+    caption.paragraph_format.first_line_indent = Cm(0)
+    caption.add_run(f"Таблица {number} – {_sentence(rng, 4)[:-1]}").font.size = Pt(12)
+
+    table = document.add_table(rows=6, cols=4)
+    table.style = "Table Grid"
+    for row_index, row in enumerate(table.rows):
+        for cell in row.cells:
+            run = cell.paragraphs[0].add_run(rng.choice(_WORDS) if row_index else "Параметр")
+            run.font.size = Pt(12)
+
+
+def _figure(document, image: bytes, rng: random.Random, number: int) -> None:
+    paragraph = document.add_paragraph()
+    paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
+    paragraph.paragraph_format.first_line_indent = Cm(0)
+    paragraph.add_run().add_picture(BytesIO(image), width=Cm(12))
+    _caption(document, f"Рисунок {number} – {_sentence(rng, 4)[:-1]}")
+
+
+def _setup(document) -> None:
+    section = document.sections[0]
+    section.page_width, section.page_height = Mm(210), Mm(297)
+    section.left_margin, section.right_margin = Mm(23), Mm(10)
+    section.top_margin, section.bottom_margin = Mm(20), Mm(15)
+    # The title page is numbered but its number is not printed.
+    section.different_first_page_header_footer = True
+
+    normal = document.styles["Normal"]
+    normal.font.name = "Times New Roman"
+    normal.font.size = Pt(14)
+    normal.paragraph_format.first_line_indent = Cm(1.25)
+    normal.paragraph_format.line_spacing = 1.0
+    normal.paragraph_format.space_after = Pt(0)
+    normal.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.JUSTIFY
+
+    heading = document.styles["Heading 1"]
+    heading.font.name = "Times New Roman"
+    heading.font.size = Pt(14)
+    heading.font.bold = True
+
+    # Page number field in the header (as the checklist requires).
+    header = section.header.paragraphs[0]
+    header.alignment = WD_ALIGN_PARAGRAPH.RIGHT
+    field = OxmlElement("w:fldSimple")
+    field.set(qn("w:instr"), "PAGE")
+    header._p.append(field)
+
+
+def generate_docx(path: Path, pages: int, seed: int = 20) -> Path:
+    """Write a synthetic explanatory note of about `pages` pages to `path`."""
+
+    rng = random.Random(seed + pages)
+    image = _png()
+    document = Document()
+    _setup(document)
+
+    title = document.add_paragraph("Пояснительная записка к курсовой работе")
+    title.alignment = WD_ALIGN_PARAGRAPH.CENTER
+
+    _heading(document, "РЕФЕРАТ", page_break=True)
+    _body_paragraph(document, rng)
+    _heading(document, "ОГЛАВЛЕНИЕ", page_break=True)
+    chapters = max(1, pages // PAGES_PER_CHAPTER)
+    for chapter in range(1, chapters + 1):
+        document.add_paragraph(f"{chapter} Глава {chapter}\t{chapter * PAGES_PER_CHAPTER}")
+    _heading(document, "ВВЕДЕНИЕ", page_break=True)
+    _body_paragraph(document, rng, citation=1)
+
+    tables = figures = 0
+    body_pages = max(1, pages - 6)
+    pages_per_chapter = max(1, body_pages // chapters)
+    for page in range(body_pages):
+        if page % pages_per_chapter == 0 and page // pages_per_chapter < chapters:
+            chapter = page // pages_per_chapter + 1
+            _heading(document, f"{chapter} Глава {chapter}", page_break=True)
+        for index in range(PARAGRAPHS_PER_PAGE):
+            citation = rng.randint(1, REFERENCES) if index == 0 else None
+            _body_paragraph(document, rng, citation=citation)
+        if page % TABLE_EVERY_PAGES == 1:
+            tables += 1
+            document.add_paragraph(f"Данные приведены в таблице {tables}.")
+            _table(document, rng, tables)
+        if page % FIGURE_EVERY_PAGES == 2:
+            figures += 1
+            document.add_paragraph(f"Схема показана на рисунке {figures}.")
+            _figure(document, image, rng, figures)
+
+    _heading(document, "ЗАКЛЮЧЕНИЕ", page_break=True)
+    _body_paragraph(document, rng)
+    _heading(document, "СПИСОК ИСПОЛЬЗОВАННЫХ ИСТОЧНИКОВ", page_break=True)
+    for number in range(1, REFERENCES + 1):
+        document.add_paragraph(f"{number} Автор А. А. {_sentence(rng, 4)} – Минск, 2024. – 100 с.")
+    for letter in "АБ":
+        appendix = _heading(document, f"ПРИЛОЖЕНИЕ {letter}", page_break=True)
+        appendix.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        _body_paragraph(document, rng)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    document.save(path)
+    return path
+
+
+def synthetic_docx(data_dir: Path, pages: int) -> Path:
+    """Path of the cached synthetic document of a given size (generated on first use)."""
+
+    path = data_dir / f"synthetic_{pages}p_v{GENERATOR_VERSION}.docx"
+    if not path.is_file():
+        generate_docx(path, pages)
+    return path
@@ -3,7 +3,15 @@
 This script is intended as a lightweight alternative to running pytest.
 It validates a single .docx file using the hybrid approach:
 - OOXML (ZIP + XML) for strict page setup and low-level formatting checks
-- python-docx for high-level structure checks
+- paragraph text (python-docx compatible) for high-level structure checks
+
+The archive is opened and parsed once (`tests.helpers.parsed_docx.ParsedDocx`);
+all checks consume that shared model.
+
+Checks are evaluated against checklist profiles (`PROFILES`, `--standards`):
+each profile compiles a checklist markdown into a config once and may skip
+checks (e.g. the structure of a separate appendix document). Several
+profiles are evaluated in the same single scan of the document.
 
 Default target: tests/ПЗ.docx
 
@@ -14,13 +22,24 @@ Exit codes:
 
 from __future__ import annotations
 
+import hashlib
 import re
 import sys
+from array import array
+from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
+from typing import Callable
+
+from check_registry import CheckProfile, CheckRegistry, ProfileRun, config_groups, facts_visitors, run_profiles
+
 
-from docx import Document
+# Bump when check semantics change; cached results of other versions are ignored.
+CHECKER_VERSION = "10"
+
+# Checks and shared views of the IT short checklist, run in registration order.
+CHECKS = CheckRegistry()
 
 
 @dataclass(frozen=True)
@@ -49,26 +68,78 @@ class ItNormocontrolConfig:
     required_sections_in_order: list[str]
 
 
-def _read_text_file(path: Path) -> str:
-    """Read a UTF-8 text file."""
-
-    return path.read_text(encoding="utf-8")
-
-
 def _parse_float_ru(value: str) -> float:
     """Parse a float that may use a comma as decimal separator."""
 
     return float(value.strip().replace(",", "."))
 
 
+# In-process memo: resolved markdown path -> (mtime_ns, size, config).
+_config_memo: dict[Path, tuple[int, int, ItNormocontrolConfig]] = {}
+
+
+def _compiled_config_path(standards_md_path: Path) -> Path:
+    """Return path of the compiled (JSON) config artifact next to the markdown."""
+
+    return standards_md_path.with_name(f".{standards_md_path.stem}.compiled.json")
+
+
+def _read_compiled_config(compiled_path: Path) -> dict | None:
+    """Read the compiled config artifact, or None if it is missing/corrupt."""
+
+    import json
+
+    try:
+        data = json.loads(compiled_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(data, dict) or not isinstance(data.get("config"), dict):
+        return None
+    # An artifact compiled by another checker version may use a different parser.
+    return data if data.get("checker_version") == CHECKER_VERSION else None
+
+
+def _write_compiled_config(compiled_path: Path, data: dict) -> None:
+    """Write the compiled config artifact (best-effort: read-only checkouts are fine)."""
+
+    try:
+        _write_json_atomic(compiled_path, data)
+    except OSError:
+        pass
+
+
+def _write_json_atomic(path: Path, data: dict) -> None:
+    """Write JSON through a temp file unique to this call (threads of the check server share a pid)."""
+
+    import json
+    import os
+    import tempfile
+
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(json.dumps(data, ensure_ascii=False, indent=2))
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
 def load_it_normocontrol_config(standards_md_path: Path) -> ItNormocontrolConfig:
-    """Load IT normocontrol requirements from the markdown checklist.
+    """Load normocontrol requirements from a markdown checklist.
+
+    Every profile (`PROFILES`) takes its values from a checklist markdown; for
+    the IT profiles `standars_control_it_short.md` is the single source of truth.
+    Any markdown written in the same format is compiled by the same rules
+    (`_CONFIG_RULES`).
 
-    The repository contains multiple standards; for the IT profile we treat
-    `standars_control_it_short.md` as the single source of truth.
+    Parsing is paid once: the result is memoized in-process and compiled into
+    `.<markdown stem>.compiled.json` next to the markdown. Both are
+    invalidated by the markdown mtime/size, and the compiled artifact is
+    additionally validated by the markdown SHA-256.
 
     Args:
-        standards_md_path: Path to `standars_control_it_short.md`.
+        standards_md_path: Path to the checklist markdown (e.g. `standars_control_it_short.md`).
 
     Returns:
         Parsed configuration.
@@ -77,78 +148,136 @@ def load_it_normocontrol_config(standards_md_path: Path) -> ItNormocontrolConfig
         ValueError: If required values cannot be parsed.
     """
 
-    text = _read_text_file(standards_md_path)
-
-    # 1) Margins
-    # Example: "Поля (мм): левое 23, правое 10, верхнее 20, нижнее 15."
-    margins_match = re.search(
-        r"Поля\s*\(мм\)\s*:\s*левое\s*(\d+(?:[\.,]\d+)?)\s*,\s*"
-        r"правое\s*(\d+(?:[\.,]\d+)?)\s*,\s*"
-        r"верхнее\s*(\d+(?:[\.,]\d+)?)\s*,\s*"
-        r"нижнее\s*(\d+(?:[\.,]\d+)?)",
-        text,
-        flags=re.IGNORECASE,
-    )
-    if not margins_match:
-        raise ValueError("Не удалось распарсить поля страницы из чек-листа")
-
-    margins_left_mm = _parse_float_ru(margins_match.group(1))
-    margins_right_mm = _parse_float_ru(margins_match.group(2))
-    margins_top_mm = _parse_float_ru(margins_match.group(3))
-    margins_bottom_mm = _parse_float_ru(margins_match.group(4))
-
-    # 2) Font and line spacing
-    # Example: "Шрифт: Times New Roman 14 pt; межстрочный интервал 1.0."
-    font_match = re.search(
-        r"Шрифт\s*:\s*([A-Za-z ]+?)\s*(\d+(?:[\.,]\d+)?)\s*pt\s*;\s*"
-        r"межстрочный\s+интервал\s*(\d+(?:[\.,]\d+)?)",
-        text,
-        flags=re.IGNORECASE,
-    )
-    if not font_match:
-        raise ValueError("Не удалось распарсить шрифт/интервал из чек-листа")
-
-    main_font_name = font_match.group(1).strip()
-    main_font_size_pt = _parse_float_ru(font_match.group(2))
-    line_spacing_expected = _parse_float_ru(font_match.group(3))
-
-    # 3) Font size inside tables/captions/figures
-    # Example: "Внутри таблиц/подрисуночных подписей/на рисунках: 12 pt."
-    inline_objects_match = re.search(
-        r"Внутри\s+таблиц/подрисуночных\s+подписей/на\s+рисунках\s*:\s*"
-        r"(\d+(?:[\.,]\d+)?)\s*pt",
-        text,
-        flags=re.IGNORECASE,
-    )
-    if not inline_objects_match:
-        raise ValueError("Не удалось распарсить кегль для таблиц/подписей/рисунков")
-    inline_objects_font_size_pt = _parse_float_ru(inline_objects_match.group(1))
-
-    # 4) Paragraph first-line indent
-    # Example: "Абзац: 12,5 мм."
-    indent_match = re.search(
-        r"Абзац\s*:\s*(\d+(?:[\.,]\d+)?)\s*мм",
-        text,
-        flags=re.IGNORECASE,
-    )
-    if not indent_match:
-        raise ValueError("Не удалось распарсить абзацный отступ")
-    first_line_indent_mm = _parse_float_ru(indent_match.group(1))
-    first_line_indent_cm = first_line_indent_mm / 10.0
-
-    # 5) Required document structure order
-    # In the checklist it is provided as a numbered list.
-    structure_block = re.search(
-        r"##\s*2\)\s*Структура\s+пояснительной\s+записки(.*?)(?:\n##\s*3\)|\Z)",
-        text,
-        flags=re.IGNORECASE | re.DOTALL,
-    )
+    from dataclasses import asdict
+
+    md_path = standards_md_path.resolve()
+    stat = md_path.stat()
+
+    memo = _config_memo.get(md_path)
+    if memo and memo[:2] == (stat.st_mtime_ns, stat.st_size):
+        return memo[2]
+
+    compiled_path = _compiled_config_path(md_path)
+    compiled = _read_compiled_config(compiled_path)
+    config = None
+
+    if compiled and (compiled.get("mtime_ns"), compiled.get("size")) == (stat.st_mtime_ns, stat.st_size):
+        try:
+            config = ItNormocontrolConfig(**compiled["config"])
+        except TypeError:
+            config = None
+
+    if config is None:
+        raw = md_path.read_bytes()
+        source_sha256 = hashlib.sha256(raw).hexdigest()
+        if compiled and compiled.get("source_sha256") == source_sha256:
+            try:
+                config = ItNormocontrolConfig(**compiled["config"])
+            except TypeError:
+                config = None
+        if config is None:
+            config = _parse_it_normocontrol_config(raw.decode("utf-8"))
+        _write_compiled_config(
+            compiled_path,
+            {
+                "checker_version": CHECKER_VERSION,
+                "source_sha256": source_sha256,
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "config": asdict(config),
+            },
+        )
+
+    _config_memo[md_path] = (stat.st_mtime_ns, stat.st_size, config)
+    return config
+
+
+def _mm_to_cm(value: str) -> float:
+    """Parse a length in millimetres (comma decimal separator allowed) into centimetres."""
+
+    return _parse_float_ru(value) / 10.0
+
+
+@dataclass(frozen=True)
+class _ConfigRule:
+    """Declarative rule of the checklist markdown: a pattern and the config field of each of its groups."""
+
+    pattern: re.Pattern
+    fields: tuple[tuple[str, Callable[[str], object]], ...]
+    error: str
+
+
+_NUMBER = r"(\d+(?:[\.,]\d+)?)"
+
+# Values of a checklist markdown, compiled once per file (see `load_it_normocontrol_config`).
+_CONFIG_RULES = (
+    # "Поля (мм): левое 23, правое 10, верхнее 20, нижнее 15."
+    _ConfigRule(
+        re.compile(
+            rf"Поля\s*\(мм\)\s*:\s*левое\s*{_NUMBER}\s*,\s*правое\s*{_NUMBER}\s*,\s*"
+            rf"верхнее\s*{_NUMBER}\s*,\s*нижнее\s*{_NUMBER}",
+            re.IGNORECASE,
+        ),
+        (
+            ("margins_left_mm", _parse_float_ru),
+            ("margins_right_mm", _parse_float_ru),
+            ("margins_top_mm", _parse_float_ru),
+            ("margins_bottom_mm", _parse_float_ru),
+        ),
+        "Не удалось распарсить поля страницы из чек-листа",
+    ),
+    # "Шрифт: Times New Roman 14 pt; межстрочный интервал 1.0."
+    _ConfigRule(
+        re.compile(
+            rf"Шрифт\s*:\s*([A-Za-z ]+?)\s*{_NUMBER}\s*pt\s*;\s*межстрочный\s+интервал\s*{_NUMBER}",
+            re.IGNORECASE,
+        ),
+        (
+            ("main_font_name", str.strip),
+            ("main_font_size_pt", _parse_float_ru),
+            ("line_spacing_expected", _parse_float_ru),
+        ),
+        "Не удалось распарсить шрифт/интервал из чек-листа",
+    ),
+    # "Внутри таблиц/подрисуночных подписей/на рисунках: 12 pt."
+    _ConfigRule(
+        re.compile(rf"Внутри\s+таблиц/подрисуночных\s+подписей/на\s+рисунках\s*:\s*{_NUMBER}\s*pt", re.IGNORECASE),
+        (("inline_objects_font_size_pt", _parse_float_ru),),
+        "Не удалось распарсить кегль для таблиц/подписей/рисунков",
+    ),
+    # "Абзац: 12,5 мм."
+    _ConfigRule(
+        re.compile(rf"Абзац\s*:\s*{_NUMBER}\s*мм", re.IGNORECASE),
+        (("first_line_indent_cm", _mm_to_cm),),
+        "Не удалось распарсить абзацный отступ",
+    ),
+)
+
+_STRUCTURE_BLOCK_RE = re.compile(
+    r"##\s*2\)\s*Структура\s+пояснительной\s+записки(.*?)(?:\n##\s*3\)|\Z)", re.IGNORECASE | re.DOTALL
+)
+_STRUCTURE_ITEM_RE = re.compile(r"\s*\d+\)\s*(.+?)\s*$")
+
+
+def _parse_it_normocontrol_config(text: str) -> ItNormocontrolConfig:
+    """Parse the checklist markdown text into a config (see `load_it_normocontrol_config`)."""
+
+    values: dict[str, object] = {}
+    for rule in _CONFIG_RULES:
+        match = rule.pattern.search(text)
+        if not match:
+            raise ValueError(rule.error)
+        for group, (field_name, convert) in enumerate(rule.fields, start=1):
+            values[field_name] = convert(match.group(group))
+
+    # Required document structure order: a numbered list in its own block.
+    structure_block = _STRUCTURE_BLOCK_RE.search(text)
     if not structure_block:
         raise ValueError("Не удалось найти блок структуры документа")
 
     required_sections_in_order: list[str] = []
     for line in structure_block.group(1).splitlines():
-        item_match = re.match(r"\s*\d+\)\s*(.+?)\s*$", line)
+        item_match = _STRUCTURE_ITEM_RE.match(line)
         if item_match:
             required_sections_in_order.append(item_match.group(1).strip())
 
@@ -158,18 +287,10 @@ def load_it_normocontrol_config(standards_md_path: Path) -> ItNormocontrolConfig
     # Page size is implied by "Формат: A4".
     # Keep it explicit in config for checks.
     return ItNormocontrolConfig(
-        margins_left_mm=margins_left_mm,
-        margins_right_mm=margins_right_mm,
-        margins_top_mm=margins_top_mm,
-        margins_bottom_mm=margins_bottom_mm,
         page_width_mm=210,
         page_height_mm=297,
-        main_font_name=main_font_name,
-        main_font_size_pt=main_font_size_pt,
-        inline_objects_font_size_pt=inline_objects_font_size_pt,
-        first_line_indent_cm=first_line_indent_cm,
-        line_spacing_expected=line_spacing_expected,
         required_sections_in_order=required_sections_in_order,
+        **values,
     )
 
 
@@ -192,271 +313,731 @@ def _resolve_repo_root() -> Path:
     return Path(__file__).resolve().parents[2]
 
 
-def _extract_all_text(doc: Document) -> str:
-    """Extract joined plain text from a Word document."""
+@CHECKS.view("layout", needs=("styles",))
+def _layout_view(config: ItNormocontrolConfig, parsed, styles):
+    """Render-free page layout estimate (scanned before the checks)."""
 
-    return "\n".join(p.text for p in doc.paragraphs)
+    from tests.helpers.layout import LayoutEstimator, PageGeometry
 
+    geometry = PageGeometry.from_mm(
+        config.page_width_mm,
+        config.page_height_mm,
+        config.margins_left_mm,
+        config.margins_right_mm,
+        config.margins_top_mm,
+        config.margins_bottom_mm,
+    )
+    return LayoutEstimator(geometry, default_font_size_pt=config.main_font_size_pt, styles=styles)
 
-def _find_section_positions(text: str, section_titles: list[str]) -> dict[str, int]:
-    """Find first occurrence positions of section titles in text.
 
-    Returns:
-        A dict of title -> index in text (0-based). Missing titles are omitted.
-    """
+@CHECKS.view("index", needs=("styles", "layout"))
+def _index_view(config: ItNormocontrolConfig, parsed, styles, layout):
+    """Paragraph ordinals, enclosing headings and pages (issue locations)."""
 
-    lower_text = text.lower()
-    positions: dict[str, int] = {}
+    from tests.helpers.paragraph_index import ParagraphIndex
 
-    for title in section_titles:
-        index = lower_text.find(title.lower())
-        if index != -1:
-            positions[title] = index
+    return ParagraphIndex(styles, layout)
 
-    return positions
 
+@CHECKS.view("citations", needs=("xml", "index"))
+def _citations_view(config: ItNormocontrolConfig, parsed, index):
+    """Citation numbers → paragraphs and bibliography entries (reference checks)."""
 
-def _check_page_setup(doc_name: str, doc_xml, report, config: ItNormocontrolConfig) -> None:
-    """Check page size and margins using OOXML."""
+    from tests.helpers.reference_index import ReferenceIndex
 
-    from tests.helpers.ooxml_utils import (
-        get_page_margins,
-        get_page_size,
-        mm_to_twips,
-        twips_to_mm,
-    )
+    return ReferenceIndex(index)
 
-    margins = get_page_margins(doc_xml)
-    if not margins:
-        report.add_issue(
-            doc_name,
-            "page_setup",
-            "error",
-            "Поля страницы не найдены",
-            expected="Поля должны быть заданы",
-            actual="Поля отсутствуют",
-            location="Разметка страницы → Поля",
-        )
-    else:
-        expected = {
-            "left": config.margins_left_mm,
-            "right": config.margins_right_mm,
-            "top": config.margins_top_mm,
-            "bottom": config.margins_bottom_mm,
-        }
-        tolerance_mm = 1.5
-        tolerance_twips = mm_to_twips(tolerance_mm)
 
-        for key, expected_mm in expected.items():
-            if key not in margins:
-                report.add_issue(
-                    doc_name,
-                    "page_setup",
-                    "error",
-                    f"Поле '{key}' не задано",
-                    expected=f"{expected_mm} мм",
-                    actual="не задано",
-                    location="Разметка страницы → Поля",
-                )
-                continue
+@CHECKS.view("objects", needs=("xml", "index"))
+def _objects_view(config: ItNormocontrolConfig, parsed, index):
+    """Figures, tables, their captions and in-text mentions (caption checks)."""
 
-            actual_twips = margins[key]
-            expected_twips = mm_to_twips(expected_mm)
-            diff_twips = abs(actual_twips - expected_twips)
+    from tests.helpers.caption_index import CaptionIndex
 
-            if diff_twips > tolerance_twips:
-                report.add_issue(
-                    doc_name,
-                    "page_setup",
-                    "error",
-                    f"Некорректное поле '{key}'",
-                    expected=f"{expected_mm} мм",
-                    actual=f"{twips_to_mm(actual_twips):.1f} мм",
-                    location="Разметка страницы → Поля → Настраиваемые поля",
-                )
+    return CaptionIndex(index)
 
-    page_size = get_page_size(doc_xml)
-    if not page_size:
-        report.add_issue(
-            doc_name,
-            "page_setup",
-            "warning",
-            "Размер страницы не найден",
-            expected="A4 (210×297 мм)",
-            actual="не найден",
-        )
-    else:
-        a4_width_twips = mm_to_twips(config.page_width_mm)
-        a4_height_twips = mm_to_twips(config.page_height_mm)
-        tolerance = mm_to_twips(5)
 
-        width_diff = abs(page_size["width"] - a4_width_twips)
-        height_diff = abs(page_size["height"] - a4_height_twips)
+@CHECKS.view("sections", needs=("xml", "styles", "index"))
+def _sections_view(config: ItNormocontrolConfig, parsed, styles, index):
+    """Section heading candidates outside the table of contents (structure check)."""
+
+    from tests.helpers.section_index import SectionIndex
+
+    return SectionIndex(index, styles)
+
+
+@CHECKS.scanner("page_setup")
+class _PageSetupCheck:
+    """Check page size and margins of the last section (scanner visitor)."""
+
+    def __init__(self, config: ItNormocontrolConfig) -> None:
+        self.config = config
+        self.margins: dict[str, int] | None = None
+        self.page_size: dict | None = None
+
+    def visit_section(self, sect_pr) -> None:
+        """Remember page setup; the last w:sectPr holds the main page setup."""
+
+        from tests.helpers.ooxml_utils import parse_page_margins, parse_page_size
+
+        self.margins = parse_page_margins(sect_pr)
+        self.page_size = parse_page_size(sect_pr)
 
-        if width_diff > tolerance or height_diff > tolerance:
+    def report_issues(self, doc_name: str, report) -> None:
+        """Add collected page setup issues to the report."""
+
+        from tests.helpers.ooxml_utils import mm_to_twips, twips_to_mm
+
+        config = self.config
+        margins = self.margins
+        if not margins:
+            report.add_issue(
+                doc_name,
+                "page_setup",
+                "error",
+                "Поля страницы не найдены",
+                expected="Поля должны быть заданы",
+                actual="Поля отсутствуют",
+                location="Разметка страницы → Поля",
+            )
+        else:
+            expected = {
+                "left": config.margins_left_mm,
+                "right": config.margins_right_mm,
+                "top": config.margins_top_mm,
+                "bottom": config.margins_bottom_mm,
+            }
+            tolerance_mm = 1.5
+            tolerance_twips = mm_to_twips(tolerance_mm)
+
+            for key, expected_mm in expected.items():
+                if key not in margins:
+                    report.add_issue(
+                        doc_name,
+                        "page_setup",
+                        "error",
+                        f"Поле '{key}' не задано",
+                        expected=f"{expected_mm} мм",
+                        actual="не задано",
+                        location="Разметка страницы → Поля",
+                    )
+                    continue
+
+                actual_twips = margins[key]
+                expected_twips = mm_to_twips(expected_mm)
+                diff_twips = abs(actual_twips - expected_twips)
+
+                if diff_twips > tolerance_twips:
+                    report.add_issue(
+                        doc_name,
+                        "page_setup",
+                        "error",
+                        f"Некорректное поле '{key}'",
+                        expected=f"{expected_mm} мм",
+                        actual=f"{twips_to_mm(actual_twips):.1f} мм",
+                        location="Разметка страницы → Поля → Настраиваемые поля",
+                    )
+
+        page_size = self.page_size
+        if not page_size:
             report.add_issue(
                 doc_name,
                 "page_setup",
                 "warning",
-                "Размер страницы не соответствует A4",
-                expected="210×297 мм",
-                actual=f"{twips_to_mm(page_size['width']):.0f}×{twips_to_mm(page_size['height']):.0f} мм",
+                "Размер страницы не найден",
+                expected="A4 (210×297 мм)",
+                actual="не найден",
             )
+        else:
+            a4_width_twips = mm_to_twips(config.page_width_mm)
+            a4_height_twips = mm_to_twips(config.page_height_mm)
+            tolerance = mm_to_twips(5)
 
+            width_diff = abs(page_size["width"] - a4_width_twips)
+            height_diff = abs(page_size["height"] - a4_height_twips)
 
-def _check_paragraph_formatting(doc_name: str, doc_xml, report, config: ItNormocontrolConfig) -> None:
-    """Check indentation and line spacing using OOXML (best-effort)."""
+            if width_diff > tolerance or height_diff > tolerance:
+                report.add_issue(
+                    doc_name,
+                    "page_setup",
+                    "warning",
+                    "Размер страницы не соответствует A4",
+                    expected="210×297 мм",
+                    actual=f"{twips_to_mm(page_size['width']):.0f}×{twips_to_mm(page_size['height']):.0f} мм",
+                )
 
-    from tests.helpers.ooxml_utils import (
-        NS,
-        cm_to_twips,
-        get_paragraph_properties,
-        twips_to_cm,
-    )
 
-    paragraphs = doc_xml.xpath(".//w:p", namespaces=NS)
+@CHECKS.scanner("paragraphs", needs=("xml", "styles", "index"))
+class _ParagraphFormattingCheck:
+    """Check effective indentation and line spacing (styles included, best-effort, scanner visitor)."""
 
-    # Indent: 12.5 mm (1.25 cm)
-    expected_indent = cm_to_twips(config.first_line_indent_cm)
-    tolerance = cm_to_twips(0.1)  # 1mm
+    facts_name = "paragraphs"
+    max_locations = 3
 
-    invalid_indents: list[float] = []
-    for p in paragraphs:
-        props = get_paragraph_properties(p)
-        first_line_raw = props.get("ind", {}).get("firstLine")
-        if not first_line_raw:
-            continue
+    def __init__(self, config: ItNormocontrolConfig, styles, index) -> None:
+        from tests.helpers.ooxml_utils import cm_to_twips, twips_to_cm
 
-        try:
-            first_line = int(round(float(first_line_raw)))
-        except (TypeError, ValueError):
-            continue
+        self._paragraph_properties = styles.paragraph_properties
+        self._twips_to_cm = twips_to_cm
+        # Paragraph index visited before this check (`index.last` is the current paragraph).
+        self._index = index
 
-        if abs(first_line - expected_indent) > tolerance:
-            invalid_indents.append(twips_to_cm(first_line))
+        self.config = config
+        # Indent: 12.5 mm (1.25 cm)
+        self.expected_indent = cm_to_twips(config.first_line_indent_cm)
+        self.tolerance = cm_to_twips(0.1)  # 1mm
 
-    if invalid_indents:
-        examples = ", ".join(f"{cm:.2f} см" for cm in invalid_indents[:5])
-        report.add_issue(
-            doc_name,
-            "paragraphs",
-            "warning",
-            f"Найдены некорректные отступы первой строки ({len(invalid_indents)} шт.)",
-            expected=f"{config.first_line_indent_cm:.2f} см",
-            actual=examples,
-        )
+        self.invalid_indents: list[float] = []
+        self.invalid_indent_paragraphs: list[int] = []
+        self.paragraphs_with_spacing = 0
+        self.invalid_spacing = 0
 
-    # Line spacing: 1.0 usually corresponds to w:spacing line=240 with lineRule=auto
-    paragraphs_with_spacing = doc_xml.xpath(".//w:p[w:pPr/w:spacing]", namespaces=NS)
+    def paragraph_facts(self, paragraph) -> list:
+        """[first-line indent in twips, has spacing, auto line spacing value] of a paragraph."""
 
-    invalid_spacing = 0
-    for p in paragraphs_with_spacing:
-        props = get_paragraph_properties(p)
+        props = self._paragraph_properties(paragraph)
+
+        first_line = None
+        first_line_raw = props.get("ind", {}).get("firstLine")
+        if first_line_raw:
+            try:
+                first_line = int(round(float(first_line_raw)))
+            except (TypeError, ValueError):
+                first_line = None
+
+        # Line spacing: 1.0 usually corresponds to w:spacing line=240 with lineRule=auto
         spacing = props.get("spacing")
-        if not spacing:
-            continue
+        if spacing is None:
+            return [first_line, False, None]
 
+        line_val = None
         line = spacing.get("line")
-        line_rule = spacing.get("lineRule")
-        if not line or line_rule != "auto":
-            continue
+        if line and spacing.get("lineRule") == "auto":
+            try:
+                line_val = int(line)
+            except (TypeError, ValueError):
+                line_val = None
+        return [first_line, True, line_val]
 
-        try:
-            line_val = int(line)
-        except (TypeError, ValueError):
-            continue
+    def visit_paragraph_facts(self, paragraph, facts: list) -> None:
+        """Collect indent and spacing violations of a single paragraph."""
 
-        # 240 = single, 360 = 1.5, 480 = double
-        if not (220 <= line_val <= 260):
-            invalid_spacing += 1
+        first_line, has_spacing, line_val = facts
+        if first_line is not None and abs(first_line - self.expected_indent) > self.tolerance:
+            self.invalid_indents.append(self._twips_to_cm(first_line))
+            self.invalid_indent_paragraphs.append(self._index.last)
 
-    if paragraphs_with_spacing:
-        ratio = invalid_spacing / len(paragraphs_with_spacing)
-        if ratio > 0.8:
+        if not has_spacing:
+            return
+        self.paragraphs_with_spacing += 1
+
+        # 240 = single, 360 = 1.5, 480 = double
+        if line_val is not None and not (220 <= line_val <= 260):
+            self.invalid_spacing += 1
+
+    def report_issues(self, doc_name: str, report) -> None:
+        """Add collected paragraph formatting issues to the report."""
+
+        if self.invalid_indents:
+            examples = ", ".join(f"{cm:.2f} см" for cm in self.invalid_indents[:5])
+            paragraphs = self.invalid_indent_paragraphs
+            location = "; ".join(self._index.location(ordinal) for ordinal in paragraphs[: self.max_locations])
+            if len(paragraphs) > self.max_locations:
+                location += f" (и ещё {len(paragraphs) - self.max_locations})"
             report.add_issue(
                 doc_name,
                 "paragraphs",
                 "warning",
-                "Много параграфов с явно заданным некорректным интервалом",
-                expected="1.0 (одинарный)",
-                actual=f"{invalid_spacing} из {len(paragraphs_with_spacing)}",
+                f"Найдены некорректные отступы первой строки ({len(self.invalid_indents)} шт.)",
+                expected=f"{self.config.first_line_indent_cm:.2f} см",
+                actual=examples,
+                location=location,
             )
 
+        if self.paragraphs_with_spacing:
+            ratio = self.invalid_spacing / self.paragraphs_with_spacing
+            if ratio > 0.8:
+                report.add_issue(
+                    doc_name,
+                    "paragraphs",
+                    "warning",
+                    "Много параграфов с некорректным межстрочным интервалом (с учётом стилей)",
+                    expected="1.0 (одинарный)",
+                    actual=f"{self.invalid_spacing} из {self.paragraphs_with_spacing}",
+                )
 
-def _check_fonts(doc_name: str, doc_xml, report, config: ItNormocontrolConfig) -> None:
-    """Check that explicit font settings use Times New Roman and sizes 14/12pt."""
-
-    from tests.helpers.ooxml_utils import (
-        NS,
-        get_run_properties,
-        pt_to_half_points,
-    )
 
-    runs = doc_xml.xpath(".//w:r", namespaces=NS)
-    fonts_used: set[str] = set()
-    sizes: list[int] = []
+@CHECKS.scanner("fonts", needs=("xml", "styles", "index"))
+class _FontsCheck:
+    """Check that effective run fonts are Times New Roman and sizes 14/12pt (scanner visitor).
 
-    for run in runs[:250]:
-        props = get_run_properties(run)
+    Every text run of the document is recorded into compact columns (size in
+    half-points, font id, paragraph ordinal); ratios and clusters of
+    non-standard sizes are computed from those columns after the scan.
+    """
 
-        r_fonts = props.get("rFonts")
-        if r_fonts:
-            for key in ("ascii", "hAnsi", "cs"):
-                font_name = r_fonts.get(key)
+    facts_name = "fonts"
+    # Non-standard runs at most this many paragraphs apart belong to one cluster.
+    cluster_gap_paragraphs = 3
+    min_cluster_runs = 5
+    max_clusters_reported = 5
+
+    def __init__(self, config: ItNormocontrolConfig, styles, index) -> None:
+        from tests.helpers.ooxml_utils import NS, pt_to_half_points
+
+        self._run_properties = styles.run_properties
+        self._run_tag = f"{{{NS['w']}}}r"
+        self._text_tag = f"{{{NS['w']}}}t"
+        # Paragraph ordinals, sections and pages come from the paragraph index.
+        self._index = index
+
+        self.config = config
+        self.allowed_sizes = {
+            pt_to_half_points(config.main_font_size_pt),
+            pt_to_half_points(config.inline_objects_font_size_pt),
+        }
+        self.fonts_used: set[str] = set()
+        self.font_ids: dict[str, int] = {}
+
+        # One entry per text run; size 0 = unknown.
+        self.run_sizes = array("H")
+        self.run_fonts = array("H")
+        self.run_paragraphs = array("I")
+
+    def paragraph_facts(self, paragraph) -> list:
+        """[size in half-points, ascii, hAnsi, cs font] of every text run of a paragraph.
+
+        Runs of paragraphs nested in text boxes are not included: the scanner
+        has already visited and dropped those paragraphs.
+        """
+
+        runs = []
+        for run in paragraph.iter(self._run_tag):
+            if run.find(self._text_tag) is None:
+                continue  # field codes, drawings, breaks
+            props = self._run_properties(run)
+            r_fonts = props.get("rFonts") or {}
+            runs.append([props.get("sz", 0), r_fonts.get("ascii"), r_fonts.get("hAnsi"), r_fonts.get("cs")])
+        return runs
+
+    def visit_paragraph_facts(self, paragraph, runs: list) -> None:
+        """Record effective font and size of the text runs of a paragraph."""
+
+        ordinal = self._index.last
+        for size, ascii_font, h_ansi_font, cs_font in runs:
+            font_id = 0
+            for font_name in (ascii_font, h_ansi_font, cs_font):
                 if font_name:
-                    fonts_used.add(font_name)
+                    self.fonts_used.add(font_name)
+            main_font = h_ansi_font or ascii_font
+            if main_font:
+                font_id = self.font_ids.setdefault(main_font, len(self.font_ids) + 1)
+
+            self.run_sizes.append(size if 0 < size < 65536 else 0)
+            self.run_fonts.append(font_id)
+            self.run_paragraphs.append(ordinal)
+
+    def _nonstandard_clusters(self, nonstandard: list[int]) -> list[tuple[int, int, Counter]]:
+        """Group non-standard run indices into (first paragraph, last paragraph, sizes) clusters."""
+
+        clusters = []
+        run_paragraphs = self.run_paragraphs
+        run_sizes = self.run_sizes
+        for index in nonstandard:
+            paragraph = run_paragraphs[index]
+            if clusters and paragraph - clusters[-1][1] <= self.cluster_gap_paragraphs:
+                clusters[-1][1] = paragraph
+                clusters[-1][2][run_sizes[index]] += 1
+            else:
+                clusters.append([paragraph, paragraph, Counter({run_sizes[index]: 1})])
+        return [tuple(cluster) for cluster in clusters if sum(cluster[2].values()) >= self.min_cluster_runs]
+
+    def _describe_clusters(self, clusters: list[tuple[int, int, Counter]]) -> str:
+        """Human-readable paragraph/page ranges of the largest clusters (in document order)."""
+
+        from tests.helpers.ooxml_utils import half_points_to_pt
+
+        largest = sorted(clusters, key=lambda cluster: -sum(cluster[2].values()))[: self.max_clusters_reported]
+        parts = []
+        for first, last, sizes in sorted(largest):
+            size_list = ", ".join(f"{half_points_to_pt(size):g}pt" for size, _ in sizes.most_common(3))
+            parts.append(
+                f"{self._index.range_location(first, last)}: {sum(sizes.values())} runs, {size_list}"
+            )
+        return "; ".join(parts)
+
+    def report_issues(self, doc_name: str, report) -> None:
+        """Add collected font issues to the report."""
 
-        if "sz" in props:
-            sizes.append(int(props["sz"]))
+        from tests.helpers.ooxml_utils import half_points_to_pt
 
-    if fonts_used and config.main_font_name not in fonts_used:
+        config = self.config
+        fonts_used = self.fonts_used
+
+        if fonts_used and config.main_font_name not in fonts_used:
+            names = {font_id: name for name, font_id in self.font_ids.items()}
+            by_frequency = [names[font_id] for font_id, _ in Counter(self.run_fonts).most_common() if font_id]
+            other = sorted(fonts_used - set(by_frequency))
+            report.add_issue(
+                doc_name,
+                "fonts",
+                "error",
+                "Times New Roman не найден среди шрифтов текста (с учётом стилей)",
+                expected=config.main_font_name,
+                actual=", ".join(by_frequency + other)[:200],
+            )
+
+        histogram = Counter(self.run_sizes)
+        histogram.pop(0, None)
+        sized_runs = sum(histogram.values())
+        if not sized_runs:
+            return
+
+        allowed = self.allowed_sizes
+        nonstandard_count = sum(count for size, count in histogram.items() if size not in allowed)
+        if not nonstandard_count:
+            return
+
+        nonstandard = [i for i, size in enumerate(self.run_sizes) if size and size not in allowed]
+        clusters = self._nonstandard_clusters(nonstandard)
+        sizes_summary = ", ".join(
+            f"{half_points_to_pt(size):g}pt × {count}"
+            for size, count in histogram.most_common()
+            if size not in allowed
+        )
+        expected = (
+            f"{int(config.main_font_size_pt)}pt (основной) или "
+            f"{int(config.inline_objects_font_size_pt)}pt (таблицы/подписи/рисунки)"
+        )
+
+        if nonstandard_count / sized_runs > 0.5:
+            report.add_issue(
+                doc_name,
+                "fonts",
+                "warning",
+                "Много runs с нестандартным размером шрифта (с учётом стилей)",
+                expected=expected,
+                actual=f"{nonstandard_count} из {sized_runs} ({sizes_summary[:200]})",
+                location=self._describe_clusters(clusters),
+            )
+        elif clusters:
+            report.add_issue(
+                doc_name,
+                "fonts",
+                "info",
+                "Фрагменты текста с нестандартным размером шрифта",
+                expected=expected,
+                actual=f"{nonstandard_count} из {sized_runs} ({sizes_summary[:200]})",
+                location=self._describe_clusters(clusters),
+            )
+
+
+@CHECKS.scanner("table_fonts", needs=("xml", "styles", "objects", "citations", "index"))
+class _TableFontsCheck:
+    """Check that the text in table cells has the inline objects size, 12pt (scanner visitor).
+
+    Effective sizes of the text runs of cell paragraphs (`w:tbl/w:tr/w:tc`)
+    are added to counters of the top-level table holding them (as found by
+    the objects view): runs with a known size, runs of the table size and a
+    histogram of the other sizes. Memory grows with the number of tables, not cells.
+    """
+
+    facts_name = "table_fonts"
+    max_tables_reported = 5
+
+    def __init__(self, config: ItNormocontrolConfig, styles, objects, citations, index) -> None:
+        from tests.helpers.ooxml_utils import NS, pt_to_half_points
+
+        self._run_properties = styles.run_properties
+        self._run_tag = f"{{{NS['w']}}}r"
+        self._text_tag = f"{{{NS['w']}}}t"
+        self._cell_tag = f"{{{NS['w']}}}tc"
+        self._objects = objects
+        self._citations = citations
+        self._index = index
+
+        self.config = config
+        self.table_size = pt_to_half_points(config.inline_objects_font_size_pt)
+
+        # One entry per table with text: index in `objects.objects`, sized runs, table-size runs.
+        self.tables = array("I")
+        self.table_runs = array("I")
+        self.table_matching = array("I")
+        # Table entry → histogram of its other sizes (only tables that have them).
+        self.other_sizes: dict[int, Counter] = {}
+        self._entries: dict[int, int] = {}
+
+    def paragraph_facts(self, paragraph) -> list | None:
+        """Sizes in half-points of the text runs of a table cell paragraph, None outside cells."""
+
+        parent = paragraph.getparent()
+        if parent is None or parent.tag != self._cell_tag:
+            return None
+        return [
+            self._run_properties(run).get("sz", 0)
+            for run in paragraph.iter(self._run_tag)
+            if run.find(self._text_tag) is not None
+        ]
+
+    def visit_paragraph_facts(self, paragraph, sizes: list | None) -> None:
+        """Add the run sizes of a cell paragraph to the counters of its table."""
+
+        table = self._objects.current_table
+        if not sizes or table is None:
+            return
+        entry = self._entries.get(table)
+        if entry is None:
+            entry = self._entries[table] = len(self.tables)
+            self.tables.append(table)
+            self.table_runs.append(0)
+            self.table_matching.append(0)
+
+        for size in sizes:
+            if not size:
+                continue
+            self.table_runs[entry] += 1
+            if size == self.table_size:
+                self.table_matching[entry] += 1
+            else:
+                self.other_sizes.setdefault(entry, Counter())[size] += 1
+
+    def _table_label(self, table: int) -> str:
+        """«таблица K» (K-th table of the document) plus its caption number, if any."""
+
+        from tests.helpers.caption_index import TABLE
+
+        objects = self._objects.objects
+        ordinal = sum(1 for obj in objects[: table + 1] if obj.kind == TABLE)
+        caption = objects[table].caption
+        if caption is None:
+            return f"таблица {ordinal} (без подписи)"
+        return f"таблица {ordinal} («Таблица {self._objects.captions[caption].number}»)"
+
+    def report_issues(self, doc_name: str, report) -> None:
+        """Report tables of the main part whose runs mostly have another size than the table size."""
+
+        from tests.helpers.ooxml_utils import half_points_to_pt
+
+        objects = self._objects.objects
+        sources = self._citations.sources_heading
+        checked = 0
+        violations = []
+        for entry, table in enumerate(self.tables):
+            obj = objects[table]
+            # Title page and the sheets after the list of sources are not checked (see the captions check).
+            if obj.heading < 0 or (sources is not None and obj.ordinal >= sources):
+                continue
+            checked += 1
+            other = self.table_runs[entry] - self.table_matching[entry]
+            if other * 2 > self.table_runs[entry]:
+                violations.append(entry)
+        if not violations:
+            return
+
+        parts = []
+        for entry in violations[: self.max_tables_reported]:
+            sizes = ", ".join(
+                f"{half_points_to_pt(size):g}pt × {count}" for size, count in self.other_sizes[entry].most_common(3)
+            )
+            parts.append(f"{self._table_label(self.tables[entry])}: {sizes} из {self.table_runs[entry]} runs")
+        if len(violations) > self.max_tables_reported:
+            parts.append("…")
+        table_size = f"{self.config.inline_objects_font_size_pt:g}pt"
         report.add_issue(
             doc_name,
-            "fonts",
-            "error",
-            "Times New Roman не найден среди явно заданных шрифтов",
-            expected=config.main_font_name,
-            actual=", ".join(sorted(fonts_used))[:200],
+            "tables",
+            "warning",
+            f"Размер шрифта в таблицах отличается от {table_size} (с учётом стилей)",
+            expected=f"{table_size} (текст таблиц)",
+            actual=f"таблиц: {len(violations)} из {checked}; " + "; ".join(parts),
+            location=self._index.location(objects[self.tables[violations[0]]].ordinal),
         )
 
-    if sizes:
-        size_main = pt_to_half_points(config.main_font_size_pt)
-        size_table = pt_to_half_points(config.inline_objects_font_size_pt)
 
-        allowed = {size_main, size_table}
-        nonstandard = [s for s in sizes if s not in allowed]
-        ratio = len(nonstandard) / len(sizes)
+# Unnumbered structural headings that are expected to start on a new page.
+_NEW_PAGE_HEADINGS = (
+    "реферат",
+    "оглавление",
+    "содержание",
+    "введение",
+    "заключение",
+    "список использованных источников",
+)
+_APPENDIX_HEADING_RE = re.compile(r"^приложение\s+[а-яa-z]$", re.IGNORECASE)
+
 
-        if ratio > 0.5:
+@CHECKS.scanner("page_layout", needs=("xml", "layout", "headers"))
+class _PageLayoutCheck:
+    """Page-aware checks on top of the render-free layout estimate (scanner visitor).
+
+    - the title page (first page of the first section) does not print a page number;
+    - page numbering is continuous across sections (`w:pgNumType w:start`);
+    - appendices and unnumbered structural sections start on a new page.
+
+    `layout` must be visited before this check in the same scan.
+    """
+
+    facts_name = "page_layout"
+
+    def __init__(self, config: ItNormocontrolConfig, layout, headers) -> None:
+        from tests.helpers.ooxml_utils import NS, get_paragraph_text
+
+        self._get_paragraph_text = get_paragraph_text
+        self._ns = NS
+        self._body_tag = f"{{{NS['w']}}}body"
+        self._ppr_tag = f"{{{NS['w']}}}pPr"
+
+        # The document, for header/footer parts and relationships.
+        self.parsed = headers
+        self.layout = layout
+
+        # (estimated first page, w:sectPr) per section in document order.
+        self.sections: list[tuple[int, object]] = []
+        self._section_start_page: int | None = None
+        self._section_ended = False
+        self.headings_not_on_new_page: list[str] = []
+        self.appendices_not_on_new_page: list[str] = []
+        self._seen_headings: set[str] = set()
+
+    def visit_section(self, sect_pr) -> None:
+        """Remember section properties together with the section's first page."""
+
+        parent = sect_pr.getparent()
+        if parent is None or parent.tag not in (self._body_tag, self._ppr_tag):
+            return  # e.g. w:sectPrChange revision marks
+        start_page = self._section_start_page or self.layout.page
+        self.sections.append((start_page, sect_pr))
+        # A paragraph-level w:sectPr ends with its paragraph, which is visited next.
+        self._section_ended = True
+
+    def paragraph_facts(self, paragraph) -> str | None:
+        """Text of a short body-level paragraph (a heading candidate), else None."""
+
+        parent = paragraph.getparent()
+        if parent is None or parent.tag != self._body_tag:
+            return None
+        text = self._get_paragraph_text(paragraph).strip()
+        if not text or len(text) > 40:
+            return None
+        return text
+
+    def visit_paragraph_facts(self, paragraph, text: str | None) -> None:
+        """Track section start pages and check headings that must start a page."""
+
+        if self._section_start_page is None:
+            self._section_start_page = self.layout.last_page
+        if self._section_ended:
+            self._section_start_page = None
+            self._section_ended = False
+
+        if text is None:
+            return
+
+        key = text.lower()
+        if _APPENDIX_HEADING_RE.match(text):
+            if key not in self._seen_headings and not self.layout.last_at_page_top:
+                self.appendices_not_on_new_page.append(text)
+        elif key in _NEW_PAGE_HEADINGS:
+            if key not in self._seen_headings and not self.layout.last_at_page_top:
+                self.headings_not_on_new_page.append(text)
+        self._seen_headings.add(key)
+
+    def _header_footer_parts(self, sect_pr, reference_type: str) -> list[str]:
+        """Part names of the header/footer of the given type referenced by a section."""
+
+        rels = self.parsed.relationships
+        parts = []
+        for tag in ("w:headerReference", "w:footerReference"):
+            for ref in sect_pr.findall(tag, namespaces=self._ns):
+                if ref.get(f"{{{self._ns['w']}}}type", "default") != reference_type:
+                    continue
+                part = rels.get(ref.get(f"{{{self._ns['r']}}}id"))
+                if part and self.parsed.has_part(part):
+                    parts.append(part)
+        return parts
+
+    def _on_off(self, element) -> bool:
+        if element is None:
+            return False
+        return element.get(f"{{{self._ns['w']}}}val", "true") not in ("0", "false", "off")
+
+    def report_issues(self, doc_name: str, report) -> None:
+        """Add collected page layout issues to the report."""
+
+        if self.sections:
+            self._report_title_page(doc_name, report)
+            self._report_numbering_restarts(doc_name, report)
+
+        if self.appendices_not_on_new_page:
             report.add_issue(
                 doc_name,
-                "fonts",
+                "structure",
                 "warning",
-                "Много runs с нестандартным явно заданным размером шрифта",
-                expected=(
-                    f"{int(config.main_font_size_pt)}pt (основной) или "
-                    f"{int(config.inline_objects_font_size_pt)}pt (таблицы/подписи/рисунки)"
-                ),
-                actual=f"{len(nonstandard)} из {len(sizes)} (пример: {nonstandard[:5]})",
+                "Приложения начинаются не с новой страницы (оценка без рендеринга)",
+                expected="Каждое приложение — с новой страницы",
+                actual=", ".join(self.appendices_not_on_new_page[:5]),
             )
 
+        if self.headings_not_on_new_page:
+            report.add_issue(
+                doc_name,
+                "structure",
+                "info",
+                "Структурные разделы начинаются не с новой страницы (оценка без рендеринга)",
+                expected="Раздел с новой страницы",
+                actual=", ".join(self.headings_not_on_new_page[:5]),
+            )
 
-def _check_page_numbering(docx_path: Path, doc_name: str, report) -> None:
-    """Check presence of PAGE field in any header XML (best-effort, no render)."""
+    def _report_title_page(self, doc_name: str, report) -> None:
+        _, first_sect_pr = self.sections[0]
+        title_pg = self._on_off(first_sect_pr.find("w:titlePg", namespaces=self._ns))
+        parts = self._header_footer_parts(first_sect_pr, "first" if title_pg else "default")
+        if any(b"PAGE" in self.parsed.read_part(part).upper() for part in parts):
+            report.add_issue(
+                doc_name,
+                "pagination",
+                "warning",
+                "Номер страницы печатается на титульном листе",
+                expected="Титульный лист входит в нумерацию, но номер на нем не печатается",
+                actual="поле PAGE в колонтитуле первой страницы",
+                location="Колонтитулы → Особый колонтитул для первой страницы",
+            )
 
-    import zipfile
+    def _report_numbering_restarts(self, doc_name: str, report) -> None:
+        mismatches = []
+        for index, (start_page, sect_pr) in enumerate(self.sections):
+            pg_num_type = sect_pr.find("w:pgNumType", namespaces=self._ns)
+            start = pg_num_type.get(f"{{{self._ns['w']}}}start") if pg_num_type is not None else None
+            if start is None:
+                continue
+            try:
+                start_number = int(start)
+            except ValueError:
+                continue
+            expected_number = 1 if index == 0 else start_page
+            if start_number != expected_number:
+                mismatches.append(f"раздел {index + 1}: с {start_number} (≈ стр. {expected_number})")
 
-    has_page_field = False
+        if mismatches:
+            report.add_issue(
+                doc_name,
+                "pagination",
+                "warning",
+                "Нумерация страниц не сквозная: раздел начинает нумерацию заново",
+                expected="Сквозная нумерация, титульный лист — страница 1",
+                actual="; ".join(mismatches[:5]),
+                location="Вставка → Номер страницы → Формат номеров страниц",
+            )
 
-    with zipfile.ZipFile(docx_path, "r") as archive:
-        header_files = [name for name in archive.namelist() if name.startswith("word/header") and name.endswith(".xml")]
-        for header in header_files:
-            content = archive.read(header)
-            # A robust XML parse is possible, but this heuristic is enough for a quick check.
-            # PAGE field usually appears as instrText containing 'PAGE'.
-            if b"PAGE" in content.upper():
-                has_page_field = True
-                break
+
+@CHECKS.check("page_numbering", needs=("headers",))
+def _check_page_numbering(doc_name: str, parsed, report) -> None:
+    """Check presence of PAGE field in any header XML (best-effort, no render)."""
+
+    header_files = parsed.headers
+    # A robust XML parse is possible, but this heuristic is enough for a quick check.
+    # PAGE field usually appears as instrText containing 'PAGE'.
+    has_page_field = any(b"PAGE" in content.upper() for content in header_files.values())
 
     if not header_files:
         report.add_issue(
@@ -478,12 +1059,16 @@ def _check_page_numbering(docx_path: Path, doc_name: str, report) -> None:
         )
 
 
-def _check_structure(doc_name: str, doc: Document, report) -> None:
-    """Check required sections and their order using plain text search.
+@CHECKS.check("structure", needs=("sections", "index"))
+def _check_structure(doc_name: str, parsed, report, sections, index) -> None:
+    """Check required sections and their order by the section headings found in the scan.
 
-    The exact list/order is sourced from the IT checklist markdown.
+    The exact list/order is sourced from the IT checklist markdown; sections
+    marked «(при необходимости)» are not required, but their order is checked.
     """
 
+    from tests.helpers.section_index import is_optional_title
+
     required_in_order = list(getattr(report, "_required_sections_in_order", []))
     if not required_in_order:
         # Fallback: keep previous behavior if config wiring is missing.
@@ -497,10 +1082,9 @@ def _check_structure(doc_name: str, doc: Document, report) -> None:
             "Приложения",
         ]
 
-    text = _extract_all_text(doc)
-    positions = _find_section_positions(text, required_in_order)
+    positions = sections.find_sections(required_in_order)
 
-    missing = [title for title in required_in_order if title not in positions]
+    missing = [title for title in required_in_order if title not in positions and not is_optional_title(title)]
     if missing:
         report.add_issue(
             doc_name,
@@ -512,26 +1096,28 @@ def _check_structure(doc_name: str, doc: Document, report) -> None:
         )
         return
 
-    ordered_titles = sorted(positions.items(), key=lambda item: item[1])
-    ordered_names = [name for name, _ in ordered_titles]
-    if ordered_names != required_in_order:
+    ordered_names = sorted(positions, key=positions.get)
+    expected_names = [title for title in required_in_order if title in positions]
+    if ordered_names != expected_names:
+        misplaced = next(name for name, expected in zip(ordered_names, expected_names) if name != expected)
         report.add_issue(
             doc_name,
             "structure",
             "warning",
             "Порядок разделов отличается от рекомендуемого",
-            expected=" → ".join(required_in_order),
+            expected=" → ".join(expected_names),
             actual=" → ".join(ordered_names),
+            location=index.location(positions[misplaced]),
         )
 
 
-def _check_references(doc_name: str, doc: Document, report) -> None:
-    """Check that bracketed references exist and sources section looks numbered."""
+@CHECKS.check("references", needs=("citations", "index"))
+def _check_references(doc_name: str, parsed, report, citations, index) -> None:
+    """Check citations against the list of sources (built during the document scan)."""
 
-    text = _extract_all_text(doc)
+    from tests.helpers.reference_index import format_number_ranges
 
-    citations = re.findall(r"\[(\d+)\]", text)
-    if not citations:
+    if not citations.citations:
         report.add_issue(
             doc_name,
             "references",
@@ -542,17 +1128,7 @@ def _check_references(doc_name: str, doc: Document, report) -> None:
         )
         return
 
-    max_citation = max(int(n) for n in citations)
-
-    # Heuristic: find the sources section and count numbered lines after it.
-    lower_lines = [p.text.strip() for p in doc.paragraphs if p.text.strip()]
-    sources_index = None
-    for i, line in enumerate(lower_lines):
-        if line.lower() == "список использованных источников":
-            sources_index = i
-            break
-
-    if sources_index is None:
+    if citations.sources_heading is None:
         report.add_issue(
             doc_name,
             "references",
@@ -563,10 +1139,7 @@ def _check_references(doc_name: str, doc: Document, report) -> None:
         )
         return
 
-    sources_lines = lower_lines[sources_index + 1 : sources_index + 80]
-    numbered = [line for line in sources_lines if re.match(r"^\d+\s+", line)]
-
-    if not numbered:
+    if not citations.entries:
         report.add_issue(
             doc_name,
             "references",
@@ -574,104 +1147,529 @@ def _check_references(doc_name: str, doc: Document, report) -> None:
             "В разделе источников не найдены строки, начинающиеся с номера",
             expected="Нумерация арабскими цифрами без точки (например: 1 ...)",
             actual="не найдено",
+            location=index.location(citations.sources_heading),
         )
         return
 
-    if max_citation > len(numbered):
+    if citations.dotted_entries:
+        first = citations.dotted_entries[0]
         report.add_issue(
             doc_name,
             "references",
             "warning",
-            "Максимальный номер ссылки больше числа найденных источников",
-            expected=f"Источников ≥ {max_citation}",
-            actual=f"Найдено источников (эвристика): {len(numbered)}",
+            "Номера источников записаны с точкой",
+            expected="Нумерация арабскими цифрами без точки (например: 1 ...)",
+            actual=f"{len(citations.dotted_entries)} из {len(citations.entries)}: «{citations.entries[first]}»",
+            location=index.location(citations.entry_ordinals[first]),
         )
 
+    dangling = citations.dangling_citations()
+    if dangling:
+        report.add_issue(
+            doc_name,
+            "references",
+            "warning",
+            "Есть ссылки на источники, отсутствующие в списке",
+            expected=f"Номера ссылок из списка источников (1–{max(citations.entries)})",
+            actual=f"[{format_number_ranges(dangling)}]",
+            location=index.location(citations.citations[dangling[0]][0]),
+        )
 
-def _check_captions(doc_name: str, doc: Document, report) -> None:
-    """Check basic caption formats for figures and tables (best-effort)."""
-
-    figure_re = re.compile(r"^рисунок\s+\d+(?:\.\d+)?\s*[—–-]\s+.+$", re.IGNORECASE)
-    table_re = re.compile(r"^таблица\s+\d+(?:\.\d+)?\s*[—–-]\s+.+$", re.IGNORECASE)
-
-    bad_figures = 0
-    bad_tables = 0
-
-    for p in doc.paragraphs:
-        line = p.text.strip()
-        if not line:
-            continue
-
-        if line.lower().startswith("рисунок"):
-            if not figure_re.match(line) or line.endswith("."):
-                bad_figures += 1
-
-        if line.lower().startswith("таблица"):
-            if not table_re.match(line) or line.endswith("."):
-                bad_tables += 1
-
-    if bad_figures:
+    unused = citations.unused_sources()
+    if unused:
         report.add_issue(
             doc_name,
-            "figures",
+            "references",
             "warning",
-            "Найдены подписи рисунков с нарушением формата",
-            expected="Рисунок N – Название (без точки в конце)",
-            actual=f"проблемных подписей: {bad_figures}",
+            "Есть источники без ссылок в тексте",
+            expected="Ссылка в тексте на каждый источник списка",
+            actual=f"Источники {format_number_ranges(unused)} (всего {len(citations.entries)})",
+            location=index.location(citations.entry_ordinals[unused[0]]),
         )
 
-    if bad_tables:
+    violations = citations.order_violations()
+    if violations:
+        number, highest = violations[0]
+        more = f" (и ещё {len(violations) - 1})" if len(violations) > 1 else ""
         report.add_issue(
             doc_name,
-            "tables",
+            "references",
             "warning",
-            "Найдены названия таблиц с нарушением формата",
-            expected="Таблица N – Название (без точки в конце)",
-            actual=f"проблемных названий: {bad_tables}",
+            "Источники пронумерованы не в порядке появления ссылок",
+            expected="Номера источников — по порядку первых ссылок в тексте",
+            actual=f"[{number}] впервые упомянут после [{highest}]{more}",
+            location=index.location(citations.citations[number][0]),
         )
 
 
-def check_it_docx(docx_path: Path, report_dir: Path) -> int:
-    """Run IT short checklist checks and write a markdown report.
+# Wording of the figure and table caption issues.
+_CAPTION_KINDS = (
+    {
+        "kind": "figure",
+        "category": "figures",
+        "title": "Рисунок",
+        "plural": "рисунков",
+        "format_issue": "Найдены подписи рисунков с нарушением формата",
+        "format_noun": "подписей",
+        "misplaced": ("Подпись рисунка расположена над рисунком", "Подпись под рисунком"),
+        "uncaptioned": ("Есть рисунки без подписи", "Подпись «Рисунок N – Название» под каждым рисунком"),
+    },
+    {
+        "kind": "table",
+        "category": "tables",
+        "title": "Таблица",
+        "plural": "таблиц",
+        "format_issue": "Найдены названия таблиц с нарушением формата",
+        "format_noun": "названий",
+        "misplaced": ("Название таблицы расположено под таблицей", "Название над таблицей"),
+        "uncaptioned": ("Есть таблицы без названия", "Название «Таблица N – Название» над каждой таблицей"),
+    },
+)
+
+
+@CHECKS.check("captions", needs=("objects", "citations", "index"))
+def _check_captions(doc_name: str, parsed, report, objects, citations, index) -> None:
+    """Check caption format, numbering, placement and in-text references of figures and tables."""
+
+    from tests.helpers.caption_index import numbering_gaps
+
+    def more(items: list) -> str:
+        return f" (и ещё {len(items) - 1})" if len(items) > 1 else ""
+
+    for spec in _CAPTION_KINDS:
+        kind, category, title = spec["kind"], spec["category"], spec["title"]
+        caption_re = re.compile(rf"^{title}\s+\d+(?:\.\d+)?\s*[—–-]\s+.+$", re.IGNORECASE)
+
+        bad_lines = [
+            ordinal
+            for line_kind, line, ordinal in objects.caption_lines
+            if line_kind == kind and (not caption_re.match(line) or line.endswith("."))
+        ]
+        if bad_lines:
+            report.add_issue(
+                doc_name,
+                category,
+                "warning",
+                spec["format_issue"],
+                expected=f"{title} N – Название (без точки в конце)",
+                actual=f"проблемных {spec['format_noun']}: {len(bad_lines)}",
+                location=index.location(bad_lines[0]),
+            )
+
+        captions = objects.of_kind(kind)
+        gaps = numbering_gaps([caption.number for caption in captions])
+        if gaps:
+            position = gaps[0]
+            if position:
+                actual = f"после «{title} {captions[position - 1].number}» идёт «{title} {captions[position].number}»"
+            else:
+                actual = f"первый номер: «{title} {captions[0].number}»"
+            report.add_issue(
+                doc_name,
+                category,
+                "warning",
+                f"Нарушена нумерация {spec['plural']}",
+                expected=f"{title} 1, 2, 3 … или по разделам: {title} 1.1, 1.2, 2.1 …",
+                actual=actual + more(gaps),
+                location=index.location(captions[position].ordinal),
+            )
+
+        misplaced = objects.misplaced(kind)
+        if misplaced:
+            description, expected = spec["misplaced"]
+            report.add_issue(
+                doc_name,
+                category,
+                "warning",
+                description,
+                expected=expected,
+                actual=f"«{misplaced[0].text[:60]}»{more(misplaced)}",
+                location=index.location(misplaced[0].ordinal),
+            )
+
+        # Sheets after the list of sources (graphic material lists, stamps) are not checked.
+        uncaptioned = objects.uncaptioned(kind, before=citations.sources_heading)
+        if uncaptioned:
+            description, expected = spec["uncaptioned"]
+            report.add_issue(
+                doc_name,
+                category,
+                "warning",
+                description,
+                expected=expected,
+                actual=f"без подписи: {len(uncaptioned)}",
+                location=index.location(uncaptioned[0].ordinal),
+            )
+
+        unreferenced = objects.unreferenced(kind)
+        if unreferenced:
+            numbers = ", ".join(caption.number for caption in unreferenced[:10])
+            report.add_issue(
+                doc_name,
+                category,
+                "warning",
+                f"Нет ссылок в тексте на часть {spec['plural']}",
+                expected=f"Ссылка в тексте на каждый объект («см. {title.lower()} N»)",
+                actual=f"{title} {numbers}" + (" …" if len(unreferenced) > 10 else ""),
+                location=index.location(unreferenced[0].ordinal),
+            )
+
+
+def _standards_md_path(repo_root: Path) -> Path:
+    """Return path to the IT checklist markdown (single source of truth)."""
+
+    return repo_root / "scripts" / "standards_verification" / "standars_control_it_short.md"
+
+
+@dataclass(frozen=True)
+class StandardsProfile:
+    """Checklist profile: the markdown its values are compiled from and the checks it leaves out.
+
+    `standards_md` is a file name under `scripts/standards_verification` or an
+    absolute path to any checklist markdown written in the same format.
+    """
+
+    name: str
+    standards_md: str
+    description: str
+    skip_checks: tuple[str, ...] = ()
+
+    def standards_md_path(self, repo_root: Path) -> Path:
+        """Path of the checklist markdown of this profile."""
+
+        path = Path(self.standards_md)
+        return path if path.is_absolute() else repo_root / "scripts" / "standards_verification" / path
+
+
+PROFILES = {
+    "it_short": StandardsProfile("it_short", "standars_control_it_short.md", "Пояснительная записка (ИТ, краткий чек-лист)"),
+    # A separate appendix document has neither the ПЗ structure nor its own list of sources.
+    "appendix": StandardsProfile(
+        "appendix",
+        "standars_control_it_short.md",
+        "Приложение к пояснительной записке",
+        skip_checks=("structure", "references"),
+    ),
+}
+
+# `--standards` value choosing `appendix` for "Приложение*.docx" and `it_short` otherwise.
+AUTO_STANDARDS = "auto"
+
+
+def resolve_standards(standards: str | None, doc_name: str) -> list[StandardsProfile]:
+    """Profiles a document is checked against.
 
     Args:
-        docx_path: Path to a .docx file.
-        report_dir: Directory where a markdown report will be saved.
+        standards: Comma-separated profile names (`PROFILES`) and/or paths to
+            checklist markdown files; None or "auto" picks by the document name.
+        doc_name: Document file name (for "auto").
 
-    Returns:
-        Exit code (0 if no errors, 1 otherwise).
+    Raises:
+        ValueError: For an unknown profile name or a missing markdown file.
     """
 
-    repo_root = _resolve_repo_root()
-    _ensure_tests_helpers_on_syspath(repo_root)
+    profiles: list[StandardsProfile] = []
+    for item in (standards or AUTO_STANDARDS).split(","):
+        item = item.strip()
+        if item == AUTO_STANDARDS:
+            name = "appendix" if Path(doc_name).name.casefold().startswith("приложение") else "it_short"
+            profile = PROFILES[name]
+        elif item in PROFILES:
+            profile = PROFILES[item]
+        elif item.lower().endswith(".md"):
+            path = Path(item).resolve()
+            if not path.is_file():
+                raise ValueError(f"Чек-лист не найден: {item}")
+            profile = StandardsProfile(path.stem, str(path), f"Чек-лист {path.name}")
+        else:
+            raise ValueError(f"Неизвестный профиль: {item} (доступны: {', '.join(PROFILES)}, {AUTO_STANDARDS})")
+        if profile not in profiles:
+            profiles.append(profile)
+    return profiles
+
+
+def _add_profile_note(report, standards: str | None, doc_name: str, profile: StandardsProfile, name: str) -> None:
+    """Note in the report which checks a profile left out and why it was applied.
+
+    Only profiles with `skip_checks` get a note. It is added to fresh and
+    cached results alike (it is not part of the cached issues).
+    """
 
-    from tests.helpers.ooxml_utils import get_document_xml
-    from tests.helpers.report import NormocontrolReport
+    if not profile.skip_checks:
+        return
+    requested = [item.strip() for item in (standards or AUTO_STANDARDS).split(",")]
+    if AUTO_STANDARDS in requested and profile == resolve_standards(AUTO_STANDARDS, doc_name)[0]:
+        reason = f"профиль выбран по имени файла ({AUTO_STANDARDS}); полная проверка: --standards it_short"
+    else:
+        reason = "профиль задан в --standards"
+    report.add_issue(
+        name,
+        "profile",
+        "info",
+        f"Проверки не выполнялись: {', '.join(profile.skip_checks)} (профиль {profile.name} — {profile.description})",
+        actual=reason,
+    )
+
+
+def _profile_document_names(doc_name: str, profiles: list[StandardsProfile]) -> list[str]:
+    """Report names of a document per profile (the plain name for a single profile)."""
+
+    if len(profiles) == 1:
+        return [doc_name]
+    return [f"{doc_name} [{profile.name}]" for profile in profiles]
+
+
+def _new_report(config: ItNormocontrolConfig):
+    """Create an empty report wired with the required sections from config."""
 
-    standards_md = repo_root / "scripts" / "standards_verification" / "standars_control_it_short.md"
-    config = load_it_normocontrol_config(standards_md)
+    from tests.helpers.report import NormocontrolReport
 
     report = NormocontrolReport()
     # Pass required sections through the report instance without changing its public API.
     # (This keeps changes localized to this script.)
     setattr(report, "_required_sections_in_order", config.required_sections_in_order)
-    doc_name = docx_path.name
-    report.add_document(doc_name)
+    return report
+
+
+def _formatting_digest(parsed) -> str:
+    """Digest of the parts paragraph facts depend on besides the paragraph itself."""
+
+    from tests.helpers.parsed_docx import STYLES_PART, THEME_PART
+
+    digest = hashlib.sha256()
+    for part in (STYLES_PART, THEME_PART):
+        digest.update(parsed.read_part(part) if parsed.has_part(part) else b"")
+    return digest.hexdigest()
+
 
-    doc_xml = get_document_xml(docx_path)
-    doc = Document(docx_path)
+def _config_digest(config: ItNormocontrolConfig) -> str:
+    """Digest of a checklist config (facts of views and checks may depend on it)."""
 
-    _check_page_setup(doc_name, doc_xml, report, config)
-    _check_paragraph_formatting(doc_name, doc_xml, report, config)
-    _check_fonts(doc_name, doc_xml, report, config)
-    _check_page_numbering(docx_path, doc_name, report)
-    _check_structure(doc_name, doc, report)
-    _check_references(doc_name, doc, report)
-    _check_captions(doc_name, doc, report)
+    import json
+    from dataclasses import asdict
+
+    return hashlib.sha256(json.dumps(asdict(config), ensure_ascii=False, sort_keys=True).encode()).hexdigest()
+
+
+def _facts_context(parsed, configs: list[ItNormocontrolConfig]) -> str:
+    """Facts cache context: formatting parts plus the configs of the scan, in slot order."""
+
+    digest = hashlib.sha256(_formatting_digest(parsed).encode())
+    for config in configs:
+        digest.update(_config_digest(config).encode())
+    return digest.hexdigest()
+
+
+# Paragraph facts of large documents are derived by worker processes in chunks
+# of about this many paragraphs while the main process scans the document.
+CHUNK_PARAGRAPHS = 500
+
+# Document and facts-aware visitors of a chunk worker (set once per worker by the initializer).
+_chunk_document: bytes = b""
+_chunk_visitors: list = []
+_chunk_parsed = None
+
+
+def _init_chunk_worker(configs: list[ItNormocontrolConfig], repo_root: str, docx_path: str) -> None:
+    """Open the document in a chunk worker process and build its facts-aware visitors."""
+
+    global _chunk_document, _chunk_visitors, _chunk_parsed
+    _ensure_tests_helpers_on_syspath(Path(repo_root))
+
+    from tests.helpers.parsed_docx import DOCUMENT_PART, ParsedDocx
+
+    # Kept open for the lifetime of the worker: views may read parts lazily.
+    _chunk_parsed = ParsedDocx(Path(docx_path))
+    _chunk_document = _chunk_parsed.read_part(DOCUMENT_PART)
+    _chunk_visitors = facts_visitors(CHECKS, _chunk_parsed, configs)
+
+
+def _derive_chunk(start: int, end: int) -> list[dict]:
+    """Paragraph facts of one body chunk of the worker's document."""
+
+    from tests.helpers.paragraph_facts import chunk_document, derive_chunk_facts
+
+    return derive_chunk_facts(chunk_document(_chunk_document, start, end), _chunk_visitors)
+
+
+class _ChunkFactsPool:
+    """Paragraph facts deriver backed by a process pool (started on first use)."""
+
+    def __init__(self, configs: list[ItNormocontrolConfig], docx_path: Path, jobs: int) -> None:
+        self.configs = configs
+        self.docx_path = docx_path
+        self.jobs = jobs
+        self._pool = None
+
+    def __call__(self, spans: list[tuple[int, int]]) -> list:
+        from concurrent.futures import ProcessPoolExecutor
+
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=min(self.jobs, len(spans)),
+                initializer=_init_chunk_worker,
+                initargs=(self.configs, str(_resolve_repo_root()), str(self.docx_path)),
+            )
+        return [self._pool.submit(_derive_chunk, start, end) for start, end in spans]
+
+    def __enter__(self) -> "_ChunkFactsPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+
+def run_checks(
+    docx_path: Path,
+    doc_name: str,
+    report,
+    config: ItNormocontrolConfig,
+    facts_store=None,
+    profile: bool = False,
+    jobs: int = 1,
+) -> CheckProfile | None:
+    """Run all IT short checklist checks (`CHECKS`) for one document.
+
+    Args:
+        docx_path: Path to a .docx file.
+        doc_name: Name under which issues are recorded in the report.
+        report: Report created by `_new_report`.
+        config: Parsed IT checklist configuration.
+        facts_store: Optional `FactsStore`; paragraph facts of the previous
+            revision of `doc_name` are reused for unchanged paragraphs.
+        profile: Record per-check wall time and element counts.
+        jobs: Worker processes deriving paragraph facts of a large document
+            in chunks (1 = everything in this process).
+
+    Returns:
+        The per-check profile if `profile` is set, else None.
+    """
+
+    return run_profile_checks(docx_path, doc_name, [ProfileRun(config, doc_name, report)], facts_store, profile, jobs)
+
+
+def run_profile_checks(
+    docx_path: Path,
+    doc_name: str,
+    runs: list[ProfileRun],
+    facts_store=None,
+    profile: bool = False,
+    jobs: int = 1,
+) -> CheckProfile | None:
+    """Check one document against several profiles in a single scan.
+
+    Args:
+        docx_path: Path to a .docx file.
+        doc_name: Name of the document in the facts store and the check profile.
+        runs: Profiles to evaluate (config, report name, report, skipped checks);
+            each report is created by `_new_report` with the profile config.
+        facts_store: Optional `FactsStore` (see `run_checks`).
+        profile: Record per-check wall time and element counts.
+        jobs: Worker processes deriving paragraph facts of a large document.
+
+    Returns:
+        The per-check profile if `profile` is set, else None.
+    """
+
+    from tests.helpers.paragraph_facts import ParagraphFactsCache
+    from tests.helpers.parsed_docx import ParsedDocx
+
+    for run in runs:
+        run.report.add_document(run.doc_name)
+    check_profile = CheckProfile(doc_name) if profile else None
+    configs = [config for config, _ in config_groups(runs)]
+
+    with ParsedDocx(docx_path) as parsed, _ChunkFactsPool(configs, docx_path, jobs) as chunk_pool:
+        facts = None
+        if facts_store is not None or jobs > 1:
+            facts = ParagraphFactsCache(
+                facts_store.load(doc_name) if facts_store is not None else None,
+                context=_facts_context(parsed, configs),
+                deriver=chunk_pool if jobs > 1 else None,
+                chunk_paragraphs=CHUNK_PARAGRAPHS,
+            )
+
+        # OOXML checks and views share a single streaming pass over word/document.xml;
+        # the paragraph texts for the text-based checks are collected in the same pass.
+        # Chunk workers only derive per-paragraph facts: positional and cross-section
+        # aggregation (page flow, heading order, citation numbering) stays in this pass
+        # and in the text-based checks after it. All profiles are evaluated in this pass.
+        run_profiles(CHECKS, parsed, runs, facts=facts, profile=check_profile)
+
+        if facts_store is not None and facts.complete:
+            facts_store.save(doc_name, facts.to_dict())
+            if facts.hits:
+                print(f"✓ Incremental check: {facts.hits} of {facts.hits + facts.misses} paragraph(s) unchanged")
+
+    return check_profile
+
+
+def _checker_version(repo_root: Path) -> str:
+    """Return checker version plus a digest of the checker and helper sources.
+
+    The digest keeps the result cache honest even if CHECKER_VERSION is not bumped.
+    """
+
+    digest = hashlib.sha256()
+    script = Path(__file__).resolve()
+    sources = [script, script.with_name("check_registry.py"), *sorted((repo_root / "tests" / "helpers").glob("*.py"))]
+    for source in sources:
+        digest.update(source.read_bytes())
+    return f"{CHECKER_VERSION}:{digest.hexdigest()[:16]}"
+
+
+def _cache_salt(repo_root: Path, standards: StandardsProfile) -> str:
+    """Profile, its checklist markdown hash and the checker version (invalidates cached results)."""
+
+    from tests.helpers.result_cache import file_sha256
+
+    md_hash = file_sha256(standards.standards_md_path(repo_root))
+    return f"{standards.name}:{','.join(standards.skip_checks)}:{md_hash}:{_checker_version(repo_root)}"
+
+
+def _open_result_cache(repo_root: Path, report_dir: Path, standards: StandardsProfile):
+    """Open the result cache of a profile under `<report_dir>/.cache`.
+
+    Keys combine the document hash, the profile with its checklist markdown hash and the checker version.
+    """
+
+    from tests.helpers.result_cache import ResultCache
+
+    return ResultCache(report_dir / ".cache", _cache_salt(repo_root, standards))
+
+
+def _open_facts_store(repo_root: Path, report_dir: Path):
+    """Open the per-document paragraph facts store under `<report_dir>/.cache/facts`.
+
+    The configs of a scan are part of the facts context (`_facts_context`), so
+    only the checker version salts the store.
+    """
+
+    from tests.helpers.result_cache import FactsStore
+
+    return FactsStore(report_dir / ".cache" / "facts", _checker_version(repo_root))
+
+
+def write_markdown_report(report, report_dir: Path, prefix: str) -> Path:
+    """Save the report as timestamped markdown and print a short summary.
+
+    Reports written within the same second get a numeric suffix instead of
+    overwriting each other (the check server may write them concurrently).
+    """
 
     report_dir.mkdir(parents=True, exist_ok=True)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    report_path = report_dir / f"it_normocontrol_report_{timestamp}.md"
+    report_path = report_dir / f"{prefix}_{timestamp}.md"
+    suffix = 1
+    while True:
+        try:
+            report_path.touch(exist_ok=False)
+            break
+        except FileExistsError:
+            report_path = report_dir / f"{prefix}_{timestamp}_{suffix}.md"
+            suffix += 1
     report.to_markdown(report_path)
 
     summary = report.generate_summary()
@@ -679,18 +1677,370 @@ def check_it_docx(docx_path: Path, report_dir: Path) -> int:
     print(f"Checked: {summary['total_documents']} document(s)")
     print(f"Issues: {summary['total_issues']} (errors={summary['errors']}, warnings={summary['warnings']})")
 
+    return report_path
+
+
+def build_report(
+    docx_path: Path,
+    report_dir: Path,
+    use_cache: bool = True,
+    doc_name: str | None = None,
+    profile: bool = False,
+    jobs: int = 1,
+    standards: str | None = None,
+):
+    """Check one document and return the filled report (without writing it).
+
+    Args:
+        docx_path: Path to a .docx file.
+        report_dir: Report directory (its `.cache` subfolder holds cached results).
+        use_cache: Reuse stored results for an unchanged document.
+        doc_name: Name for the report (defaults to the file name); also keys the
+            facts store for uploads, which have no path of their own. Files on
+            disk are keyed by their repo-relative path.
+        profile: Print the slowest checks (stored results are not reused then).
+        jobs: Worker processes for the paragraph facts of a large document.
+        standards: Checklist profiles (see `resolve_standards`); with several
+            profiles the document is reported once per profile, "name [profile]".
+
+    Returns:
+        NormocontrolReport with the issues of this document.
+    """
+
+    repo_root = _resolve_repo_root()
+    _ensure_tests_helpers_on_syspath(repo_root)
+
+    # Same-named files of different students keep separate facts tables.
+    facts_name = doc_name or _repo_document_name(docx_path, repo_root)
+    doc_name = doc_name or docx_path.name
+    profiles = resolve_standards(standards, doc_name)
+    configs = [load_it_normocontrol_config(standards.standards_md_path(repo_root)) for standards in profiles]
+    names = _profile_document_names(doc_name, profiles)
+
+    report = _new_report(configs[0])
+    issues_by_name: dict[str, list] = {}
+    cache_entries: dict[str, tuple] = {}
+    runs: list[ProfileRun] = []
+    for item, config, name in zip(profiles, configs, names):
+        cache = _open_result_cache(repo_root, report_dir, item) if use_cache else None
+        cache_key = cache.key_for(docx_path) if cache else None
+        cached_issues = cache.get(cache_key, name) if cache and not profile else None
+        if cached_issues is not None:
+            issues_by_name[name] = cached_issues
+            continue
+        cache_entries[name] = (cache, cache_key)
+        runs.append(ProfileRun(config, name, _new_report(config), item.skip_checks))
+
+    if not runs:
+        print("✓ Cached result (document unchanged)")
+    else:
+        facts_store = _open_facts_store(repo_root, report_dir) if use_cache else None
+        check_profile = run_profile_checks(docx_path, facts_name, runs, facts_store, profile=profile, jobs=jobs)
+        if check_profile is not None:
+            print(check_profile.format_table())
+        for run in runs:
+            issues_by_name[run.doc_name] = run.report.issues
+            cache, cache_key = cache_entries[run.doc_name]
+            if cache:
+                cache.put(cache_key, run.report.issues)
+
+    for item, name in zip(profiles, names):
+        report.add_document(name)
+        report.add_issues(issues_by_name[name])
+        _add_profile_note(report, standards, doc_name, item, name)
+    return report
+
+
+def result_payload(report, report_path: Path | None) -> dict:
+    """Build the machine-readable check result (also returned by the check server)."""
+
+    return {
+        "exit_code": 1 if report.has_errors() else 0,
+        "report_path": str(report_path) if report_path else None,
+        "report": report.to_dict(),
+    }
+
+
+def write_json_result(report, report_path: Path | None, json_out: Path) -> None:
+    """Write `result_payload` to `json_out` atomically."""
+
+    json_out.parent.mkdir(parents=True, exist_ok=True)
+    _write_json_atomic(json_out, result_payload(report, report_path))
+
+
+def check_it_docx(
+    docx_path: Path,
+    report_dir: Path,
+    use_cache: bool = True,
+    json_out: Path | None = None,
+    profile: bool = False,
+    jobs: int = 1,
+    standards: str | None = None,
+) -> int:
+    """Run checklist checks and write a markdown report.
+
+    Args:
+        docx_path: Path to a .docx file.
+        report_dir: Directory where a markdown report will be saved.
+        use_cache: Reuse stored results for an unchanged document.
+        json_out: Optional path for the machine-readable result (`result_payload`).
+        profile: Print per-check timings (slowest checks first).
+        jobs: Worker processes for the paragraph facts of a large document.
+        standards: Checklist profiles (see `resolve_standards`).
+
+    Returns:
+        Exit code (0 if no errors, 1 otherwise).
+    """
+
+    report = build_report(
+        docx_path, report_dir, use_cache=use_cache, profile=profile, jobs=jobs, standards=standards
+    )
+    report_path = write_markdown_report(report, report_dir, "it_normocontrol_report")
+    if json_out:
+        write_json_result(report, report_path, json_out)
+
+    return 1 if report.has_errors() else 0
+
+
+# Configs (by checklist markdown), facts store and profiling flag shared by batch
+# worker processes (set once per worker by the initializer).
+_batch_configs: dict[str, ItNormocontrolConfig] = {}
+_batch_facts_store = None
+_batch_profile = False
+
+
+def _init_batch_worker(
+    configs: dict[str, ItNormocontrolConfig], repo_root: str, facts_store=None, profile: bool = False
+) -> None:
+    """Initialize a batch worker process with the already parsed configs."""
+
+    global _batch_configs, _batch_facts_store, _batch_profile
+    _ensure_tests_helpers_on_syspath(Path(repo_root))
+    _batch_configs = configs
+    _batch_facts_store = facts_store
+    _batch_profile = profile
+
+
+def _check_batch_document(
+    docx_path: Path, doc_name: str, targets: list[tuple[StandardsProfile, str]]
+) -> tuple[dict[str, list], CheckProfile | None]:
+    """Check one document against its profiles inside a batch worker.
+
+    Returns:
+        Issues by report name (one per `(profile, name)` target) and the check profile.
+    """
+
+    runs = []
+    for standards, name in targets:
+        config = _batch_configs[standards.standards_md]
+        runs.append(ProfileRun(config, name, _new_report(config), standards.skip_checks))
+    check_profile = None
+    try:
+        check_profile = run_profile_checks(docx_path, doc_name, runs, _batch_facts_store, profile=_batch_profile)
+    except Exception as exc:  # A broken archive must not abort the whole sweep.
+        for run in runs:
+            run.report = _new_report(run.config)
+            run.report.add_issue(
+                run.doc_name,
+                "document",
+                "error",
+                "Не удалось прочитать документ",
+                expected="Корректный .docx файл",
+                actual=f"{type(exc).__name__}: {exc}",
+            )
+    return {run.doc_name: run.report.issues for run in runs}, check_profile
+
+
+def find_batch_documents(pattern: str) -> list[Path]:
+    """Resolve a batch glob into a sorted list of .docx files.
+
+    Word lock files (`~$*.docx`) are skipped.
+    """
+
+    import glob
+
+    paths = (Path(match) for match in glob.glob(pattern, recursive=True))
+    return sorted(
+        path
+        for path in paths
+        if path.is_file() and path.suffix.lower() == ".docx" and not path.name.startswith("~$")
+    )
+
+
+def _repo_document_name(docx_path: Path, repo_root: Path) -> str:
+    """Return a unique report name for a document (repo-relative path if possible)."""
+
+    resolved = docx_path.resolve()
+    if resolved.is_relative_to(repo_root):
+        return resolved.relative_to(repo_root).as_posix()
+    return resolved.as_posix()
+
+
+def check_it_docx_batch(
+    docx_paths: list[Path],
+    report_dir: Path,
+    use_cache: bool = True,
+    json_out: Path | None = None,
+    profile: bool = False,
+    standards: str | None = None,
+) -> int:
+    """Check many documents in parallel and write one aggregated markdown report.
+
+    The checklist configs are parsed once in the parent process and handed to
+    worker processes (one per CPU core). Cached documents never reach the pool.
+
+    Args:
+        docx_paths: Paths to .docx files.
+        report_dir: Directory where the aggregated report will be saved.
+        use_cache: Reuse stored results for unchanged documents.
+        json_out: Optional path for the machine-readable result (`result_payload`).
+        profile: Print per-check timings of every checked document (stored results are not reused then).
+        standards: Checklist profiles (see `resolve_standards`), resolved per document.
+
+    Returns:
+        Exit code (0 if no document has errors, 1 otherwise).
+    """
+
+    import os
+    from concurrent.futures import ProcessPoolExecutor
+
+    repo_root = _resolve_repo_root()
+    _ensure_tests_helpers_on_syspath(repo_root)
+
+    doc_names = [_repo_document_name(path, repo_root) for path in docx_paths]
+    targets_by_doc: dict[str, list[tuple[StandardsProfile, str]]] = {}
+    configs: dict[str, ItNormocontrolConfig] = {}
+    for doc_name in doc_names:
+        profiles = resolve_standards(standards, doc_name)
+        targets_by_doc[doc_name] = list(zip(profiles, _profile_document_names(doc_name, profiles)))
+        for item in profiles:
+            if item.standards_md not in configs:
+                configs[item.standards_md] = load_it_normocontrol_config(item.standards_md_path(repo_root))
+    report = _new_report(next(iter(configs.values())))
+
+    issues_by_name: dict[str, list] = {}
+    caches: dict[str, object] = {}
+    facts_store = _open_facts_store(repo_root, report_dir) if use_cache else None
+    cache_keys: dict[str, str] = {}
+    pending: list[tuple[Path, str, list]] = []
+    for path, doc_name in zip(docx_paths, doc_names):
+        missing = []
+        for item, name in targets_by_doc[doc_name]:
+            if use_cache:
+                if item.name not in caches:
+                    caches[item.name] = _open_result_cache(repo_root, report_dir, item)
+                cache_keys[name] = caches[item.name].key_for(path)
+                cached_issues = caches[item.name].get(cache_keys[name], name) if not profile else None
+                if cached_issues is not None:
+                    issues_by_name[name] = cached_issues
+                    continue
+            missing.append((item, name))
+        if missing:
+            pending.append((path, doc_name, missing))
+
+    if pending:
+        max_workers = max(1, min(os.cpu_count() or 1, len(pending)))
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_batch_worker,
+            initargs=(configs, str(repo_root), facts_store, profile),
+        ) as pool:
+            paths, names, targets = zip(*pending)
+            for doc_targets, (issues, check_profile) in zip(
+                targets, pool.map(_check_batch_document, paths, names, targets)
+            ):
+                issues_by_name.update(issues)
+                if check_profile is not None:
+                    print(check_profile.format_table())
+                for item, name in doc_targets:
+                    # Unreadable documents are not cached: the file may be fixed in place.
+                    if use_cache and not any(issue.category == "document" for issue in issues[name]):
+                        caches[item.name].put(cache_keys[name], issues[name])
+
+    print(f"Cached: {len(docx_paths) - len(pending)} of {len(docx_paths)} document(s)")
+    for doc_name in doc_names:
+        for item, name in targets_by_doc[doc_name]:
+            report.add_document(name)
+            report.add_issues(issues_by_name[name])
+            _add_profile_note(report, standards, doc_name, item, name)
+
+    report_path = write_markdown_report(report, report_dir, "it_normocontrol_batch_report")
+    if json_out:
+        write_json_result(report, report_path, json_out)
+
     return 1 if report.has_errors() else 0
 
 
 def main() -> int:
     """CLI entrypoint."""
 
+    import argparse
+    import os
+
     repo_root = _resolve_repo_root()
     default_docx = repo_root / "tests" / "ПЗ.docx"
-
-    docx_path = Path(sys.argv[1]) if len(sys.argv) >= 2 else default_docx
     report_dir = repo_root / "normocontrol_reports"
 
+    parser = argparse.ArgumentParser(description="IT normocontrol checker (short checklist)")
+    parser.add_argument("docx", nargs="?", type=Path, default=default_docx, help="Path to a .docx file")
+    parser.add_argument(
+        "--batch",
+        metavar="GLOB",
+        help="Check every .docx matching the glob in parallel, e.g. 'students/*/task_03/*.docx'",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not update the result cache")
+    parser.add_argument(
+        "--json-out",
+        type=Path,
+        metavar="PATH",
+        help="Also write the machine-readable result (exit code, report path, issues) to PATH",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print a table of the slowest checks per document (wall time, visited elements)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        metavar="N",
+        help="Worker processes for one large document (default: CPU count; --batch parallelizes by document)",
+    )
+    parser.add_argument(
+        "--standards",
+        default=AUTO_STANDARDS,
+        metavar="PROFILES",
+        help=(
+            f"Comma-separated checklist profiles ({', '.join(PROFILES)}) or checklist .md paths, "
+            f"all evaluated in one scan; '{AUTO_STANDARDS}' (default) picks appendix for 'Приложение*.docx'"
+        ),
+    )
+    args = parser.parse_args()
+    use_cache = not args.no_cache
+
+    try:
+        resolve_standards(args.standards, "")
+    except ValueError as exc:
+        print(f"ERROR: {exc}")
+        return 1
+
+    if args.batch:
+        docx_paths = find_batch_documents(args.batch)
+        if not docx_paths:
+            print(f"ERROR: No .docx files match: {args.batch}")
+            return 1
+        return check_it_docx_batch(
+            docx_paths,
+            report_dir,
+            use_cache=use_cache,
+            json_out=args.json_out,
+            profile=args.profile,
+            standards=args.standards,
+        )
+
+    docx_path = args.docx
+
     if not docx_path.exists():
         print(f"ERROR: File not found: {docx_path}")
         return 1
@@ -699,7 +2049,15 @@ def main() -> int:
         print(f"ERROR: Expected .docx file: {docx_path}")
         return 1
 
-    return check_it_docx(docx_path, report_dir)
+    return check_it_docx(
+        docx_path,
+        report_dir,
+        use_cache=use_cache,
+        json_out=args.json_out,
+        profile=args.profile,
+        jobs=args.jobs,
+        standards=args.standards,
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,398 @@
+"""Registry of normocontrol checks and the engine that runs them on one document.
+
+Checks declare the document views they need instead of being wired by hand:
+
+- `xml` — the single streaming pass over `word/document.xml` (scanner visitors);
+- `text` — paragraph texts (`ParsedDocx.paragraph_texts`/`text`/`lines`), collected in that pass;
+- `styles` — `StyleResolver` of the document;
+- `headers` — the `ParsedDocx` itself, for header/footer parts and relationships;
+- plus views registered with `CheckRegistry.view` (e.g. the layout estimate).
+
+    CHECKS = CheckRegistry()
+
+    @CHECKS.view("layout", needs=("styles",))
+    def _layout_view(config, parsed, styles): ...
+
+    @CHECKS.scanner("fonts", needs=("xml", "styles", "layout"))
+    class _FontsCheck: ...          # _FontsCheck(config, styles=<StyleResolver>, layout=<view>)
+
+    @CHECKS.check("structure", needs=("text",))
+    def _check_structure(doc_name, parsed, report): ...
+
+    @CHECKS.check("references", needs=("citations", "index"))
+    def _check_references(doc_name, parsed, report, citations, index): ...
+
+`run_registered_checks` builds only the views the checks need, scans the
+document once for all scanner checks and views, and then reports scanner
+checks and function checks in registration order. With a `CheckProfile`
+it records wall time and visited element counts per check.
+
+`run_profiles` evaluates several checklist profiles (`ProfileRun`) in the
+same single scan: profiles with equal configs share views and checks and
+differ only in the checks they skip and the report they fill; every other
+config gets its own views and checks, whose paragraph facts are stored
+under `<facts_name>@<group>`.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+
+
+# Views provided by the engine itself (`styles` and `headers` are also handed to checks as objects).
+BUILTIN_VIEWS = ("xml", "text", "styles", "headers")
+
+_VISITOR_HOOKS = ("visit_run", "visit_paragraph", "visit_section")
+
+
+@dataclass(frozen=True)
+class CheckSpec:
+    """A registered check or view."""
+
+    name: str
+    factory: Callable
+    needs: tuple[str, ...]
+    kind: str  # "view", "scanner" or "check"
+
+
+class CheckRegistry:
+    """Ordered collection of checks and shared views."""
+
+    def __init__(self) -> None:
+        self._specs: dict[str, CheckSpec] = {}
+
+    def _register(self, name: str, needs: tuple[str, ...], kind: str) -> Callable:
+        def decorator(factory: Callable) -> Callable:
+            if name in self._specs:
+                raise ValueError(f"Check or view already registered: {name}")
+            unknown = [view for view in needs if view not in BUILTIN_VIEWS and view not in self._specs]
+            if unknown:
+                raise ValueError(f"{name}: unknown views {unknown} (register views before their users)")
+            self._specs[name] = CheckSpec(name, factory, tuple(needs), kind)
+            return factory
+
+        return decorator
+
+    def view(self, name: str, needs: tuple[str, ...] = ()) -> Callable:
+        """Register a shared view: `factory(config, parsed, **needed_views)`.
+
+        A view object with scanner hooks is scanned before every scanner check.
+        """
+        return self._register(name, needs, "view")
+
+    def scanner(self, name: str, needs: tuple[str, ...] = ("xml",)) -> Callable:
+        """Register a scanner-visitor check class: `cls(config, **needed_views)` with `report_issues(doc_name, report)`."""
+        return self._register(name, needs, "scanner")
+
+    def check(self, name: str, needs: tuple[str, ...] = ("text",)) -> Callable:
+        """Register a function check: `fn(doc_name, parsed, report, **registered_views)`.
+
+        Views registered with `view` are passed by name; built-in views are reached through `parsed`.
+        """
+        return self._register(name, needs, "check")
+
+    def specs(self, kind: str) -> list[CheckSpec]:
+        """Registered specs of one kind in registration order."""
+        return [spec for spec in self._specs.values() if spec.kind == kind]
+
+    def required_views(self, checks: list[CheckSpec]) -> set[str]:
+        """All views needed by the given checks, including views needed by views."""
+        required: set[str] = set()
+        pending = [view for spec in checks for view in spec.needs]
+        while pending:
+            view = pending.pop()
+            if view in required:
+                continue
+            required.add(view)
+            spec = self._specs.get(view)
+            if spec is not None:
+                pending.extend(spec.needs)
+        return required
+
+
+@dataclass
+class CheckTiming:
+    """Wall time and visited elements of one check or view on one document."""
+
+    name: str
+    needs: tuple[str, ...] = ()
+    seconds: float = 0.0
+    elements: int = 0
+
+
+@dataclass
+class CheckProfile:
+    """Per-check timings of one document."""
+
+    document: str
+    timings: dict[str, CheckTiming] = field(default_factory=dict)
+
+    def timing(self, name: str, needs: tuple[str, ...] = ()) -> CheckTiming:
+        """Timing record of a check (created on first use)."""
+        if name not in self.timings:
+            self.timings[name] = CheckTiming(name, needs)
+        return self.timings[name]
+
+    def total_seconds(self) -> float:
+        """Sum of all recorded wall times."""
+        return sum(timing.seconds for timing in self.timings.values())
+
+    def format_table(self, limit: int = 10) -> str:
+        """Plain-text table of the slowest checks."""
+        rows = sorted(self.timings.values(), key=lambda timing: -timing.seconds)[:limit]
+        total = self.total_seconds()
+        width = max([len(timing.name) for timing in rows] + [len("check")])
+        lines = [
+            f"Профиль проверок: {self.document} (всего {total * 1000:.1f} мс)",
+            f"  {'check':<{width}}  {'ms':>8}  {'elements':>8}  views",
+        ]
+        for timing in rows:
+            lines.append(
+                f"  {timing.name:<{width}}  {timing.seconds * 1000:>8.1f}  {timing.elements:>8}  {', '.join(timing.needs)}"
+            )
+        return "\n".join(lines)
+
+
+class _TimedVisitor:
+    """Scanner visitor proxy adding hook wall time and call counts to a `CheckTiming`."""
+
+    def __init__(self, visitor: object, timing: CheckTiming) -> None:
+        self._timing = timing
+        for hook in _VISITOR_HOOKS:
+            method = getattr(visitor, hook, None)
+            if method is not None:
+                setattr(self, hook, self._timed(method, counted=True))
+        if hasattr(visitor, "paragraph_facts"):
+            self.facts_name = visitor.facts_name
+            self.paragraph_facts = self._timed(visitor.paragraph_facts, counted=False)
+            self.visit_paragraph_facts = self._timed(visitor.visit_paragraph_facts, counted=True)
+
+    def _timed(self, method: Callable, counted: bool) -> Callable:
+        timing = self._timing
+        clock = time.perf_counter
+
+        def hook(*args):
+            start = clock()
+            try:
+                return method(*args)
+            finally:
+                timing.seconds += clock() - start
+                if counted:
+                    timing.elements += 1
+
+        return hook
+
+
+class _Stopwatch:
+    """Context manager adding elapsed time to a timing record (no-op without one)."""
+
+    def __init__(self, timing: CheckTiming | None) -> None:
+        self.timing = timing
+
+    def __enter__(self) -> "_Stopwatch":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self.timing is not None:
+            self.timing.seconds += time.perf_counter() - self.start
+
+
+@dataclass
+class ProfileRun:
+    """One checklist profile evaluated in a shared scan."""
+
+    config: object
+    doc_name: str
+    report: object
+    skip: tuple[str, ...] = ()  # names of checks not reported for this profile
+
+
+def config_groups(runs: list[ProfileRun]) -> list[tuple[object, list[ProfileRun]]]:
+    """Runs grouped by equal config, in order of first appearance."""
+
+    groups: list[tuple[object, list[ProfileRun]]] = []
+    for run in runs:
+        for config, members in groups:
+            if config == run.config:
+                members.append(run)
+                break
+        else:
+            groups.append((run.config, [run]))
+    return groups
+
+
+def run_registered_checks(
+    registry: CheckRegistry,
+    parsed,
+    config,
+    doc_name: str,
+    report,
+    facts=None,
+    profile: CheckProfile | None = None,
+) -> None:
+    """Run every registered check on an opened document.
+
+    Args:
+        registry: Registry with the checks and views.
+        parsed: `ParsedDocx` of the document.
+        config: Checklist configuration handed to views and scanner checks.
+        doc_name: Name under which issues are recorded in the report.
+        report: Report receiving the issues.
+        facts: Optional `ParagraphFactsCache` for the scan.
+        profile: Optional profile receiving per-check timings.
+    """
+
+    run_profiles(registry, parsed, [ProfileRun(config, doc_name, report)], facts=facts, profile=profile)
+
+
+def run_profiles(
+    registry: CheckRegistry,
+    parsed,
+    runs: list[ProfileRun],
+    facts=None,
+    profile: CheckProfile | None = None,
+) -> None:
+    """Run every registered check for several checklist profiles in one scan of the document.
+
+    Args:
+        registry: Registry with the checks and views.
+        parsed: `ParsedDocx` of the document.
+        runs: Profiles to evaluate; issues of each go to its own report.
+        facts: Optional `ParagraphFactsCache` for the scan.
+        profile: Optional profile receiving per-check timings (summed over profiles).
+    """
+
+    def timing(spec: CheckSpec) -> CheckTiming | None:
+        return profile.timing(spec.name, spec.needs) if profile is not None else None
+
+    required = registry.required_views(registry.specs("scanner") + registry.specs("check"))
+    built = []
+    visitors = []
+    for group, (config, members) in enumerate(config_groups(runs)):
+        views, group_visitors, checks = _build_visitors(registry, parsed, config, required, timing)
+        visitors.extend(_facts_slot(visitor, group) for visitor in group_visitors)
+        built.append((members, views, checks))
+
+    if "xml" in required or "text" in required:
+        hooks_before = profile.total_seconds() if profile is not None else 0.0
+        scan_start = time.perf_counter()
+        parsed.scan(visitors, facts=facts)
+        if profile is not None:
+            # Parsing and dispatch: the scan time not spent in any check or view hook.
+            hooks = profile.total_seconds() - hooks_before
+            scan = profile.timing("(scan document.xml)", ("xml", "text"))
+            scan.seconds += time.perf_counter() - scan_start - hooks
+            scan.elements = len(parsed.paragraph_texts)
+
+    for members, views, checks in built:
+        for run in members:
+            for spec, check in checks:
+                if spec.name in run.skip:
+                    continue
+                with _Stopwatch(timing(spec)):
+                    check.report_issues(run.doc_name, run.report)
+
+            for spec in registry.specs("check"):
+                if spec.name in run.skip:
+                    continue
+                record = timing(spec)
+                registered_views = {view: views[view] for view in spec.needs if view not in BUILTIN_VIEWS}
+                with _Stopwatch(record):
+                    spec.factory(run.doc_name, parsed, run.report, **registered_views)
+                if record is not None:
+                    record.elements = _view_elements(parsed, spec.needs)
+
+
+def _build_visitors(
+    registry: CheckRegistry, parsed, config, required: set[str], timing: Callable
+) -> tuple[dict, list, list]:
+    """Construct the required views and all scanner checks.
+
+    Returns:
+        Views by name, scanner visitors (views with hooks first, then scanner
+        checks) and `(spec, check)` pairs of the scanner checks.
+    """
+
+    views: dict[str, object] = {}
+    if "styles" in required:
+        views["styles"] = parsed.style_resolver
+    if "headers" in required:
+        views["headers"] = parsed
+
+    def view_arguments(spec: CheckSpec) -> dict:
+        return {view: views[view] for view in spec.needs if view in views}
+
+    def timed(visitor: object, spec: CheckSpec) -> object:
+        record = timing(spec)
+        return _TimedVisitor(visitor, record) if record is not None else visitor
+
+    visitors = []
+    for spec in registry.specs("view"):
+        if spec.name not in required:
+            continue
+        with _Stopwatch(timing(spec)):
+            view = spec.factory(config, parsed, **view_arguments(spec))
+        views[spec.name] = view
+        if any(hasattr(view, hook) for hook in (*_VISITOR_HOOKS, "paragraph_facts")):
+            visitors.append(timed(view, spec))
+
+    checks = []
+    for spec in registry.specs("scanner"):
+        with _Stopwatch(timing(spec)):
+            check = spec.factory(config, **view_arguments(spec))
+        checks.append((spec, check))
+        visitors.append(timed(check, spec))
+
+    return views, visitors, checks
+
+
+class _FactsSlot:
+    """Scanner visitor proxy storing paragraph facts under a per-config slot name."""
+
+    def __init__(self, visitor: object, suffix: str) -> None:
+        for hook in _VISITOR_HOOKS:
+            method = getattr(visitor, hook, None)
+            if method is not None:
+                setattr(self, hook, method)
+        self.facts_name = f"{visitor.facts_name}{suffix}"
+        self.paragraph_facts = visitor.paragraph_facts
+        self.visit_paragraph_facts = visitor.visit_paragraph_facts
+
+
+def _facts_slot(visitor: object, group: int) -> object:
+    """The visitor itself for the first config group, a `_FactsSlot` with suffix `@<group>` otherwise."""
+
+    if group == 0 or not hasattr(visitor, "paragraph_facts"):
+        return visitor
+    return _FactsSlot(visitor, f"@{group}")
+
+
+def facts_visitors(registry: CheckRegistry, parsed, configs: list) -> list:
+    """Facts-aware visitors of all registered views and scanner checks, freshly constructed.
+
+    Used by worker processes that derive paragraph facts of a document chunk
+    (see `paragraph_facts.derive_chunk_facts`); only `paragraph_facts` of the
+    returned visitors is called there. `configs` are the distinct configs of
+    the scan in `config_groups` order, so facts land in the same slots.
+    """
+
+    required = registry.required_views(registry.specs("scanner") + registry.specs("check"))
+    visitors = []
+    for group, config in enumerate(configs):
+        _, group_visitors, _ = _build_visitors(registry, parsed, config, required, lambda spec: None)
+        visitors.extend(_facts_slot(visitor, group) for visitor in group_visitors)
+    return [visitor for visitor in visitors if hasattr(visitor, "paragraph_facts")]
+
+
+def _view_elements(parsed, needs: tuple[str, ...]) -> int:
+    """Element count of a function check: paragraphs of the text view plus header parts."""
+
+    elements = 0
+    if "text" in needs:
+        elements += len(parsed.paragraph_texts)
+    if "headers" in needs:
+        elements += len(parsed.headers)
+    return elements
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""Resident IT normocontrol check server.
+
+Every run of `check_it_docx.py` pays interpreter startup plus python-docx/lxml
+imports and checklist loading. This server keeps all of that warm and checks
+documents on request over a local HTTP API.
+
+Start (from the repository root):
+
+    python scripts/standards_verification/normocontrol_server.py --port 8765
+
+API (JSON, bound to 127.0.0.1 by default):
+- `GET /health` -> `{"status": "ok", "checker_version": "..."}`
+- `POST /check` with JSON body `{"path": "students/<Student>/task_03/Пояснительная_записка.docx"}`
+- `POST /check?name=<file>.docx` with raw .docx bytes as the body (upload)
+
+Both accept checklist profiles as in `check_it_docx.py --standards`: a
+`"standards"` field of the JSON body or a `standards=` query parameter
+(default: `auto`).
+
+`/check` responds with `check_it_docx.result_payload`:
+
+    {"exit_code": 0 | 1, "report_path": "<markdown report>", "report": NormocontrolReport.to_dict()}
+
+An invalid request (bad JSON, missing file, unknown profile) gets 400; a
+failure while checking the document (including I/O errors) gets 500.
+
+`.github/scripts/run_it_normocontrol_task03.py` uses the server when
+`NORMOCONTROL_SERVER_URL` is set (e.g. `http://127.0.0.1:8765`) and falls back
+to running the checker as a subprocess otherwise.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import check_it_docx as checker
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MAX_UPLOAD_BYTES = 100 * 1024 * 1024
+
+
+class BadRequestError(Exception):
+    """A `/check` request that can not be served as sent (answered with 400)."""
+
+
+def _validate_standards(standards: str | None, doc_name: str) -> None:
+    """Reject unknown profiles before checking anything."""
+
+    try:
+        checker.resolve_standards(standards, doc_name)
+    except ValueError as exc:
+        raise BadRequestError(str(exc)) from exc
+
+
+def check_document(
+    docx_path: Path, report_dir: Path, use_cache: bool, doc_name: str | None = None, standards: str | None = None
+) -> dict:
+    """Check a document and return the `/check` response payload."""
+
+    report = checker.build_report(docx_path, report_dir, use_cache=use_cache, doc_name=doc_name, standards=standards)
+    report_path = checker.write_markdown_report(report, report_dir, "it_normocontrol_report")
+    return checker.result_payload(report, report_path)
+
+
+class NormocontrolServer(ThreadingHTTPServer):
+    """HTTP server holding the shared check settings."""
+
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], report_dir: Path, use_cache: bool) -> None:
+        super().__init__(address, _CheckRequestHandler)
+        self.report_dir = report_dir
+        self.use_cache = use_cache
+
+
+class _CheckRequestHandler(BaseHTTPRequestHandler):
+    """Request handler for `/health` and `/check`."""
+
+    server: NormocontrolServer
+
+    def _send_json(self, status: int, payload: dict) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        if urlparse(self.path).path != "/health":
+            self._send_json(404, {"error": "not found"})
+            return
+        repo_root = checker._resolve_repo_root()
+        self._send_json(200, {"status": "ok", "checker_version": checker._checker_version(repo_root)})
+
+    def do_POST(self) -> None:
+        url = urlparse(self.path)
+        if url.path != "/check":
+            self._send_json(404, {"error": "not found"})
+            return
+
+        length = int(self.headers.get("Content-Length") or 0)
+        if length <= 0:
+            self._send_json(400, {"error": "empty request body"})
+            return
+        if length > MAX_UPLOAD_BYTES:
+            self._send_json(413, {"error": f"request body exceeds {MAX_UPLOAD_BYTES} bytes"})
+            return
+        body = self.rfile.read(length)
+
+        content_type = (self.headers.get("Content-Type") or "").split(";", 1)[0].strip()
+        query = parse_qs(url.query)
+        standards = query.get("standards", [None])[0]
+        try:
+            if content_type == "application/json":
+                payload = self._check_path(body, standards)
+            else:
+                name = query.get("name", ["document.docx"])[0]
+                payload = self._check_upload(body, Path(name).name, standards)
+        except BadRequestError as exc:
+            self._send_json(400, {"error": str(exc)})
+            return
+        except Exception as exc:  # Keep the server alive on broken documents.
+            self._send_json(500, {"error": f"{type(exc).__name__}: {exc}"})
+            return
+
+        self._send_json(200, payload)
+
+    def _check_path(self, body: bytes, standards: str | None = None) -> dict:
+        """Check a document given by a local path in a JSON body."""
+
+        try:
+            request = json.loads(body.decode("utf-8"))
+        except ValueError as exc:
+            raise BadRequestError(f"invalid JSON body: {exc}") from exc
+        if not isinstance(request, dict) or not request.get("path"):
+            raise BadRequestError("expected JSON object with 'path'")
+
+        docx_path = Path(request["path"])
+        if not docx_path.is_absolute():
+            docx_path = checker._resolve_repo_root() / docx_path
+        if not docx_path.is_file():
+            raise BadRequestError(f"File not found: {docx_path}")
+        if docx_path.suffix.lower() != ".docx":
+            raise BadRequestError(f"Expected .docx file: {docx_path}")
+
+        standards = request.get("standards", standards)
+        if standards is not None and not isinstance(standards, str):
+            raise BadRequestError("'standards' must be a string")
+        _validate_standards(standards, docx_path.name)
+        return check_document(docx_path, self.server.report_dir, self.server.use_cache, standards=standards)
+
+    def _check_upload(self, body: bytes, name: str, standards: str | None = None) -> dict:
+        """Check an uploaded document (raw .docx bytes)."""
+
+        _validate_standards(standards, name)
+        with tempfile.TemporaryDirectory(prefix="normocontrol_") as tmp_dir:
+            docx_path = Path(tmp_dir) / "upload.docx"
+            docx_path.write_bytes(body)
+            return check_document(
+                docx_path, self.server.report_dir, self.server.use_cache, doc_name=name, standards=standards
+            )
+
+
+def _warm_up() -> None:
+    """Import heavy modules and parse the checklist once before serving."""
+
+    repo_root = checker._resolve_repo_root()
+    checker._ensure_tests_helpers_on_syspath(repo_root)
+
+    import tests.helpers.parsed_docx
+    import tests.helpers.result_cache
+
+    checker.load_it_normocontrol_config(checker._standards_md_path(repo_root))
+
+
+def main() -> int:
+    """CLI entrypoint."""
+
+    repo_root = checker._resolve_repo_root()
+
+    parser = argparse.ArgumentParser(description="Resident IT normocontrol check server")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Bind address (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port (default: {DEFAULT_PORT})")
+    parser.add_argument(
+        "--report-dir",
+        type=Path,
+        default=repo_root / "normocontrol_reports",
+        help="Directory for markdown reports and the result cache",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not update the result cache")
+    args = parser.parse_args()
+
+    _warm_up()
+
+    server = NormocontrolServer((args.host, args.port), args.report_dir, use_cache=not args.no_cache)
+    print(f"normocontrol-server listening on http://{args.host}:{server.server_port} (pid {os.getpid()})")
+    sys.stdout.flush()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
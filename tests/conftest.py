@@ -1,13 +1,24 @@
 """
 Pytest configuration and fixtures for normocontrol tests.
+
+Sample documents are parsed once per test session (per worker under
+pytest-xdist) and shared between tests through read-only `SampleDocument`
+views. With xdist, run `pytest -n auto --dist loadgroup` to keep the tests
+of one document on one worker; issues collected by the workers are merged
+into one report by the controller.
 """
 import pytest
+from dataclasses import asdict
+from functools import cached_property
 from pathlib import Path
-from tests.helpers.report import NormocontrolReport
+from typing import Dict, Tuple
+from tests.helpers.report import Issue, NormocontrolReport
 
 
 # Path to test documents
 TESTS_DIR = Path(__file__).parent
+REPO_ROOT = TESTS_DIR.parent
+CHECKER_DIR = REPO_ROOT / "scripts" / "standards_verification"
 
 # Global report instance
 _report = None
@@ -39,12 +50,32 @@ def pytest_configure(config):
     """Initialize the report before tests run."""
     global _report
     _report = NormocontrolReport()
+    config.addinivalue_line("markers", "xdist_group(name): run tests of one group on one xdist worker")
+
+
+def _is_xdist_worker(config) -> bool:
+    return hasattr(config, "workerinput")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Merge the issues collected by an xdist worker into the controller's report."""
+    output = getattr(node, "workeroutput", {})
+    for document in output.get("normocontrol_documents", []):
+        _report.add_document(document)
+    _report.add_issues(Issue(**issue) for issue in output.get("normocontrol_issues", []))
 
 
 def pytest_sessionfinish(session, exitstatus):
     """Generate reports after all tests complete."""
     global _report
     
+    if _is_xdist_worker(session.config):
+        # Workers hand their issues to the controller, which writes the report.
+        session.config.workeroutput["normocontrol_documents"] = list(_report.documents_checked)
+        session.config.workeroutput["normocontrol_issues"] = [asdict(issue) for issue in _report.issues]
+        return
+    
     if _report and len(_report.issues) > 0:
         # Get configuration
         report_format = session.config.getoption("--report-format")
@@ -55,21 +86,22 @@ def pytest_sessionfinish(session, exitstatus):
         from datetime import datetime
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        # Generate reports
+        # Generate reports (all requested formats in one pass)
+        targets = {}
         if report_format in ["markdown", "all"]:
-            md_path = report_dir / f"normocontrol_report_{timestamp}.md"
-            _report.to_markdown(md_path)
-            print(f"\n✓ Markdown report: {md_path}")
-        
+            targets["markdown"] = report_dir / f"normocontrol_report_{timestamp}.md"
         if report_format in ["json", "all"]:
-            json_path = report_dir / f"normocontrol_report_{timestamp}.json"
-            _report.to_json(json_path)
-            print(f"✓ JSON report: {json_path}")
-        
+            targets["json"] = report_dir / f"normocontrol_report_{timestamp}.json"
         if report_format in ["text", "all"]:
-            txt_path = report_dir / f"normocontrol_report_{timestamp}.txt"
-            _report.to_text(txt_path)
-            print(f"✓ Text report: {txt_path}")
+            targets["text"] = report_dir / f"normocontrol_report_{timestamp}.txt"
+        _report.write_reports(targets)
+        
+        if "markdown" in targets:
+            print(f"\n✓ Markdown report: {targets['markdown']}")
+        if "json" in targets:
+            print(f"✓ JSON report: {targets['json']}")
+        if "text" in targets:
+            print(f"✓ Text report: {targets['text']}")
         
         # Print summary
         summary = _report.generate_summary()
@@ -96,6 +128,58 @@ def collect_only(request):
     return request.config.getoption("--collect-only-report")
 
 
+class SampleDocument:
+    """
+    Read-only view of a sample document, parsed on first access.
+    
+    The XML tree and the python-docx document are shared by all tests of the
+    session: read them, never modify them. Parsing errors (e.g. a missing
+    file) are raised in the test that first touches a view.
+    """
+    
+    def __init__(self, path: Path):
+        self.path = path
+    
+    @property
+    def name(self) -> str:
+        return self.path.name
+    
+    @cached_property
+    def document_xml(self):
+        """Root of `word/document.xml` (lxml)."""
+        from tests.helpers.ooxml_utils import get_document_xml
+        return get_document_xml(self.path)
+    
+    @cached_property
+    def docx(self):
+        """python-docx `Document`."""
+        from docx import Document
+        return Document(self.path)
+    
+    @cached_property
+    def paragraph_texts(self) -> Tuple[str, ...]:
+        """Normalized texts of the body paragraphs (`ooxml_utils.get_paragraph_text`, as the checker sees them)."""
+        from tests.helpers.ooxml_utils import get_body_paragraph_texts
+        return tuple(get_body_paragraph_texts(self.document_xml))
+    
+    @cached_property
+    def text(self) -> str:
+        """Paragraph texts joined with newlines."""
+        return "\n".join(self.paragraph_texts)
+
+
+@pytest.fixture(scope="session")
+def sample_documents() -> Dict[str, SampleDocument]:
+    """Session cache of parsed sample documents by file name (one per xdist worker)."""
+    return {}
+
+
+def _sample_document(cache: Dict[str, SampleDocument], path: Path) -> SampleDocument:
+    if path.name not in cache:
+        cache[path.name] = SampleDocument(path)
+    return cache[path.name]
+
+
 @pytest.fixture
 def pz_docx():
     """Path to ПЗ.docx test document."""
@@ -125,10 +209,38 @@ def all_test_docs():
 
 
 @pytest.fixture(params=[
-    "ПЗ.docx",
-    "Приложение А.docx",
-    "Приложение Б.docx",
+    pytest.param(name, marks=pytest.mark.xdist_group(name))
+    for name in ["ПЗ.docx", "Приложение А.docx", "Приложение Б.docx"]
 ])
 def any_docx(request):
     """Parametrized fixture that runs test on each document."""
     return TESTS_DIR / request.param
+
+
+@pytest.fixture
+def any_document(any_docx, sample_documents) -> SampleDocument:
+    """Parsed view of `any_docx` (shared for the session)."""
+    return _sample_document(sample_documents, any_docx)
+
+
+@pytest.fixture
+def pz_document(pz_docx, sample_documents) -> SampleDocument:
+    """Parsed view of ПЗ.docx (shared for the session)."""
+    return _sample_document(sample_documents, pz_docx)
+
+
+@pytest.fixture(scope="session")
+def checker():
+    """The `check_it_docx` module (the checker script directory is put on sys.path)."""
+    import sys
+    if str(CHECKER_DIR) not in sys.path:
+        sys.path.insert(0, str(CHECKER_DIR))
+    import check_it_docx
+    return check_it_docx
+
+
+@pytest.fixture(scope="session")
+def synthetic_docx(tmp_path_factory) -> Path:
+    """Small synthetic explanatory note (`benchmarks/synthetic_docx.py`), generated once per session."""
+    from benchmarks.synthetic_docx import generate_docx
+    return generate_docx(tmp_path_factory.mktemp("synthetic") / "Пояснительная_записка.docx", pages=12)
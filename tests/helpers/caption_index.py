@@ -0,0 +1,337 @@
+"""
+Figure, table and caption index of a document.
+
+`CaptionIndex` is a facts-aware scanner visitor (see `ooxml_scan`) that
+records, in the single streaming pass:
+
+- figures — body-level paragraphs holding a picture, chart, diagram or
+  embedded object;
+- tables — top-level `w:tbl` elements (a table preceded by «Продолжение
+  таблицы N» continues the previous one);
+- captions — body-level paragraphs starting with «Рисунок N –»/«Таблица N –»,
+  attached to the adjacent object (below a figure, above a table; the
+  opposite placement is recorded as misplaced);
+- mentions — «рисунок 3», «рис. 2.1», «таблицы 1 и 2», «табл. 4–5» in any
+  paragraph except captions and «Продолжение таблицы N» lines, which do
+  not refer to their own object («Таблица 3.1 содержит…» does).
+
+Numbering continuity, caption placement, uncaptioned objects and
+unreferenced captions are then answered from these tables. Ordinals come
+from a `ParagraphIndex` visited before this index.
+"""
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from lxml import etree
+
+from tests.helpers.ooxml_utils import NS, get_paragraph_text
+
+
+FIGURE = "figure"
+TABLE = "table"
+
+# A caption has a separator (or nothing) after its number: «Таблица 3.1 содержит…» is a mention.
+_CAPTION_RE = re.compile(r"^(рисунок|таблица)\s+(\d+(?:\.\d+)*)(?!\.?\d)\s*(?:[—–.:-]|$)", re.IGNORECASE)
+_CONTINUATION_RE = re.compile(r"^продолжение\s+таблицы\b", re.IGNORECASE)
+_MENTION_RE = re.compile(
+    r"\b(рис(?:\.|ун[а-яё]*)|табл(?:\.|иц[а-яё]*))\s*(?:№\s*)?"
+    r"(\d+(?:\.\d+)*(?:\s*(?:,|и|[–—-])\s*\d+(?:\.\d+)*)*)",
+    re.IGNORECASE,
+)
+_MENTION_PART_RE = re.compile(r"(\d+(?:\.\d+)*)(?:\s*([–—-])\s*(\d+(?:\.\d+)*))?")
+
+MAX_RANGE = 50
+MAX_CAPTION_LENGTH = 200
+
+_W_BODY = f"{{{NS['w']}}}body"
+_W_TBL = f"{{{NS['w']}}}tbl"
+_A_GRAPHIC_DATA = "{http://schemas.openxmlformats.org/drawingml/2006/main}graphicData"
+_V_IMAGEDATA = "{urn:schemas-microsoft-com:vml}imagedata"
+_W_OBJECT = f"{{{NS['w']}}}object"
+# a:graphicData kinds that are figures (text boxes and shapes are not).
+_FIGURE_GRAPHICS = ("/picture", "/chart", "/diagram")
+
+
+def parse_mentions(text: str) -> List[List[str]]:
+    """[kind, number] of every figure/table mentioned in a text, in order of appearance."""
+    mentions = []
+    for match in _MENTION_RE.finditer(text):
+        kind = FIGURE if match.group(1).lower().startswith("рис") else TABLE
+        for part in _MENTION_PART_RE.finditer(match.group(2)):
+            first, dash, last = part.groups()
+            if dash and first.isdigit() and last.isdigit() and 0 < int(last) - int(first) <= MAX_RANGE:
+                mentions.extend([kind, str(number)] for number in range(int(first), int(last) + 1))
+            else:
+                mentions.append([kind, first])
+                if last:
+                    mentions.append([kind, last])
+    return mentions
+
+
+def number_key(number: str) -> Tuple[int, ...]:
+    """Caption number as a tuple of ints: "2.3" → (2, 3)."""
+    return tuple(int(part) for part in number.split("."))
+
+
+def numbering_gaps(numbers: List[str]) -> List[int]:
+    """
+    Positions of the numbers that break continuous numbering.
+
+    Numbering is either document-wide (1, 2, 3…) or per section (1.1, 1.2,
+    2.1…); the first number must be 1 (or N.1) and each next one continues
+    it. Numbers of a different depth than the first one are breaks too.
+    """
+    gaps: List[int] = []
+    previous: Optional[Tuple[int, ...]] = None
+    for position, number in enumerate(numbers):
+        key = number_key(number)
+        if previous is None:
+            valid = key[-1] == 1
+        elif len(key) != len(previous):
+            valid = False
+        elif len(key) == 1:
+            valid = key[0] == previous[0] + 1
+        else:
+            same_section = key[:-1] == previous[:-1]
+            valid = key[-1] == previous[-1] + 1 if same_section else key[:-1] > previous[:-1] and key[-1] == 1
+        if not valid:
+            gaps.append(position)
+        previous = key
+    return gaps
+
+
+@dataclass
+class Caption:
+    """A «Рисунок N …» / «Таблица N …» paragraph."""
+
+    kind: str
+    number: str
+    text: str
+    ordinal: int
+    # Index of the captioned object in `CaptionIndex.objects`, if any.
+    target: Optional[int] = None
+    # True if the caption is on the wrong side of its object.
+    misplaced: bool = False
+
+
+@dataclass
+class CaptionedObject:
+    """A figure or a top-level table."""
+
+    kind: str
+    ordinal: int
+    # Index of its caption in `CaptionIndex.captions`, if any.
+    caption: Optional[int] = None
+    # Paragraph ordinal of the enclosing heading (-1 before the first heading).
+    heading: int = -1
+
+
+class CaptionIndex:
+    """
+    Scanner visitor building figure/table/caption tables and in-text mentions.
+
+    Captions are attached in body order: a figure caption to the figure right
+    before it, a table caption to the table right after it. A figure caption
+    followed by an uncaptioned figure, or a table caption following an
+    uncaptioned table and not followed by another table, is attached as
+    misplaced. Empty paragraphs are skipped when looking for neighbours.
+
+    Args:
+        index: `ParagraphIndex` visited before this index
+    """
+
+    facts_name = "captions"
+
+    def __init__(self, index):
+        self._index = index
+
+        self.objects: List[CaptionedObject] = []
+        self.captions: List[Caption] = []
+        # Body-level lines starting with «рисунок»/«таблица» (any format): (kind, text, ordinal).
+        self.caption_lines: List[Tuple[str, str, int]] = []
+        # (kind, number) → ordinals of the paragraphs mentioning it.
+        self.mentions: Dict[Tuple[str, str], List[int]] = {}
+
+        # Previous non-empty body-level block: ("figure"|"table", object index),
+        # ("caption", caption index), ("continuation", -1) or ("text", -1).
+        self._last_block: Tuple[str, int] = ("text", -1)
+        # Block before the most recent caption (a table caption may belong to a table above it).
+        self._block_before_caption: Tuple[str, int] = ("text", -1)
+        self._table: Optional[etree._Element] = None
+        # Index in `objects` of the top-level table holding the last visited paragraph, if any
+        # (read by scanner visitors visited after this index, e.g. per-table checks).
+        self.current_table: Optional[int] = None
+
+    def paragraph_facts(self, paragraph: etree._Element) -> Optional[List]:
+        """[body level, figure, caption line, mentions] of a paragraph, None if it has no text and no figure."""
+        parent = paragraph.getparent()
+        body_level = parent is not None and parent.tag == _W_BODY
+        figure = body_level and _has_figure(paragraph)
+        text = get_paragraph_text(paragraph).strip()
+        if not text and not figure:
+            return None
+
+        lower = text.lower()
+        caption_line = None
+        if body_level and (lower.startswith("рисунок") or lower.startswith("таблица")):
+            caption_line = text[:MAX_CAPTION_LENGTH]
+        elif body_level and _CONTINUATION_RE.match(text):
+            caption_line = ""
+        if caption_line is None or (caption_line and _CAPTION_RE.match(text) is None):
+            mentions = parse_mentions(text)
+        else:
+            mentions = []
+        return [body_level, figure, caption_line, mentions]
+
+    def visit_paragraph_facts(self, paragraph: etree._Element, facts: Optional[List]) -> None:
+        """Place the paragraph in the body flow and record its mentions."""
+        ordinal = self._index.last
+        parent = paragraph.getparent()
+        if parent is not None and parent.tag != _W_BODY:
+            self._visit_nested(paragraph, ordinal)
+        else:
+            self._table = None
+            self.current_table = None
+
+        if facts is None:
+            return
+        body_level, figure, caption_line, mentions = facts
+
+        for kind, number in mentions:
+            ordinals = self.mentions.setdefault((kind, number), [])
+            if not ordinals or ordinals[-1] != ordinal:
+                ordinals.append(ordinal)
+
+        if not body_level:
+            return
+        if figure:
+            self._add_figure(ordinal)
+            if caption_line:
+                self._add_caption(caption_line, ordinal)  # picture and caption in one paragraph
+        elif caption_line == "":
+            self._resolve_pending_caption()
+            self._last_block = ("continuation", -1)
+        elif caption_line is not None:
+            self._add_caption(caption_line, ordinal)
+        else:
+            self._resolve_pending_caption()
+            self._last_block = ("text", -1)
+
+    def _visit_nested(self, paragraph: etree._Element, ordinal: int) -> None:
+        """Start a new table object at the first paragraph of a top-level table."""
+        table = None
+        element = paragraph.getparent()
+        while element is not None and element.tag != _W_BODY:
+            if element.tag == _W_TBL:
+                table = element
+            element = element.getparent()
+        if table is None:
+            self.current_table = None
+            return
+        if table is self._table:
+            return
+        self._table = table
+
+        if self._last_block[0] == "continuation":
+            self._last_block = ("table", len(self.objects) - 1)
+            continued = self.objects[-1] if self.objects else None
+            self.current_table = len(self.objects) - 1 if continued is not None and continued.kind == TABLE else None
+            return
+        self.objects.append(CaptionedObject(TABLE, ordinal, heading=self._index.heading_of[ordinal]))
+        self.current_table = len(self.objects) - 1
+        kind, position = self._last_block
+        if kind == "caption":
+            caption = self.captions[position]
+            if caption.kind == TABLE and caption.target is None:
+                self._attach(position, len(self.objects) - 1, misplaced=False)
+            else:
+                self._resolve_pending_caption()
+        self._last_block = ("table", len(self.objects) - 1)
+
+    def _add_figure(self, ordinal: int) -> None:
+        self.objects.append(CaptionedObject(FIGURE, ordinal, heading=self._index.heading_of[ordinal]))
+        kind, position = self._last_block
+        if kind == "caption":
+            caption = self.captions[position]
+            if caption.kind == FIGURE and caption.target is None:
+                self._attach(position, len(self.objects) - 1, misplaced=True)
+            else:
+                self._resolve_pending_caption()
+        self._last_block = ("figure", len(self.objects) - 1)
+
+    def _add_caption(self, line: str, ordinal: int) -> None:
+        kind = FIGURE if line.lower().startswith("рисунок") else TABLE
+        self.caption_lines.append((kind, line, ordinal))
+        self._resolve_pending_caption()
+        match = _CAPTION_RE.match(line)
+        if match is None:
+            self._last_block = ("text", -1)
+            return
+
+        self.captions.append(Caption(kind, match.group(2), line, ordinal))
+        position = len(self.captions) - 1
+        block, target = self._block_before_caption = self._last_block
+        if kind == FIGURE and block == FIGURE and self.objects[target].caption is None:
+            self._attach(position, target, misplaced=False)
+        self._last_block = ("caption", position)
+
+    def _resolve_pending_caption(self) -> None:
+        """A table caption not followed by a table belongs to an uncaptioned table right before it."""
+        kind, position = self._last_block
+        if kind != "caption":
+            return
+        caption = self.captions[position]
+        if caption.kind != TABLE or caption.target is not None:
+            return
+        previous = self.objects[-1] if self.objects else None
+        if (
+            previous is not None
+            and previous.kind == TABLE
+            and previous.caption is None
+            and self._block_before_caption == ("table", len(self.objects) - 1)
+        ):
+            self._attach(position, len(self.objects) - 1, misplaced=True)
+
+    def _attach(self, caption: int, target: int, misplaced: bool) -> None:
+        self.captions[caption].target = target
+        self.captions[caption].misplaced = misplaced
+        self.objects[target].caption = caption
+
+    def misplaced(self, kind: str) -> List[Caption]:
+        """Captions of one kind on the wrong side of their object (above a figure, below a table)."""
+        self._resolve_pending_caption()  # a table caption may end the document
+        return [caption for caption in self.captions if caption.kind == kind and caption.misplaced]
+
+    def of_kind(self, kind: str) -> List[Caption]:
+        """Captions of one kind in document order."""
+        return [caption for caption in self.captions if caption.kind == kind]
+
+    def unreferenced(self, kind: str) -> List[Caption]:
+        """Captions of one kind whose number is never mentioned in the text."""
+        return [caption for caption in self.captions if caption.kind == kind and (kind, caption.number) not in self.mentions]
+
+    def uncaptioned(self, kind: str, before: Optional[int] = None) -> List[CaptionedObject]:
+        """
+        Objects of one kind without a caption, after the first heading.
+
+        Objects before the first heading are title page layout; with
+        `before`, objects from that paragraph ordinal on (e.g. the sheets
+        after the list of sources) are skipped too.
+        """
+        self._resolve_pending_caption()
+        return [
+            obj for obj in self.objects
+            if obj.kind == kind and obj.caption is None and obj.heading >= 0
+            and (before is None or obj.ordinal < before)
+        ]
+
+
+def _has_figure(paragraph: etree._Element) -> bool:
+    """True if a paragraph holds a picture, chart, diagram, VML image or embedded object."""
+    for element in paragraph.iter(_A_GRAPHIC_DATA, _V_IMAGEDATA, _W_OBJECT):
+        if element.tag != _A_GRAPHIC_DATA:
+            return True
+        if (element.get("uri") or "").endswith(_FIGURE_GRAPHICS):
+            return True
+    return False
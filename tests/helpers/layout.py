@@ -0,0 +1,382 @@
+"""
+Render-free page layout estimator for .docx documents.
+
+Approximates line and page breaks from the OOXML paragraph/run model without
+running a word processor:
+- usable page area comes from w:sectPr (page size minus margins);
+- line height and characters per line come from average Times New Roman
+  metrics for the paragraph font size;
+- explicit page breaks (w:br type="page", w:pageBreakBefore, section breaks)
+  always start a new page, and w:lastRenderedPageBreak markers left by Word
+  re-synchronise the estimate with Word's own pagination.
+
+`LayoutEstimator` is a facts-aware scanner visitor (see `ooxml_scan`): after
+each paragraph it exposes the page on which the paragraph starts, so
+later visitors in the same pass can run page-aware checks.
+"""
+import math
+from dataclasses import dataclass
+from typing import Optional
+
+from lxml import etree
+
+from tests.helpers.ooxml_utils import NS, get_paragraph_properties, parse_page_margins, parse_page_size
+
+
+# Times New Roman: ascent + descent ≈ 1.15 em (Word's "single" line height);
+# average advance of mixed Cyrillic/Latin text with spaces ≈ 0.47 em.
+LINE_HEIGHT_EM = 1.15
+AVG_CHAR_WIDTH_EM = 0.47
+
+EMU_PER_PT = 12700
+TWIPS_PER_PT = 20
+
+_W = NS['w']
+_WP = NS['wp']
+W_P = f"{{{_W}}}p"
+W_R = f"{{{_W}}}r"
+W_T = f"{{{_W}}}t"
+W_BR = f"{{{_W}}}br"
+W_RPR = f"{{{_W}}}rPr"
+W_SZ = f"{{{_W}}}sz"
+W_TC = f"{{{_W}}}tc"
+W_TR = f"{{{_W}}}tr"
+W_TBL = f"{{{_W}}}tbl"
+W_BODY = f"{{{_W}}}body"
+W_TXBX_CONTENT = f"{{{_W}}}txbxContent"
+W_LAST_RENDERED_PAGE_BREAK = f"{{{_W}}}lastRenderedPageBreak"
+WP_EXTENT = f"{{{_WP}}}extent"
+_W_TYPE = f"{{{_W}}}type"
+_W_VAL = f"{{{_W}}}val"
+_W_W = f"{{{_W}}}w"
+
+_XP_PAGE_BREAK_BEFORE = etree.XPath("w:pPr/w:pageBreakBefore", namespaces=NS)
+_XP_SECT_PR = etree.XPath("w:pPr/w:sectPr", namespaces=NS)
+_XP_GRID_COLS = etree.XPath("w:tblGrid/w:gridCol", namespaces=NS)
+_XP_TC_WIDTH = etree.XPath("w:tcPr/w:tcW", namespaces=NS)
+
+
+@dataclass(frozen=True)
+class PageGeometry:
+    """Usable text area of a page, in points."""
+    text_width_pt: float
+    text_height_pt: float
+
+    @classmethod
+    def from_mm(cls, width_mm: float, height_mm: float,
+                left_mm: float, right_mm: float, top_mm: float, bottom_mm: float) -> "PageGeometry":
+        """Build geometry from page size and margins in millimeters."""
+        pt_per_mm = 72 / 25.4
+        return cls(
+            text_width_pt=(width_mm - left_mm - right_mm) * pt_per_mm,
+            text_height_pt=(height_mm - top_mm - bottom_mm) * pt_per_mm,
+        )
+
+    @classmethod
+    def from_sect_pr(cls, sect_pr: etree._Element, fallback: "PageGeometry") -> "PageGeometry":
+        """Build geometry from a w:sectPr element (missing parts fall back)."""
+        size = parse_page_size(sect_pr)
+        margins = parse_page_margins(sect_pr) or {}
+        if not size or not size['width'] or not size['height']:
+            return fallback
+        width = size['width'] - margins.get('left', 0) - margins.get('right', 0) - margins.get('gutter', 0)
+        height = size['height'] - margins.get('top', 0) - margins.get('bottom', 0)
+        if width <= 0 or height <= 0:
+            return fallback
+        return cls(text_width_pt=width / TWIPS_PER_PT, text_height_pt=height / TWIPS_PER_PT)
+
+
+def _int_attr(element: Optional[etree._Element], attr: str) -> Optional[int]:
+    """Read an integer w: attribute, tolerating missing/garbage values."""
+    if element is None:
+        return None
+    return _to_int(element.get(f"{{{_W}}}{attr}"))
+
+
+def _to_int(value: Optional[str]) -> Optional[int]:
+    """Parse an OOXML integer value, tolerating missing/garbage values."""
+    if value is None:
+        return None
+    try:
+        return int(round(float(value)))
+    except ValueError:
+        return None
+
+
+class LayoutEstimator:
+    """
+    Scanner visitor estimating on which page every paragraph starts.
+
+    After paragraph `p` is visited the attributes `last_page` and
+    `last_at_page_top` describe paragraph `p`; `page_count` is the running
+    estimate of the number of pages.
+
+    With a `StyleResolver` the estimate uses effective (style-inherited)
+    spacing, indents, page breaks and font sizes; without one only direct
+    formatting is seen.
+    """
+
+    facts_name = "layout"
+
+    def __init__(self, geometry: PageGeometry, default_font_size_pt: float = 14.0, styles=None):
+        self.geometry = geometry
+        self.default_font_size_pt = default_font_size_pt
+        self.styles = styles
+
+        self.page = 1
+        self.used_pt = 0.0
+        # True once the current page holds visible content (text/drawing).
+        self.page_has_content = False
+        # Page started by the last explicit or rendered break; estimated
+        # overflow pages after it are discarded when Word's next rendered
+        # break arrives.
+        self._sync_page = 1
+        self.rendered_breaks = 0
+
+        self.last_page = 1
+        self.last_at_page_top = True
+
+        # Table rows are placed as whole blocks once complete.
+        self._row = None
+        self._cell = None
+        self._cell_height = 0.0
+        self._row_height = 0.0
+
+    @property
+    def page_count(self) -> int:
+        """Estimated number of pages so far."""
+        return self.page
+
+    # -- page flow ---------------------------------------------------------
+
+    def _new_page(self) -> None:
+        self.page += 1
+        self.used_pt = 0.0
+        self.page_has_content = False
+
+    def _explicit_break(self) -> None:
+        """Page break requested by the document (always starts a new page)."""
+        if self.used_pt > 0 or self.page_has_content:
+            self._new_page()
+        self._sync_page = self.page
+
+    def _rendered_break(self) -> None:
+        """Word's own page break marker: the page after the last sync point starts here."""
+        self.rendered_breaks += 1
+        if self.page == self._sync_page and not self.page_has_content:
+            return  # Already on a fresh page (e.g. right after an explicit break).
+        self.page = self._sync_page
+        self._new_page()
+        self._sync_page = self.page
+
+    def _place(self, height_pt: float) -> None:
+        """Advance the flow by a block, spilling over to following pages."""
+        page_height = self.geometry.text_height_pt
+        self.used_pt += height_pt
+        while self.used_pt > page_height:
+            self.used_pt -= page_height
+            self.page += 1
+            self.page_has_content = False
+
+    # -- tables ------------------------------------------------------------
+
+    def _flush_row(self) -> None:
+        if self._row is None:
+            return
+        self._place(max(self._row_height, self._cell_height))
+        self._row = None
+        self._cell = None
+        self._cell_height = 0.0
+        self._row_height = 0.0
+
+    def _cell_width(self, cell: etree._Element) -> float:
+        """Width of a table cell in points (tcW or an even share of the grid)."""
+        tc_w = _XP_TC_WIDTH(cell)
+        if tc_w and tc_w[0].get(_W_TYPE, "dxa") == "dxa":
+            width = _int_attr(tc_w[0], "w")
+            if width:
+                return width / TWIPS_PER_PT
+        table = cell.getparent().getparent() if cell.getparent() is not None else None
+        columns = len(_XP_GRID_COLS(table)) if table is not None and table.tag == W_TBL else 1
+        return self.geometry.text_width_pt / max(1, columns)
+
+    # -- visitor hooks -----------------------------------------------------
+
+    def visit_section(self, sect_pr: etree._Element) -> None:
+        """A section ends: adopt its geometry for what follows (best guess)."""
+        self.geometry = PageGeometry.from_sect_pr(sect_pr, self.geometry)
+
+    def paragraph_facts(self, paragraph: etree._Element) -> dict:
+        """Layout metrics of a paragraph that do not depend on its position in the flow."""
+        props, base_font_size = self._paragraph_properties(paragraph)
+
+        font_size = 0.0
+        segments = [0]  # characters per segment between page breaks
+        breaks = []  # 'page' or 'rendered' between segments
+        drawing_height = 0.0
+        for element in paragraph.iter(W_T, W_BR, W_SZ, W_LAST_RENDERED_PAGE_BREAK, WP_EXTENT):
+            tag = element.tag
+            if tag == W_T:
+                segments[-1] += len(element.text or "")
+            elif tag == W_SZ:
+                parent = element.getparent()
+                if parent is not None and parent.tag == W_RPR and parent.getparent().tag == W_R:
+                    size = _int_attr(element, "val")
+                    if size:
+                        font_size = max(font_size, size / 2)
+            elif tag == W_BR:
+                if element.get(_W_TYPE) == "page":
+                    breaks.append("page")
+                    segments.append(0)
+            elif tag == W_LAST_RENDERED_PAGE_BREAK:
+                breaks.append("rendered")
+                segments.append(0)
+            else:
+                try:
+                    drawing_height += int(element.get("cy") or 0) / EMU_PER_PT
+                except ValueError:
+                    pass
+
+        font_size = font_size or base_font_size
+        spacing = props.get('spacing') or {}
+
+        section_break = False
+        sect_pr = _XP_SECT_PR(paragraph)
+        if sect_pr:
+            section_type = sect_pr[0].find("w:type", namespaces=NS)
+            section_break = section_type is None or section_type.get(_W_VAL) != "continuous"
+
+        return {
+            'page_break_before': bool(props.get('pageBreakBefore')),
+            'segments': segments,
+            'breaks': breaks,
+            'drawing_height': drawing_height,
+            'font_size': font_size,
+            'line_height': self._line_height(spacing, font_size),
+            'first_line_chars': self._first_line_indent_chars(props.get('ind') or {}, font_size),
+            'before': (_to_int(spacing.get('before')) or 0) / TWIPS_PER_PT,
+            'after': (_to_int(spacing.get('after')) or 0) / TWIPS_PER_PT,
+            'section_break': section_break,
+        }
+
+    def visit_paragraph(self, paragraph: etree._Element) -> None:
+        """Place a paragraph into the page flow."""
+        self.visit_paragraph_facts(paragraph, self.paragraph_facts(paragraph))
+
+    def visit_paragraph_facts(self, paragraph: etree._Element, facts: dict) -> None:
+        """Place a paragraph described by `paragraph_facts` into the page flow."""
+        container = paragraph.getparent()
+        # Text box content floats over the page and does not consume flow height.
+        for ancestor in paragraph.iterancestors(W_TXBX_CONTENT, W_BODY):
+            if ancestor.tag == W_TXBX_CONTENT:
+                self.last_page = self.page
+                self.last_at_page_top = not self.page_has_content
+                return
+            break
+
+        in_table = container is not None and container.tag == W_TC
+        if in_table:
+            row = container.getparent()
+            if row is not self._row:
+                self._flush_row()
+                self._row = row
+            if container is not self._cell:
+                self._row_height = max(self._row_height, self._cell_height)
+                self._cell_height = 0.0
+                self._cell = container
+            width = self._cell_width(container)
+        else:
+            self._flush_row()
+            width = self.geometry.text_width_pt
+
+        if facts['page_break_before'] and not in_table:
+            self._explicit_break()
+
+        segments = facts['segments']
+        breaks = facts['breaks']
+        drawing_height = facts['drawing_height']
+        line_height = facts['line_height']
+        chars_per_line = max(1, int(width / (facts['font_size'] * AVG_CHAR_WIDTH_EM)))
+        first_line_chars = facts['first_line_chars']
+        before = facts['before']
+        after = facts['after']
+
+        if in_table:
+            lines = sum(
+                math.ceil((chars + (first_line_chars if i == 0 else 0)) / chars_per_line) or 1
+                for i, chars in enumerate(segments)
+            )
+            self._cell_height += before + max(lines * line_height, drawing_height) + after
+            self.last_page = self.page
+            self.last_at_page_top = False
+            return
+
+        last_index = len(segments) - 1
+        started = False
+        for index, chars in enumerate(segments):
+            if index > 0:
+                if breaks[index - 1] == "page":
+                    self._explicit_break()
+                else:
+                    self._rendered_break()
+
+            indent = first_line_chars if index == 0 else 0
+            lines = math.ceil((chars + indent) / chars_per_line) if chars else 0
+            height = lines * line_height
+            visible = bool(chars) or (index == 0 and drawing_height > 0)
+            if index == 0:
+                height = max(height, drawing_height)
+
+            if not started and (visible or index == last_index):
+                # The paragraph's first line lands here.
+                if self.used_pt + line_height > self.geometry.text_height_pt:
+                    self._new_page()
+                self.last_page = self.page
+                self.last_at_page_top = not self.page_has_content
+                self._place(before)
+                # An empty paragraph still occupies one line; the empty tail
+                # after a page break stays with the break on the previous page.
+                if index == 0:
+                    height = height or line_height
+                started = True
+
+            self._place(height)
+            if visible:
+                self.page_has_content = True
+        self._place(after)
+
+        if facts['section_break']:
+            self._explicit_break()
+
+    def _paragraph_properties(self, paragraph: etree._Element):
+        """Paragraph properties (effective with a style resolver) and the paragraph's base font size."""
+        if self.styles is not None:
+            props = self.styles.paragraph_properties(paragraph)
+            size = self.styles.default_run_properties(props.get('style')).get('sz')
+            return props, (size / 2 if size else self.default_font_size_pt)
+
+        props = get_paragraph_properties(paragraph)
+        page_break_before = _XP_PAGE_BREAK_BEFORE(paragraph)
+        if page_break_before:
+            props['pageBreakBefore'] = page_break_before[0].get(_W_VAL, "true") not in ("0", "false", "off")
+        return props, self.default_font_size_pt
+
+    def _line_height(self, spacing: dict, font_size: float) -> float:
+        """Line height in points from w:spacing (auto = multiple of single)."""
+        single = font_size * LINE_HEIGHT_EM
+        line = _to_int(spacing.get('line'))
+        if not line:
+            return single
+        rule = spacing.get('lineRule') or "auto"
+        if rule == "auto":
+            return single * line / 240
+        if rule == "exact":
+            return line / TWIPS_PER_PT
+        return max(single, line / TWIPS_PER_PT)  # atLeast
+
+    def _first_line_indent_chars(self, ind: dict, font_size: float) -> int:
+        """First-line indent expressed in average characters."""
+        first_line = _to_int(ind.get('firstLine'))
+        if not first_line or first_line < 0:
+            return 0
+        return int(first_line / TWIPS_PER_PT / (font_size * AVG_CHAR_WIDTH_EM))
@@ -0,0 +1,108 @@
+"""
+Single-pass streaming scanner for the main part of a .docx document.
+
+`word/document.xml` is walked once with `lxml.etree.iterparse`; every
+paragraph, run and section-properties element is dispatched to the
+registered visitors, and processed paragraphs are cleared right away so
+peak memory stays flat regardless of document size.
+
+Visitors are plain objects exposing any subset of:
+- `visit_run(run)` — called when a `w:r` element is complete
+- `visit_paragraph(paragraph)` — called when a `w:p` element is complete
+  (after all of its runs)
+- `visit_section(sect_pr)` — called for every `w:sectPr` in document order
+
+Facts-aware visitors split their paragraph work in two:
+- `paragraph_facts(paragraph)` derives JSON-serializable data from the
+  paragraph alone (and the kind of its parent element);
+- `visit_paragraph_facts(paragraph, facts)` consumes it in document context.
+A `facts_name` attribute names the visitor's slot in the incremental facts
+cache (`paragraph_facts.ParagraphFactsCache`); with a cache, facts of
+unchanged paragraphs are reused instead of being derived again.
+"""
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterable, Optional
+
+from lxml import etree
+
+from tests.helpers.ooxml_utils import NS, DocxArchive
+
+
+W_P = f"{{{NS['w']}}}p"
+W_R = f"{{{NS['w']}}}r"
+W_SECT_PR = f"{{{NS['w']}}}sectPr"
+
+_HOOKS = {
+    W_R: "visit_run",
+    W_P: "visit_paragraph",
+    W_SECT_PR: "visit_section",
+}
+
+
+def _facts_hook(visitor: object, facts) -> Callable:
+    """Paragraph hook of a facts-aware visitor (facts derived or taken from the cache)."""
+    derive = visitor.paragraph_facts
+    visit = visitor.visit_paragraph_facts
+    if facts is None:
+        return lambda paragraph: visit(paragraph, derive(paragraph))
+    lookup = facts.lookup
+    name = visitor.facts_name
+    return lambda paragraph: visit(paragraph, lookup(name, paragraph, derive))
+
+
+def _collect_hooks(visitors: Iterable[object], facts=None) -> dict:
+    """Map each scanned tag to the bound visitor methods interested in it."""
+    dispatch = {tag: [] for tag in _HOOKS}
+    for visitor in visitors:
+        for tag, hook in _HOOKS.items():
+            if tag == W_P and hasattr(visitor, "paragraph_facts"):
+                dispatch[tag].append(_facts_hook(visitor, facts))
+                continue
+            method = getattr(visitor, hook, None)
+            if method is not None:
+                dispatch[tag].append(method)
+    return dispatch
+
+
+def scan_stream(stream: BinaryIO, visitors: Iterable[object], facts=None) -> None:
+    """
+    Scan a document.xml byte stream once and dispatch elements to visitors.
+
+    Args:
+        stream: Binary file-like object with the content of `word/document.xml`
+        visitors: Objects implementing any of the `visit_*` hooks
+        facts: Optional `ParagraphFactsCache` prepared for this stream
+    """
+    dispatch = _collect_hooks(visitors, facts)
+    run_hooks = dispatch[W_R]
+    paragraph_hooks = dispatch[W_P]
+    section_hooks = dispatch[W_SECT_PR]
+    next_paragraph: Optional[Callable] = facts.next_paragraph if facts is not None else None
+
+    for _, elem in etree.iterparse(stream, events=("end",), tag=tuple(_HOOKS)):
+        tag = elem.tag
+        if tag == W_R:
+            for hook in run_hooks:
+                hook(elem)
+        elif tag == W_SECT_PR:
+            for hook in section_hooks:
+                hook(elem)
+        else:
+            if next_paragraph is not None:
+                next_paragraph(elem)
+            for hook in paragraph_hooks:
+                hook(elem)
+            # The paragraph (with its runs) is fully processed: drop it and any
+            # already visited siblings so the tree never grows past one paragraph.
+            elem.clear(keep_tail=True)
+            parent = elem.getparent()
+            if parent is not None:
+                while elem.getprevious() is not None:
+                    del parent[0]
+
+
+def scan_document(docx_path: Path, visitors: Iterable[object]) -> None:
+    """Stream `word/document.xml` out of a .docx archive through `scan_stream`."""
+    with DocxArchive(docx_path) as z:
+        with z.open("word/document.xml") as stream:
+            scan_stream(stream, visitors)
@@ -2,11 +2,15 @@
 Utilities for working with OOXML (Office Open XML) documents.
 
 Provides functions for:
-- Loading XML from .docx files
+- Loading XML from .docx files (memory-mapped archive, streamed parts)
 - Converting units (twips ↔ mm, pt ↔ half-points)
 - Extracting formatting properties (margins, spacing, indents)
+- Extracting normalized paragraph text (one extractor for all checks)
 """
+import mmap
+import re
 import zipfile
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional, Dict, Any
 from lxml import etree
@@ -60,6 +64,84 @@ def half_points_to_pt(half_points: int) -> float:
     return half_points / 2
 
 
+class _MappedFile:
+    """Seekable read-only file object over a memory map (`mmap` lacks `seekable` before Python 3.13)."""
+
+    def __init__(self, mapped: mmap.mmap):
+        self._map = mapped
+
+    def read(self, size: int = -1) -> bytes:
+        return self._map.read(size)
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        try:
+            self._map.seek(offset, whence)
+        except ValueError as exc:
+            # Match regular files (zipfile treats OSError as "not a zip file").
+            raise OSError(str(exc)) from exc
+        return self._map.tell()
+
+    def tell(self) -> int:
+        return self._map.tell()
+
+    def seekable(self) -> bool:
+        return True
+
+
+class DocxArchive(zipfile.ZipFile):
+    """
+    Read-only .docx archive over a memory map of the file.
+
+    Only the central directory and the members actually opened are paged
+    in, so embedded media (`word/media/*`) never reaches memory unless read
+    explicitly. Members should be consumed as streams (`open`, `parse_part`)
+    rather than `read`, so memory scales with the XML being parsed, not with
+    the archive.
+    """
+
+    def __init__(self, docx_path: Path):
+        # ZipFile.__del__ calls close() even if construction fails half-way.
+        self.fp = None
+        self._map = None
+        self._file = None
+        self._file = open(docx_path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            self._map = None  # Empty or unmappable file: zipfile reports the real error.
+        try:
+            super().__init__(_MappedFile(self._map) if self._map is not None else self._file, 'r')
+        except BaseException:
+            self._release()
+            raise
+
+    def _release(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def close(self) -> None:
+        """Close the archive, the memory map and the file."""
+        try:
+            super().close()
+        finally:
+            self._release()
+
+
+def parse_part(archive: zipfile.ZipFile, xml_path: str) -> etree._Element:
+    """
+    Parse an archive member by streaming its decompressed bytes into lxml.
+
+    Raises:
+        KeyError: If the archive has no such member
+    """
+    with archive.open(xml_path) as stream:
+        return etree.parse(stream).getroot()
+
+
 def load_xml(docx_path: Path, xml_path: str) -> etree._Element:
     """
     Load and parse an XML file from a .docx archive.
@@ -71,9 +153,8 @@ def load_xml(docx_path: Path, xml_path: str) -> etree._Element:
     Returns:
         Parsed XML element tree
     """
-    with zipfile.ZipFile(docx_path, 'r') as z:
-        xml_content = z.read(xml_path)
-    return etree.fromstring(xml_content)
+    with DocxArchive(docx_path) as z:
+        return parse_part(z, xml_path)
 
 
 def get_document_xml(docx_path: Path) -> etree._Element:
@@ -89,12 +170,120 @@ def get_styles_xml(docx_path: Path) -> Optional[etree._Element]:
         return None
 
 
+# Clark-notation tag and attribute names, built once (no prefix lookup per element).
+_W = NS['w']
+W_P = f"{{{_W}}}p"
+W_PPR = f"{{{_W}}}pPr"
+W_RPR = f"{{{_W}}}rPr"
+W_SPACING = f"{{{_W}}}spacing"
+W_IND = f"{{{_W}}}ind"
+W_JC = f"{{{_W}}}jc"
+W_PSTYLE = f"{{{_W}}}pStyle"
+W_OUTLINE_LVL = f"{{{_W}}}outlineLvl"
+W_SZ = f"{{{_W}}}sz"
+W_RFONTS = f"{{{_W}}}rFonts"
+W_B = f"{{{_W}}}b"
+W_I = f"{{{_W}}}i"
+W_PG_MAR = f"{{{_W}}}pgMar"
+W_PG_SZ = f"{{{_W}}}pgSz"
+W_VAL = f"{{{_W}}}val"
+
+_PAGE_MARGIN_ATTRS = tuple(
+    (name, f"{{{_W}}}{name}") for name in ('top', 'bottom', 'left', 'right', 'header', 'footer', 'gutter')
+)
+_W_LINE, _W_LINE_RULE, _W_BEFORE, _W_AFTER = (f"{{{_W}}}{name}" for name in ('line', 'lineRule', 'before', 'after'))
+_W_LEFT, _W_RIGHT, _W_FIRST_LINE, _W_HANGING = (f"{{{_W}}}{name}" for name in ('left', 'right', 'firstLine', 'hanging'))
+_W_ASCII, _W_HANSI, _W_CS = (f"{{{_W}}}{name}" for name in ('ascii', 'hAnsi', 'cs'))
+_W_WIDTH, _W_HEIGHT, _W_ORIENT = (f"{{{_W}}}{name}" for name in ('w', 'h', 'orient'))
+
+_XP_SECT_PR = etree.XPath(".//w:sectPr", namespaces=NS)
+
+
+@dataclass(slots=True)
+class Spacing:
+    """Direct w:spacing of a paragraph (raw attribute strings, twips)."""
+    line: Optional[str] = None
+    line_rule: Optional[str] = None
+    before: Optional[str] = None
+    after: Optional[str] = None
+
+
+@dataclass(slots=True)
+class Indent:
+    """Direct w:ind of a paragraph (raw attribute strings, twips)."""
+    left: Optional[str] = None
+    right: Optional[str] = None
+    first_line: Optional[str] = None
+    hanging: Optional[str] = None
+
+
+@dataclass(slots=True)
+class ParagraphProperties:
+    """Direct formatting of a paragraph (w:pPr); None where not set."""
+    spacing: Optional[Spacing] = None
+    ind: Optional[Indent] = None
+    jc: Optional[str] = None
+    style: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The `get_paragraph_properties` dict form."""
+        props: Dict[str, Any] = {}
+        if self.spacing is not None:
+            spacing = self.spacing
+            props['spacing'] = {
+                'line': spacing.line, 'lineRule': spacing.line_rule,
+                'before': spacing.before, 'after': spacing.after,
+            }
+        if self.ind is not None:
+            ind = self.ind
+            props['ind'] = {'left': ind.left, 'right': ind.right, 'firstLine': ind.first_line, 'hanging': ind.hanging}
+        if self.jc is not None:
+            props['jc'] = self.jc
+        if self.style is not None:
+            props['style'] = self.style
+        return props
+
+
+@dataclass(slots=True)
+class RunFonts:
+    """Direct w:rFonts of a run."""
+    ascii: Optional[str] = None
+    h_ansi: Optional[str] = None
+    cs: Optional[str] = None
+
+
+@dataclass(slots=True)
+class RunProperties:
+    """Direct formatting of a run (w:rPr); None/False where not set."""
+    sz: Optional[int] = None  # half-points
+    fonts: Optional[RunFonts] = None
+    bold: bool = False
+    italic: bool = False
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The `get_run_properties` dict form."""
+        props: Dict[str, Any] = {}
+        if self.sz is not None:
+            props['sz'] = self.sz
+        if self.fonts is not None:
+            props['rFonts'] = {'ascii': self.fonts.ascii, 'hAnsi': self.fonts.h_ansi, 'cs': self.fonts.cs}
+        if self.bold:
+            props['b'] = True
+        if self.italic:
+            props['i'] = True
+        return props
+
+
+_EMPTY_PARAGRAPH_PROPERTIES = ParagraphProperties()
+_EMPTY_RUN_PROPERTIES = RunProperties()
+
+
 def get_section_properties(doc_xml: etree._Element) -> Optional[etree._Element]:
     """
     Get the last section properties (w:sectPr) from document.
     The last sectPr typically contains the main page setup.
     """
-    sect_prs = doc_xml.xpath(".//w:sectPr", namespaces=NS)
+    sect_prs = _XP_SECT_PR(doc_xml)
     return sect_prs[-1] if sect_prs else None
 
 
@@ -110,13 +299,23 @@ def get_page_margins(doc_xml: etree._Element) -> Optional[Dict[str, int]]:
     if sect_pr is None:
         return None
     
-    pg_mar = sect_pr.find("w:pgMar", namespaces=NS)
+    return parse_page_margins(sect_pr)
+
+
+def parse_page_margins(sect_pr: etree._Element) -> Optional[Dict[str, int]]:
+    """
+    Get page margins (in twips) from a single w:sectPr element.
+    
+    Returns:
+        Same dict as `get_page_margins`, or None if w:pgMar is missing.
+    """
+    pg_mar = sect_pr.find(W_PG_MAR)
     if pg_mar is None:
         return None
     
     margins = {}
-    for attr in ['top', 'bottom', 'left', 'right', 'header', 'footer', 'gutter']:
-        value = pg_mar.get(f"{{{NS['w']}}}{attr}")
+    for attr, clark in _PAGE_MARGIN_ATTRS:
+        value = pg_mar.get(clark)
         if value:
             margins[attr] = int(value)
     
@@ -134,17 +333,83 @@ def get_page_size(doc_xml: etree._Element) -> Optional[Dict[str, Any]]:
     if sect_pr is None:
         return None
     
-    pg_sz = sect_pr.find("w:pgSz", namespaces=NS)
+    return parse_page_size(sect_pr)
+
+
+def parse_page_size(sect_pr: etree._Element) -> Optional[Dict[str, Any]]:
+    """
+    Get page size from a single w:sectPr element.
+    
+    Returns:
+        Same dict as `get_page_size`, or None if w:pgSz is missing.
+    """
+    pg_sz = sect_pr.find(W_PG_SZ)
     if pg_sz is None:
         return None
     
     return {
-        'width': int(pg_sz.get(f"{{{NS['w']}}}w", 0)),
-        'height': int(pg_sz.get(f"{{{NS['w']}}}h", 0)),
-        'orient': pg_sz.get(f"{{{NS['w']}}}orient", 'portrait'),
+        'width': int(pg_sz.get(_W_WIDTH, 0)),
+        'height': int(pg_sz.get(_W_HEIGHT, 0)),
+        'orient': pg_sz.get(_W_ORIENT, 'portrait'),
     }
 
 
+def paragraph_properties(paragraph: etree._Element) -> ParagraphProperties:
+    """
+    Direct formatting of a paragraph element, read in one pass over its w:pPr.
+    
+    Paragraphs without w:pPr share one empty (do not modify) instance.
+    """
+    p_pr = paragraph.find(W_PPR)
+    if p_pr is None:
+        return _EMPTY_PARAGRAPH_PROPERTIES
+    
+    props = ParagraphProperties()
+    for child in p_pr:
+        tag = child.tag
+        if tag == W_SPACING:
+            if props.spacing is None:
+                props.spacing = Spacing(child.get(_W_LINE), child.get(_W_LINE_RULE), child.get(_W_BEFORE), child.get(_W_AFTER))
+        elif tag == W_IND:
+            if props.ind is None:
+                props.ind = Indent(child.get(_W_LEFT), child.get(_W_RIGHT), child.get(_W_FIRST_LINE), child.get(_W_HANGING))
+        elif tag == W_JC:
+            if props.jc is None:
+                props.jc = child.get(W_VAL)
+        elif tag == W_PSTYLE:
+            if props.style is None:
+                props.style = child.get(W_VAL)
+    return props
+
+
+def run_properties(run: etree._Element) -> RunProperties:
+    """
+    Direct formatting of a run element, read in one pass over its w:rPr.
+    
+    Runs without w:rPr share one empty (do not modify) instance.
+    """
+    r_pr = run.find(W_RPR)
+    if r_pr is None:
+        return _EMPTY_RUN_PROPERTIES
+    
+    props = RunProperties()
+    seen_sz = False
+    for child in r_pr:
+        tag = child.tag
+        if tag == W_SZ:
+            if not seen_sz:
+                seen_sz = True
+                props.sz = int(child.get(W_VAL))
+        elif tag == W_RFONTS:
+            if props.fonts is None:
+                props.fonts = RunFonts(child.get(_W_ASCII), child.get(_W_HANSI), child.get(_W_CS))
+        elif tag == W_B:
+            props.bold = True
+        elif tag == W_I:
+            props.italic = True
+    return props
+
+
 def get_paragraph_properties(paragraph: etree._Element) -> Dict[str, Any]:
     """
     Extract formatting properties from a paragraph element.
@@ -154,44 +419,10 @@ def get_paragraph_properties(paragraph: etree._Element) -> Dict[str, Any]:
     - 'ind': indentation info
     - 'jc': justification/alignment
     - 'style': style name
-    """
-    props = {}
-    
-    p_pr = paragraph.find("w:pPr", namespaces=NS)
-    if p_pr is None:
-        return props
-    
-    # Spacing
-    spacing = p_pr.find("w:spacing", namespaces=NS)
-    if spacing is not None:
-        props['spacing'] = {
-            'line': spacing.get(f"{{{NS['w']}}}line"),
-            'lineRule': spacing.get(f"{{{NS['w']}}}lineRule"),
-            'before': spacing.get(f"{{{NS['w']}}}before"),
-            'after': spacing.get(f"{{{NS['w']}}}after"),
-        }
-    
-    # Indentation
-    ind = p_pr.find("w:ind", namespaces=NS)
-    if ind is not None:
-        props['ind'] = {
-            'left': ind.get(f"{{{NS['w']}}}left"),
-            'right': ind.get(f"{{{NS['w']}}}right"),
-            'firstLine': ind.get(f"{{{NS['w']}}}firstLine"),
-            'hanging': ind.get(f"{{{NS['w']}}}hanging"),
-        }
     
-    # Justification/Alignment
-    jc = p_pr.find("w:jc", namespaces=NS)
-    if jc is not None:
-        props['jc'] = jc.get(f"{{{NS['w']}}}val")
-    
-    # Style
-    style = p_pr.find("w:pStyle", namespaces=NS)
-    if style is not None:
-        props['style'] = style.get(f"{{{NS['w']}}}val")
-    
-    return props
+    Hot loops should prefer `paragraph_properties` (no nested dicts).
+    """
+    return paragraph_properties(paragraph).to_dict()
 
 
 def get_run_properties(run: etree._Element) -> Dict[str, Any]:
@@ -203,38 +434,10 @@ def get_run_properties(run: etree._Element) -> Dict[str, Any]:
     - 'rFonts': font names
     - 'b': bold
     - 'i': italic
-    """
-    props = {}
-    
-    r_pr = run.find("w:rPr", namespaces=NS)
-    if r_pr is None:
-        return props
     
-    # Font size
-    sz = r_pr.find("w:sz", namespaces=NS)
-    if sz is not None:
-        props['sz'] = int(sz.get(f"{{{NS['w']}}}val"))
-    
-    # Font names
-    r_fonts = r_pr.find("w:rFonts", namespaces=NS)
-    if r_fonts is not None:
-        props['rFonts'] = {
-            'ascii': r_fonts.get(f"{{{NS['w']}}}ascii"),
-            'hAnsi': r_fonts.get(f"{{{NS['w']}}}hAnsi"),
-            'cs': r_fonts.get(f"{{{NS['w']}}}cs"),
-        }
-    
-    # Bold
-    b = r_pr.find("w:b", namespaces=NS)
-    if b is not None:
-        props['b'] = True
-    
-    # Italic
-    i = r_pr.find("w:i", namespaces=NS)
-    if i is not None:
-        props['i'] = True
-    
-    return props
+    Hot loops should prefer `run_properties` (no nested dicts).
+    """
+    return run_properties(run).to_dict()
 
 
 def check_margins(doc_xml: etree._Element, 
@@ -276,10 +479,16 @@ def check_margins(doc_xml: etree._Element,
     return True
 
 
+_HEADING_STYLE_RE = re.compile(r"^(heading|заголовок)\s*[1-9]$", re.IGNORECASE)
+
+
 def find_paragraph_index(doc_xml: etree._Element, paragraph: etree._Element) -> int:
     """
     Find the index of a paragraph in the document.
     
+    Each call walks the tree; checks that need the ordinals of many
+    paragraphs use `tests.helpers.paragraph_index.ParagraphIndex` instead.
+    
     Args:
         doc_xml: Document XML root
         paragraph: Paragraph element to find
@@ -287,26 +496,54 @@ def find_paragraph_index(doc_xml: etree._Element, paragraph: etree._Element) ->
     Returns:
         0-based index, or -1 if not found
     """
-    all_paragraphs = doc_xml.xpath(".//w:p", namespaces=NS)
-    try:
-        return all_paragraphs.index(paragraph)
-    except ValueError:
-        return -1
+    for index, candidate in enumerate(doc_xml.iter(W_P)):
+        if candidate is paragraph:
+            return index
+    return -1
+
+
+def is_heading_paragraph(paragraph: etree._Element) -> bool:
+    """
+    Check whether a paragraph is a heading by its direct formatting.
+    
+    Detects w:outlineLvl 0..8 and built-in heading style ids ("Heading1",
+    "Заголовок1"). Headings whose level comes only from styles.xml are found by
+    `tests.helpers.styles.StyleResolver` (effective 'outlineLvl').
+    """
+    p_pr = paragraph.find(W_PPR)
+    if p_pr is None:
+        return False
+    outline = p_pr.find(W_OUTLINE_LVL)
+    if outline is not None:
+        return outline.get(W_VAL) not in (None, "9")
+    style = p_pr.find(W_PSTYLE)
+    return style is not None and bool(_HEADING_STYLE_RE.match(style.get(W_VAL, "")))
 
 
-def find_nearby_heading(doc_xml: etree._Element, paragraph_index: int) -> str:
+def find_nearby_heading(doc_xml: etree._Element, paragraph_index: int, styles=None) -> str:
     """
     Find the nearest heading before the given paragraph.
     
     Args:
         doc_xml: Document XML root
         paragraph_index: Index of the paragraph
+        styles: Optional `StyleResolver`; when given, headings are detected by
+            their effective outline level (styles.xml included)
         
     Returns:
         Heading text or empty string
     """
-    from docx import Document
-    # This is a simplified version - would need document path
+    paragraphs = list(doc_xml.iter(W_P))
+    for index in range(min(paragraph_index, len(paragraphs) - 1), -1, -1):
+        paragraph = paragraphs[index]
+        if styles is not None:
+            is_heading = styles.paragraph_properties(paragraph).get('outlineLvl', 9) < 9
+        else:
+            is_heading = is_heading_paragraph(paragraph)
+        if is_heading:
+            text = get_paragraph_text(paragraph).strip()
+            if text:
+                return text
     return ""
 
 
@@ -321,8 +558,93 @@ def get_paragraph_text_preview(paragraph: etree._Element, max_length: int = 50)
     Returns:
         Text preview
     """
-    text_nodes = paragraph.xpath(".//w:t/text()", namespaces=NS)
-    text = "".join(text_nodes).strip()
+    text = get_paragraph_text(paragraph).strip()
     if len(text) > max_length:
         return text[:max_length] + "..."
     return text if text else "(пустой параграф)"
+
+
+_W_R = f"{{{_W}}}r"
+_W_T = f"{{{_W}}}t"
+_W_TAB = f"{{{_W}}}tab"
+_W_PTAB = f"{{{_W}}}ptab"
+_W_BR = f"{{{_W}}}br"
+_W_CR = f"{{{_W}}}cr"
+_W_NO_BREAK_HYPHEN = f"{{{_W}}}noBreakHyphen"
+_W_TYPE = f"{{{_W}}}type"
+_W_BODY = f"{{{_W}}}body"
+
+# Inline containers whose runs are part of the current paragraph text. Everything
+# else is skipped: tracked deletions (w:del, w:moveFrom), field codes (w:instrText
+# lives in runs and is not w:t), properties, bookmarks, math and drawings (text box
+# paragraphs are separate paragraphs of the scan).
+_TEXT_CONTAINERS = frozenset(
+    f"{{{_W}}}{name}"
+    for name in ('hyperlink', 'ins', 'moveTo', 'smartTag', 'customXml', 'fldSimple', 'sdt', 'sdtContent', 'dir', 'bdo')
+)
+
+# Soft hyphens and zero-width characters are dropped, non-breaking spaces and
+# hyphens become ordinary ones, so text matches the way it reads.
+_TEXT_NORMALIZATION = str.maketrans({
+    '\u00ad': None,
+    '\u200b': None,
+    '\u200c': None,
+    '\u200d': None,
+    '\ufeff': None,
+    '\u00a0': ' ',
+    '\u202f': ' ',
+    '\u2007': ' ',
+    '\u2011': '-',
+})
+_NEEDS_NORMALIZATION = re.compile("[" + "".join(chr(code) for code in _TEXT_NORMALIZATION) + "]")
+
+
+def _append_inline_text(element: etree._Element, parts: list) -> None:
+    """Append the text of the runs of a paragraph or an inline container (in document order)."""
+    for child in element:
+        tag = child.tag
+        if tag == _W_R:
+            for item in child:
+                tag = item.tag
+                if tag == _W_T:
+                    if item.text:
+                        parts.append(item.text)
+                elif tag == _W_TAB or tag == _W_PTAB:
+                    parts.append("\t")
+                elif tag == _W_BR:
+                    if item.get(_W_TYPE, "textWrapping") == "textWrapping":
+                        parts.append("\n")
+                elif tag == _W_CR:
+                    parts.append("\n")
+                elif tag == _W_NO_BREAK_HYPHEN:
+                    parts.append("-")
+        elif tag in _TEXT_CONTAINERS:
+            _append_inline_text(child, parts)
+
+
+def get_paragraph_text(paragraph: etree._Element) -> str:
+    """
+    Get the normalized plain text of a paragraph element.
+    
+    The single text extractor of the checks (scan, indexes, previews): runs
+    directly in the paragraph, in hyperlinks, tracked insertions, simple
+    fields, smart tags and inline content controls contribute; tracked
+    deletions, field codes and text box contents do not. Field results are
+    kept. Soft hyphens and zero-width characters are removed, non-breaking
+    spaces and hyphens normalized, so callers need no further clean-up.
+    """
+    parts: list = []
+    _append_inline_text(paragraph, parts)
+    text = "".join(parts)
+    # str.translate looks up every character; most paragraphs need nothing.
+    if _NEEDS_NORMALIZATION.search(text):
+        text = text.translate(_TEXT_NORMALIZATION)
+    return text
+
+
+def get_body_paragraph_texts(doc_xml: etree._Element) -> list:
+    """Texts of the body-level paragraphs (the paragraphs of python-docx `Document.paragraphs`)."""
+    body = doc_xml.find(_W_BODY)
+    if body is None:
+        return []
+    return [get_paragraph_text(p) for p in body.iterchildren(W_P)]
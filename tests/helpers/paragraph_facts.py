@@ -0,0 +1,323 @@
+"""
+Incremental re-check support: per-paragraph facts reused across revisions.
+
+A normocontrol pass derives a few facts from every `w:p` (effective indent,
+line spacing, run fonts, layout metrics, heading text) and aggregates them
+in document context (page flow, ratios, clusters, locations). Between two
+revisions of a student document most paragraphs are byte-identical, so the
+per-paragraph part can be reused.
+
+`paragraph_fingerprints` hashes the raw XML span of every paragraph of
+`word/document.xml` (text together with its pPr/rPr markup), in the same
+order the scanner completes paragraphs. `ParagraphFactsCache` maps
+fingerprints to the facts stored by the previous run: unchanged paragraphs
+get their facts from the table, changed ones are derived again, and all
+aggregation runs as usual, so the report equals a full re-check.
+
+Facts must be JSON-serializable and are shared between identical paragraphs,
+so visitors must treat them as read-only.
+
+Facts depend on the paragraph alone, so on large documents they can also be
+derived ahead of the scan: `body_chunks` splits the body into runs of
+complete top-level blocks, worker processes derive the facts of a chunk with
+`derive_chunk_facts`, and the cache hands them to the scan in order (the
+`deriver` argument). Everything positional stays in the single sequential
+pass, which acts as the merge step.
+"""
+import hashlib
+import io
+import re
+from collections import deque
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from lxml import etree
+
+from tests.helpers.ooxml_scan import scan_stream
+
+
+# Start tags (`<w:p>`, `<w:p w:rsidR=...>`, `<w:p/>`) and end tags of paragraphs.
+# `(?=[\s>/])` keeps `<w:pPr>`, `<w:proofErr>` etc. out.
+_PARAGRAPH_TAG_RE = re.compile(rb"<w:p(?=[\s>/])[^>]*>|</w:p>")
+_BODY_START = b"<w:body"
+_BODY_END = b"</w:body>"
+
+# Start, end and empty tags of the body-level blocks that may hold paragraphs;
+# a chunk boundary is only placed where none of them is open.
+_BLOCK_TAG_RE = re.compile(rb"<(/?)w:(p|tbl|sdt|customXml)(?=[\s>/])[^>]*?(/?)>")
+
+FINGERPRINT_SIZE = 12
+
+
+def paragraph_fingerprints(document_xml: bytes) -> Optional[List[str]]:
+    """
+    Fingerprint every paragraph of a raw document.xml.
+
+    Spans are hashed in the order their end tags appear, which is the order
+    `ooxml_scan` completes paragraphs (nested text box paragraphs first). An
+    outer paragraph's span includes the paragraphs nested in it.
+
+    Returns:
+        Hex digests, or None if the markup does not use the `w:` prefix
+        (or is unbalanced) and paragraphs cannot be located reliably
+    """
+    fingerprints = []
+    starts = []
+    for match in _PARAGRAPH_TAG_RE.finditer(document_xml):
+        tag = match.group()
+        if tag == b"</w:p>":
+            if not starts:
+                return None
+            span = document_xml[starts.pop():match.end()]
+        elif tag.endswith(b"/>"):
+            span = tag
+        else:
+            starts.append(match.start())
+            continue
+        fingerprints.append(hashlib.blake2b(span, digest_size=FINGERPRINT_SIZE).hexdigest())
+
+    if starts or not fingerprints:
+        return None
+    return fingerprints
+
+
+def body_chunks(document_xml: bytes, target_paragraphs: int) -> Optional[List[Tuple[int, int, int, int]]]:
+    """
+    Split the body of a raw document.xml into chunks of whole top-level blocks.
+
+    A chunk is closed after the first top-level paragraph, table or content
+    control that brings it to `target_paragraphs` paragraphs; the last chunk
+    runs up to `</w:body>` (the final `w:sectPr` included).
+
+    Returns:
+        (start offset, end offset, first paragraph position, paragraph count)
+        per chunk, with positions as in `paragraph_fingerprints`; None if the
+        body cannot be located or its blocks are unbalanced
+    """
+    body = document_xml.find(_BODY_START)
+    body_end = document_xml.rfind(_BODY_END)
+    if body < 0 or body_end < body:
+        return None
+    body_start = document_xml.find(b">", body) + 1
+
+    chunks = []
+    depth = 0
+    position = 0
+    chunk_start, chunk_first = body_start, 0
+    for match in _BLOCK_TAG_RE.finditer(document_xml, body_start, body_end):
+        closing, name, empty = match.groups()
+        if closing:
+            depth -= 1
+        elif not empty:
+            depth += 1
+            continue
+        if name == b"p":
+            position += 1
+        if depth < 0:
+            return None
+        if depth == 0 and position - chunk_first >= target_paragraphs:
+            chunks.append((chunk_start, match.end(), chunk_first, position - chunk_first))
+            chunk_start, chunk_first = match.end(), position
+
+    if depth != 0:
+        return None
+    chunks.append((chunk_start, body_end, chunk_first, position - chunk_first))
+    return chunks
+
+
+def chunk_document(document_xml: bytes, start: int, end: int) -> bytes:
+    """Standalone document.xml holding only the body blocks between two `body_chunks` offsets."""
+    body = document_xml.find(_BODY_START)
+    prologue = document_xml[:document_xml.find(b">", body) + 1]
+    return prologue + document_xml[start:end] + _BODY_END + b"</w:document>"
+
+
+class _FactsRecorder:
+    """Facts provider collecting the facts of every scanned paragraph in order."""
+
+    def __init__(self):
+        self.entries: List[dict] = []
+
+    def next_paragraph(self, paragraph: etree._Element) -> None:
+        self.entries.append({})
+
+    def lookup(self, name: str, paragraph: etree._Element, derive: Callable):
+        facts = self.entries[-1][name] = derive(paragraph)
+        return facts
+
+
+class _DeriveOnly:
+    """Facts-aware visitor proxy that derives facts and skips the in-context visit."""
+
+    def __init__(self, visitor: object):
+        self.facts_name = visitor.facts_name
+        self.paragraph_facts = visitor.paragraph_facts
+
+    def visit_paragraph_facts(self, paragraph: etree._Element, facts) -> None:
+        pass
+
+
+def derive_chunk_facts(chunk_xml: bytes, visitors: Sequence[object]) -> List[dict]:
+    """
+    Facts entries of every paragraph of a chunk (see `chunk_document`).
+
+    The chunk goes through `scan_stream` like the whole document does, so
+    paragraphs are completed and cleared in the same order and nested text
+    box paragraphs are gone before their outer paragraph is derived.
+
+    Args:
+        chunk_xml: Standalone document.xml of the chunk
+        visitors: Facts-aware visitors; only their `paragraph_facts` is called
+
+    Returns:
+        One `{facts_name: facts}` entry per paragraph, in scanner order
+    """
+    recorder = _FactsRecorder()
+    derivers = [_DeriveOnly(visitor) for visitor in visitors if hasattr(visitor, "paragraph_facts")]
+    scan_stream(io.BytesIO(chunk_xml), derivers, facts=recorder)
+    return recorder.entries
+
+
+class ParagraphFactsCache:
+    """
+    Facts provider for `ooxml_scan.scan_stream`.
+
+    A table entry is keyed by the parent element kind plus the paragraph
+    fingerprint and holds the facts of every facts-aware visitor by its
+    `facts_name`. The table of this run (`to_dict`) contains the entries of
+    the current revision only.
+
+    Args:
+        previous: Table saved by a previous run (`to_dict`), or None
+        context: Digest of everything paragraph facts depend on besides the
+            paragraph itself (styles, theme, checker version); a previous
+            table with another context is ignored
+        deriver: Optional callable taking `[(start, end), ...]` body chunk
+            offsets and returning one future per chunk whose result is the
+            `derive_chunk_facts` list of that chunk; used when at least two
+            chunks hold paragraphs missing from the previous table
+        chunk_paragraphs: Target paragraph count of a chunk for `deriver`
+    """
+
+    def __init__(
+        self,
+        previous: Optional[dict] = None,
+        context: str = "",
+        deriver: Optional[Callable] = None,
+        chunk_paragraphs: int = 500,
+    ):
+        self.context = context
+        self._previous = previous
+        self._deriver = deriver
+        self._chunk_paragraphs = chunk_paragraphs
+        # [first position, paragraph count, future or entries] per derived chunk, in order.
+        self._pending: deque = deque()
+        self._previous_paragraphs: Dict[str, dict] = {}
+        self.table: Dict[str, dict] = {}
+        self.hits = 0
+        self.misses = 0
+        self.enabled = False
+
+        self._fingerprints: List[str] = []
+        self._position = 0
+        self._entry: Optional[dict] = None
+
+    def start(self, document_xml: bytes) -> None:
+        """Fingerprint the document about to be scanned and select the reusable previous table."""
+        fingerprints = paragraph_fingerprints(document_xml)
+        self._fingerprints = fingerprints or []
+        self._position = 0
+        self.enabled = fingerprints is not None
+
+        # Namespace declarations live on the root start tag: a changed prefix
+        # mapping changes the meaning of otherwise identical paragraph bytes.
+        prologue = document_xml[:document_xml.find(_BODY_START)]
+        self.context = hashlib.sha256(self.context.encode() + prologue).hexdigest()
+
+        previous = self._previous
+        if previous and previous.get('context') == self.context:
+            self._previous_paragraphs = previous.get('paragraphs') or {}
+
+        if self._deriver is not None and self.enabled:
+            self._derive_ahead(document_xml)
+
+    def _derive_ahead(self, document_xml: bytes) -> None:
+        """Hand the chunks with paragraphs missing from the previous table to the deriver."""
+        if len(self._fingerprints) < 2 * self._chunk_paragraphs:
+            return  # small documents are derived faster in the scan itself
+        chunks = body_chunks(document_xml, self._chunk_paragraphs)
+        if chunks is None or sum(chunk[3] for chunk in chunks) != len(self._fingerprints):
+            return
+        reusable = {key.partition(":")[2] for key in self._previous_paragraphs}
+        needed = [
+            chunk for chunk in chunks
+            if any(fingerprint not in reusable for fingerprint in self._fingerprints[chunk[2]:chunk[2] + chunk[3]])
+        ]
+        if len(needed) < 2:
+            return
+        futures = self._deriver([(start, end) for start, end, _, _ in needed])
+        self._pending = deque([first, count, future] for (_, _, first, count), future in zip(needed, futures))
+
+    def _derived_ahead(self, position: int) -> Optional[dict]:
+        """Entry derived by the deriver for a paragraph position (waits for its chunk), if any."""
+        pending = self._pending
+        while pending:
+            chunk = pending[0]
+            first, count, result = chunk
+            if position < first:
+                return None
+            if position < first + count:
+                if not isinstance(result, list):
+                    try:
+                        result = result.result()
+                    except Exception:
+                        result = None  # a failed chunk is derived in the scan
+                    if not isinstance(result, list) or len(result) != count:
+                        result = []
+                    chunk[2] = result
+                return result[position - first] if result else None
+            pending.popleft()
+        return None
+
+    @property
+    def complete(self) -> bool:
+        """True if every scanned paragraph matched a fingerprint (the table is safe to save)."""
+        return self.enabled and self._position == len(self._fingerprints)
+
+    def next_paragraph(self, paragraph: etree._Element) -> None:
+        """Advance to the next completed paragraph (called by the scanner before its hooks)."""
+        if not self.enabled:
+            return
+        position = self._position
+        self._position = position + 1
+        if position >= len(self._fingerprints):
+            # More paragraphs than fingerprints: alignment is lost, stop reusing.
+            self.enabled = False
+            self._entry = None
+            return
+
+        parent = paragraph.getparent()
+        parent_kind = parent.tag.rpartition("}")[2] if parent is not None else ""
+        key = f"{parent_kind}:{self._fingerprints[position]}"
+        entry = self.table.get(key)
+        if entry is None:
+            entry = self._previous_paragraphs.get(key)
+            if entry is None:
+                entry = self._derived_ahead(position) or {}
+                self.misses += 1
+            else:
+                self.hits += 1
+            self.table[key] = entry
+        self._entry = entry
+
+    def lookup(self, name: str, paragraph: etree._Element, derive: Callable):
+        """Facts of the current paragraph for visitor `name` (derived with `derive` on a miss)."""
+        entry = self._entry if self.enabled else None
+        if entry is None:
+            return derive(paragraph)
+        if name not in entry:
+            entry[name] = derive(paragraph)
+        return entry[name]
+
+    def to_dict(self) -> dict:
+        """JSON-serializable table for the next run."""
+        return {'context': self.context, 'paragraphs': self.table}
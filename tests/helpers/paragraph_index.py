@@ -0,0 +1,125 @@
+"""
+Positional index of the paragraphs of a document.
+
+`ParagraphIndex` is a scanner visitor (see `ooxml_scan`) that assigns every
+`w:p` its ordinal in the order the scanner completes paragraphs, and records
+the enclosing heading and the estimated page of each one. The
+whole table is built during the single streaming pass, so an issue location
+("section → paragraph N") costs a couple of array lookups instead of a
+`.//w:p` list scan per issue.
+
+Ordinals are 0-based. They follow paragraph end order, which equals
+document order except for paragraphs nested inside text boxes (those end
+before the paragraph holding the text box).
+"""
+from array import array
+from typing import Dict, List, Optional
+
+from lxml import etree
+
+from tests.helpers.ooxml_utils import get_paragraph_text
+
+
+# w:outlineLvl 9 means "body text"; 0..8 are heading levels.
+BODY_TEXT_OUTLINE_LEVEL = 9
+MAX_HEADING_LENGTH = 120
+
+
+class ParagraphIndex:
+    """
+    Scanner visitor building per-paragraph ordinal → (heading, page) tables.
+
+    During the scan:
+    - `current` is the ordinal of the paragraph whose runs are being visited
+      (runs are visited before their paragraph completes);
+    - after `p` is visited, `last` is the ordinal of `p`.
+
+    Args:
+        styles: `StyleResolver` of the document, used to detect headings by
+            their effective outline level
+        layout: Optional `LayoutEstimator` visited before this index; its
+            `last_page` is recorded for every paragraph
+    """
+
+    facts_name = "index"
+
+    def __init__(self, styles, layout=None):
+        self._paragraph_properties = styles.paragraph_properties
+        self._layout = layout
+
+        self.count = 0
+        # Ordinal of the enclosing heading per paragraph (-1 = before the first heading).
+        self.heading_of = array("i")
+        # Estimated page per paragraph (0 = unknown).
+        self.page_of = array("H")
+        self.heading_titles: Dict[int, str] = {}
+        self.heading_levels: Dict[int, int] = {}
+        self._current_heading = -1
+
+    @property
+    def current(self) -> int:
+        """Ordinal of the paragraph currently being scanned."""
+        return self.count
+
+    @property
+    def last(self) -> int:
+        """Ordinal of the most recently completed paragraph (-1 before the first)."""
+        return self.count - 1
+
+    def paragraph_facts(self, paragraph: etree._Element) -> Optional[List]:
+        """[outline level, title] of a heading paragraph, None for body text."""
+        level = self._paragraph_properties(paragraph).get('outlineLvl', BODY_TEXT_OUTLINE_LEVEL)
+        if level >= BODY_TEXT_OUTLINE_LEVEL:
+            return None
+        title = get_paragraph_text(paragraph).strip()
+        if not title:
+            return None
+        return [level, title[:MAX_HEADING_LENGTH]]
+
+    def visit_paragraph_facts(self, paragraph: etree._Element, heading: Optional[List]) -> None:
+        """Assign the next ordinal and record heading and page of the paragraph."""
+        ordinal = self.count
+        if heading is not None:
+            level, title = heading
+            self._current_heading = ordinal
+            self.heading_titles[ordinal] = title
+            self.heading_levels[ordinal] = level
+
+        self.heading_of.append(self._current_heading)
+        page = self._layout.last_page if self._layout is not None else 0
+        self.page_of.append(min(page, 65535))
+        self.count = ordinal + 1
+
+    def heading(self, ordinal: int) -> Optional[str]:
+        """Title of the heading enclosing a paragraph (None before the first heading)."""
+        if not 0 <= ordinal < self.count:
+            return None
+        return self.heading_titles.get(self.heading_of[ordinal])
+
+    def page(self, ordinal: int) -> Optional[int]:
+        """Estimated page of a paragraph, if a layout estimator was attached."""
+        if not 0 <= ordinal < self.count:
+            return None
+        return self.page_of[ordinal] or None
+
+    def location(self, ordinal: int) -> str:
+        """Issue anchor of a paragraph: "«Heading» → абзац N (стр. ≈P)"."""
+        heading = self.heading(ordinal)
+        section = f"«{heading}»" if heading else "Начало документа"
+        page = self.page(ordinal)
+        suffix = f" (стр. ≈{page})" if page else ""
+        return f"{section} → абзац {ordinal + 1}{suffix}"
+
+    def range_location(self, first: int, last: int) -> str:
+        """Issue anchor of a paragraph range: "«Heading» → абз. N–M (стр. ≈P–Q)"."""
+        if first == last:
+            return self.location(first)
+        heading = self.heading(first)
+        section = f"«{heading}»" if heading else "Начало документа"
+        first_page, last_page = self.page(first), self.page(last)
+        if first_page and last_page:
+            pages = f"{first_page}" if first_page == last_page else f"{first_page}–{last_page}"
+            suffix = f" (стр. ≈{pages})"
+        else:
+            suffix = ""
+        return f"{section} → абз. {first + 1}–{last + 1}{suffix}"
@@ -0,0 +1,181 @@
+"""
+Shared, parse-once model of a .docx document.
+
+`ParsedDocx` opens the archive a single time and exposes everything the
+normocontrol checks need: a streaming scan of `word/document.xml`, the
+paragraph text list, header parts and styles. Derived views (joined text,
+stripped non-empty lines, full lxml tree) are computed lazily and cached,
+so every check consumes the same object instead of re-reading the file.
+"""
+import io
+from functools import cached_property
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from lxml import etree
+
+from tests.helpers.ooxml_scan import scan_stream
+from tests.helpers.ooxml_utils import NS, DocxArchive, get_paragraph_text, parse_part
+from tests.helpers.styles import StyleResolver
+
+
+DOCUMENT_PART = "word/document.xml"
+STYLES_PART = "word/styles.xml"
+THEME_PART = "word/theme/theme1.xml"
+DOCUMENT_RELS_PART = "word/_rels/document.xml.rels"
+
+_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+
+_W_BODY = f"{{{NS['w']}}}body"
+
+
+class _BodyTextCollector:
+    """Scanner visitor collecting text of body-level paragraphs.
+
+    Only direct children of w:body are collected, which matches
+    python-docx `Document.paragraphs`.
+    """
+
+    facts_name = "text"
+
+    def __init__(self):
+        self.texts: List[str] = []
+
+    def paragraph_facts(self, paragraph: etree._Element) -> Optional[str]:
+        parent = paragraph.getparent()
+        if parent is not None and parent.tag == _W_BODY:
+            return get_paragraph_text(paragraph)
+        return None
+
+    def visit_paragraph_facts(self, paragraph: etree._Element, text: Optional[str]) -> None:
+        if text is not None:
+            self.texts.append(text)
+
+
+class ParsedDocx:
+    """
+    A .docx archive opened once and shared by all checks.
+    
+    Usage:
+        with ParsedDocx(path) as parsed:
+            parsed.scan([visitor_a, visitor_b])
+            text = parsed.text
+    """
+
+    def __init__(self, docx_path: Path):
+        self.path = Path(docx_path)
+        self.name = self.path.name
+        self._archive = DocxArchive(self.path)
+        self._paragraph_texts: Optional[List[str]] = None
+
+    def __enter__(self) -> "ParsedDocx":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying archive."""
+        self._archive.close()
+
+    def has_part(self, part_name: str) -> bool:
+        """Check whether the archive contains the given part."""
+        return part_name in self.part_names
+
+    def read_part(self, part_name: str) -> bytes:
+        """Read raw bytes of an archive part (e.g. "word/header1.xml")."""
+        return self._archive.read(part_name)
+
+    def parse_part(self, part_name: str) -> etree._Element:
+        """Parse an XML part, streaming it from the archive into lxml."""
+        return parse_part(self._archive, part_name)
+
+    @cached_property
+    def part_names(self) -> List[str]:
+        """Names of all parts in the archive."""
+        return self._archive.namelist()
+
+    def scan(self, visitors: Iterable[object] = (), facts=None) -> None:
+        """
+        Stream `word/document.xml` once through the given scanner visitors.
+        
+        The paragraph text list is collected during the same pass.
+
+        Args:
+            visitors: Scanner visitors (see `ooxml_scan`)
+            facts: Optional `ParagraphFactsCache`; paragraph facts of the
+                previous revision are reused for unchanged paragraphs
+        """
+        collector = _BodyTextCollector()
+        if facts is None:
+            with self._archive.open(DOCUMENT_PART) as stream:
+                scan_stream(stream, [collector, *visitors])
+        else:
+            # Fingerprinting needs the raw bytes, so the part is read once up front.
+            document_xml = self.read_part(DOCUMENT_PART)
+            facts.start(document_xml)
+            scan_stream(io.BytesIO(document_xml), [collector, *visitors], facts=facts)
+        self._paragraph_texts = collector.texts
+
+    @property
+    def paragraph_texts(self) -> List[str]:
+        """Text of every body-level paragraph in document order."""
+        if self._paragraph_texts is None:
+            self.scan()
+        return self._paragraph_texts
+
+    @cached_property
+    def text(self) -> str:
+        """All paragraph texts joined with newlines."""
+        return "\n".join(self.paragraph_texts)
+
+    @cached_property
+    def lines(self) -> List[str]:
+        """Stripped, non-empty paragraph texts."""
+        return [line for line in (t.strip() for t in self.paragraph_texts) if line]
+
+    @cached_property
+    def root(self) -> etree._Element:
+        """Fully parsed document.xml (only for ad-hoc XPath queries)."""
+        return self.parse_part(DOCUMENT_PART)
+
+    @cached_property
+    def styles(self) -> Optional[etree._Element]:
+        """Parsed styles.xml, or None if the document has no styles part."""
+        if not self.has_part(STYLES_PART):
+            return None
+        return self.parse_part(STYLES_PART)
+
+    @cached_property
+    def theme(self) -> Optional[etree._Element]:
+        """Parsed theme part, or None if the document has no theme."""
+        if not self.has_part(THEME_PART):
+            return None
+        return self.parse_part(THEME_PART)
+
+    @cached_property
+    def style_resolver(self) -> StyleResolver:
+        """Effective formatting resolver built from styles.xml and the theme (memoized per document)."""
+        return StyleResolver(self.styles, self.theme)
+
+    @cached_property
+    def headers(self) -> Dict[str, bytes]:
+        """Raw XML of every header part, keyed by part name."""
+        return {
+            name: self.read_part(name)
+            for name in self.part_names
+            if name.startswith("word/header") and name.endswith(".xml")
+        }
+
+    @cached_property
+    def relationships(self) -> Dict[str, str]:
+        """Relationship id -> part name of the main document (e.g. "rId7" -> "word/header1.xml")."""
+        if not self.has_part(DOCUMENT_RELS_PART):
+            return {}
+        rels = {}
+        for rel in self.parse_part(DOCUMENT_RELS_PART).iter(_REL):
+            if rel.get("TargetMode") == "External":
+                continue
+            target = rel.get("Target", "")
+            rels[rel.get("Id")] = target.lstrip("/") if target.startswith("/") else f"word/{target}"
+        return rels
@@ -0,0 +1,191 @@
+"""
+Citation and bibliography index of a document.
+
+`ReferenceIndex` is a facts-aware scanner visitor (see `ooxml_scan`) that
+records, in the single streaming pass:
+
+- every bracketed citation — `[8]`, ranges `[3–5]`, lists `[1, 4]`, page
+  references `[2, с. 15]` — as citation number → paragraph ordinals;
+- the entries of the «Список использованных источников» section (titles
+  are compared like section headings, see `section_index.normalize_title`,
+  so «Список литературы» is accepted too): entry number → text excerpt,
+  numbered either in the text ("1 Автор…") or by a Word list (`w:numPr`,
+  numbered in order).
+
+Unused sources, citations of missing sources and sources numbered out of
+the order of their first citation are then answered from these tables
+without re-scanning the text. Ordinals come from a `ParagraphIndex` visited
+before this index.
+"""
+import re
+from typing import Dict, List, Optional, Tuple
+
+from lxml import etree
+
+from tests.helpers.ooxml_utils import NS, get_paragraph_text
+from tests.helpers.section_index import MAX_TITLE_LENGTH, SECTION_ALIASES, normalize_title
+
+
+SOURCES_TITLE = "список использованных источников"
+# Normalized titles of the sources section (the aliases accepted by the structure check).
+SOURCES_TITLES = frozenset((SOURCES_TITLE, *SECTION_ALIASES[SOURCES_TITLE]))
+
+# A bracket not following a word or another bracket (`items[1]` in code listings is not a citation).
+_BRACKET_RE = re.compile(r"(?<![\w\]])\[([^\[\]]{1,60})\]")
+_CITATION_PART_RE = re.compile(r"^(\d{1,3})(?:\s*[–—-]\s*(\d{1,3}))?$")
+# "12 Автор…", "12. Автор…", "12Автор…" (a number followed by text, not a year or a measurement).
+_ENTRY_NUMBER_RE = re.compile(r"^(\d{1,3})(\.?)(?:\s+|(?=[^\W\d_]))")
+_APPENDIX_RE = re.compile(r"^приложение\s+[а-яa-z]$", re.IGNORECASE)
+
+MAX_RANGE = 50
+MAX_EXCERPT_LENGTH = 60
+
+_W_NUM_PR = f"{{{NS['w']}}}numPr"
+_W_P_PR = f"{{{NS['w']}}}pPr"
+
+
+def parse_citations(text: str) -> List[int]:
+    """
+    Source numbers cited in a text, in order of appearance (with repeats).
+
+    A bracket is a citation if at least one of its comma/semicolon separated
+    parts is a number or a range; other parts (`с. 15`) are ignored.
+    """
+    numbers: List[int] = []
+    for match in _BRACKET_RE.finditer(text):
+        for part in re.split(r"[,;]", match.group(1)):
+            found = _CITATION_PART_RE.match(part.strip())
+            if found is None:
+                continue
+            first = int(found.group(1))
+            last = int(found.group(2)) if found.group(2) else first
+            if first < 1 or last < first or last - first > MAX_RANGE:
+                continue
+            numbers.extend(range(first, last + 1))
+    return numbers
+
+
+def format_number_ranges(numbers: List[int], limit: int = 10) -> str:
+    """Sorted numbers with consecutive runs collapsed: "1–3, 7, 12" (first `limit` groups)."""
+    groups: List[Tuple[int, int]] = []
+    for number in sorted(set(numbers)):
+        if groups and number == groups[-1][1] + 1:
+            groups[-1] = (groups[-1][0], number)
+        else:
+            groups.append((number, number))
+    parts = [f"{first}" if first == last else f"{first}–{last}" for first, last in groups[:limit]]
+    if len(groups) > limit:
+        parts.append("…")
+    return ", ".join(parts)
+
+
+class ReferenceIndex:
+    """
+    Scanner visitor building citation → paragraphs and bibliography tables.
+
+    The bibliography is the section after the last paragraph reading
+    «Список использованных источников» (or an accepted alias); it ends at the next heading (as
+    detected by the paragraph index) or «Приложение X» paragraph. Brackets
+    inside the bibliography are not counted as citations.
+
+    Args:
+        index: `ParagraphIndex` visited before this index
+    """
+
+    facts_name = "references"
+
+    def __init__(self, index):
+        self._index = index
+
+        # Citation number → ordinals of the citing paragraphs (document order).
+        self.citations: Dict[int, List[int]] = {}
+        # Citation numbers in order of their first citation.
+        self.first_citations: List[int] = []
+        # Bibliography entry number → text excerpt / ordinal.
+        self.entries: Dict[int, str] = {}
+        self.entry_ordinals: Dict[int, int] = {}
+        # Entry numbers written with a dot ("1. Автор…").
+        self.dotted_entries: List[int] = []
+        self.sources_heading: Optional[int] = None
+        self._in_sources = False
+
+    def paragraph_facts(self, paragraph: etree._Element) -> Optional[List]:
+        """[citations, entry number, dotted, list item, marker, excerpt] of a paragraph, None if irrelevant."""
+        text = get_paragraph_text(paragraph).strip()
+        if not text:
+            return None
+
+        citations = parse_citations(text)
+        number_match = _ENTRY_NUMBER_RE.match(text)
+        number = int(number_match.group(1)) if number_match else None
+        dotted = bool(number_match and number_match.group(2))
+        p_pr = paragraph.find(_W_P_PR)
+        listed = p_pr is not None and p_pr.find(_W_NUM_PR) is not None
+
+        marker = None
+        if len(text) <= MAX_TITLE_LENGTH and normalize_title(text) in SOURCES_TITLES:
+            marker = "sources"
+        elif _APPENDIX_RE.match(text):
+            marker = "appendix"
+
+        if not citations and number is None and not listed and marker is None:
+            return None
+        excerpt = text[:MAX_EXCERPT_LENGTH] if number is not None or listed else None
+        return [citations, number, dotted, listed, marker, excerpt]
+
+    def visit_paragraph_facts(self, paragraph: etree._Element, facts: Optional[List]) -> None:
+        """Record citations of the paragraph or add it to the bibliography."""
+        ordinal = self._index.last
+        if self._in_sources and self._index.heading_of[ordinal] == ordinal:
+            self._in_sources = False
+        if facts is None:
+            return
+
+        citations, number, dotted, listed, marker, excerpt = facts
+        if marker == "sources":
+            # The last such paragraph is the section (earlier ones are contents entries).
+            self.sources_heading = ordinal
+            self._in_sources = True
+            self.entries.clear()
+            self.entry_ordinals.clear()
+            self.dotted_entries.clear()
+            return
+        if marker == "appendix":
+            self._in_sources = False
+
+        if self._in_sources:
+            if excerpt is not None:
+                if number is None:
+                    number = len(self.entries) + 1  # Word list item: numbered in order
+                if number not in self.entries:
+                    self.entries[number] = excerpt
+                    self.entry_ordinals[number] = ordinal
+                    if dotted:
+                        self.dotted_entries.append(number)
+            return
+
+        for cited in citations:
+            ordinals = self.citations.get(cited)
+            if ordinals is None:
+                self.citations[cited] = [ordinal]
+                self.first_citations.append(cited)
+            elif ordinals[-1] != ordinal:
+                ordinals.append(ordinal)
+
+    def dangling_citations(self) -> List[int]:
+        """Cited numbers without a bibliography entry."""
+        return sorted(number for number in self.citations if number not in self.entries)
+
+    def unused_sources(self) -> List[int]:
+        """Bibliography entries never cited in the text."""
+        return sorted(number for number in self.entries if number not in self.citations)
+
+    def order_violations(self) -> List[Tuple[int, int]]:
+        """(number, highest number cited before it) for every source first cited after a higher one."""
+        violations = []
+        highest = 0
+        for number in self.first_citations:
+            if number < highest:
+                violations.append((number, highest))
+            highest = max(highest, number)
+        return violations
@@ -1,10 +1,18 @@
 """
 Report generator for normocontrol checks.
 Collects issues and generates formatted reports.
+
+Issues are indexed by document, category and severity as they are added,
+so summaries and per-document sections cost O(issues) for the whole
+report. Every format is streamed to its file handle section by section;
+`write_reports` renders several formats in one pass over the documents.
+The output is the same as rendering the whole report in memory; JSON
+lists issues in the order they were added.
 """
+from contextlib import ExitStack
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Iterable, TextIO
 from datetime import datetime
 import json
 
@@ -27,9 +35,19 @@ class NormocontrolReport:
     issues: List[Issue] = field(default_factory=list)
     documents_checked: List[str] = field(default_factory=list)
     timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
-    
-    def add_issue(self, document: str, category: str, severity: str, 
-                  description: str, expected: str = "", actual: str = "", 
+
+    # Indexes over `issues` (in insertion order); issues appended to the list
+    # directly are indexed on the next query.
+    _by_document: Dict[str, List[Issue]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _by_category: Dict[str, List[Issue]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _by_severity: Dict[str, List[Issue]] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _indexed: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._sync_index()
+
+    def add_issue(self, document: str, category: str, severity: str,
+                  description: str, expected: str = "", actual: str = "",
                   location: str = ""):
         """Add a new issue to the report."""
         issue = Issue(
@@ -42,179 +60,309 @@ class NormocontrolReport:
             location=location
         )
         self.issues.append(issue)
-    
+        self._sync_index()
+
+    def add_issues(self, issues: Iterable[Issue]):
+        """Add already built issues (e.g. cached results of a document)."""
+        self.issues.extend(issues)
+        self._sync_index()
+
     def add_document(self, document: str):
         """Mark a document as checked."""
         if document not in self.documents_checked:
             self.documents_checked.append(document)
-    
+
+    def _sync_index(self):
+        """Index the issues added since the last call."""
+        for issue in self.issues[self._indexed:]:
+            self._by_document.setdefault(issue.document, []).append(issue)
+            self._by_category.setdefault(issue.category, []).append(issue)
+            self._by_severity.setdefault(issue.severity, []).append(issue)
+        self._indexed = len(self.issues)
+
     def get_issues_by_document(self, document: str) -> List[Issue]:
         """Get all issues for a specific document."""
-        return [i for i in self.issues if i.document == document]
-    
+        self._sync_index()
+        return list(self._by_document.get(document, ()))
+
     def get_issues_by_severity(self, severity: str) -> List[Issue]:
         """Get all issues of a specific severity."""
-        return [i for i in self.issues if i.severity == severity]
-    
+        self._sync_index()
+        return list(self._by_severity.get(severity, ()))
+
     def get_issues_by_category(self, category: str) -> List[Issue]:
         """Get all issues of a specific category."""
-        return [i for i in self.issues if i.category == category]
-    
+        self._sync_index()
+        return list(self._by_category.get(category, ()))
+
     def has_errors(self) -> bool:
         """Check if there are any error-level issues."""
-        return any(i.severity == 'error' for i in self.issues)
-    
+        self._sync_index()
+        return bool(self._by_severity.get('error'))
+
     def generate_summary(self) -> Dict:
         """Generate summary statistics."""
+        self._sync_index()
         return {
             'total_documents': len(self.documents_checked),
             'total_issues': len(self.issues),
-            'errors': len([i for i in self.issues if i.severity == 'error']),
-            'warnings': len([i for i in self.issues if i.severity == 'warning']),
-            'info': len([i for i in self.issues if i.severity == 'info']),
+            'errors': len(self._by_severity.get('error', ())),
+            'warnings': len(self._by_severity.get('warning', ())),
+            'info': len(self._by_severity.get('info', ())),
             'by_category': self._count_by_category(),
             'by_document': self._count_by_document(),
         }
-    
+
     def _count_by_category(self) -> Dict[str, int]:
         """Count issues by category."""
-        counts = {}
-        for issue in self.issues:
-            counts[issue.category] = counts.get(issue.category, 0) + 1
-        return counts
-    
+        return {category: len(issues) for category, issues in self._by_category.items()}
+
     def _count_by_document(self) -> Dict[str, int]:
         """Count issues by document."""
-        counts = {}
-        for issue in self.issues:
-            counts[issue.document] = counts.get(issue.document, 0) + 1
+        return {document: len(issues) for document, issues in self._by_document.items()}
+
+    def _count_by_document_severity(self) -> Dict[str, Dict[str, int]]:
+        """Count issues per document split by severity."""
+        counts = {doc: {'error': 0, 'warning': 0, 'info': 0} for doc in self.documents_checked}
+        for document, issues in self._by_document.items():
+            doc_counts = counts.setdefault(document, {'error': 0, 'warning': 0, 'info': 0})
+            for issue in issues:
+                doc_counts[issue.severity] = doc_counts.get(issue.severity, 0) + 1
         return counts
-    
-    def to_json(self, filepath: Path):
-        """Export report as JSON."""
-        data = {
+
+    def _document_sections(self) -> List[tuple]:
+        """(document, issues, checked) in report order: checked documents, then documents only seen in issues."""
+        self._sync_index()
+        sections = [(doc, self._by_document.get(doc, []), True) for doc in self.documents_checked]
+        checked = set(self.documents_checked)
+        sections.extend((doc, issues, False) for doc, issues in self._by_document.items() if doc not in checked)
+        return sections
+
+    def to_dict(self) -> Dict:
+        """Return the JSON-serializable report payload (same as `to_json` writes)."""
+        return {
             'timestamp': self.timestamp,
             'summary': self.generate_summary(),
             'documents': self.documents_checked,
-            'issues': [
-                {
-                    'document': i.document,
-                    'category': i.category,
-                    'severity': i.severity,
-                    'description': i.description,
-                    'expected': i.expected,
-                    'actual': i.actual,
-                    'location': i.location,
-                }
-                for i in self.issues
-            ]
+            'issues': [_issue_dict(issue) for issue in self.issues],
         }
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-    
+
+    def to_json(self, filepath: Path):
+        """Export report as JSON."""
+        self.write_reports({'json': filepath})
+
     def to_markdown(self, filepath: Path):
         """Export report as Markdown."""
-        lines = []
-        lines.append("# Отчёт проверки нормоконтроля\n")
-        lines.append(f"**Дата проверки:** {self.timestamp}\n")
-        
-        # Summary
+        self.write_reports({'markdown': filepath})
+
+    def to_text(self, filepath: Path):
+        """Export report as plain text."""
+        self.write_reports({'text': filepath})
+
+    def write_reports(self, targets: Dict[str, Path]):
+        """Write several formats ('markdown', 'json', 'text') in one pass over the documents.
+
+        Args:
+            targets: Output path by format name.
+        """
+        unknown = sorted(set(targets) - set(_WRITERS))
+        if unknown:
+            raise ValueError(f"Unknown report formats: {unknown}")
+
         summary = self.generate_summary()
-        lines.append("## Сводка\n")
-        lines.append(f"- **Проверено документов:** {summary['total_documents']}")
-        lines.append(f"- **Всего проблем:** {summary['total_issues']}")
-        lines.append(f"  - ❌ Ошибки: {summary['errors']}")
-        lines.append(f"  - ⚠️ Предупреждения: {summary['warnings']}")
-        lines.append(f"  - ℹ️ Информация: {summary['info']}\n")
-        
+        with ExitStack() as stack:
+            writers = [
+                _WRITERS[name](self, stack.enter_context(open(path, 'w', encoding='utf-8')))
+                for name, path in targets.items()
+            ]
+            for writer in writers:
+                writer.begin(summary)
+            for document, issues, checked in self._document_sections():
+                for writer in writers:
+                    writer.document(document, issues, checked)
+            for writer in writers:
+                writer.end()
+
+
+def _issue_dict(issue: Issue) -> Dict:
+    return {
+        'document': issue.document,
+        'category': issue.category,
+        'severity': issue.severity,
+        'description': issue.description,
+        'expected': issue.expected,
+        'actual': issue.actual,
+        'location': issue.location,
+    }
+
+
+class _LineWriter:
+    """Writes lines separated (not terminated) by newlines, as '\\n'.join would."""
+
+    def __init__(self, report: NormocontrolReport, out: TextIO):
+        self.report = report
+        self._out = out
+        self._first = True
+
+    def line(self, text: str = ""):
+        if not self._first:
+            self._out.write("\n")
+        self._first = False
+        self._out.write(text)
+
+
+class _MarkdownWriter(_LineWriter):
+    """Markdown report: summary, categories, per-document table and issues by category."""
+
+    def begin(self, summary: Dict):
+        report = self.report
+        self.line("# Отчёт проверки нормоконтроля\n")
+        self.line(f"**Дата проверки:** {report.timestamp}\n")
+
+        # Summary
+        self.line("## Сводка\n")
+        self.line(f"- **Проверено документов:** {summary['total_documents']}")
+        self.line(f"- **Всего проблем:** {summary['total_issues']}")
+        self.line(f"  - ❌ Ошибки: {summary['errors']}")
+        self.line(f"  - ⚠️ Предупреждения: {summary['warnings']}")
+        self.line(f"  - ℹ️ Информация: {summary['info']}\n")
+
         # By category
         if summary['by_category']:
-            lines.append("### По категориям\n")
+            self.line("### По категориям\n")
             for category, count in sorted(summary['by_category'].items()):
-                lines.append(f"- **{category}:** {count}")
-            lines.append("")
-        
-        # Issues by document
-        for doc in self.documents_checked:
-            doc_issues = self.get_issues_by_document(doc)
-            
-            lines.append(f"## {doc}\n")
-            
-            if not doc_issues:
-                lines.append("✅ Проблем не обнаружено\n")
-                continue
-            
-            lines.append(f"**Найдено проблем:** {len(doc_issues)}\n")
-            
-            # Group by category
-            by_cat = {}
-            for issue in doc_issues:
-                if issue.category not in by_cat:
-                    by_cat[issue.category] = []
-                by_cat[issue.category].append(issue)
-            
-            for category, cat_issues in sorted(by_cat.items()):
-                lines.append(f"### {category.title()}\n")
-                
-                for issue in cat_issues:
-                    icon = {'error': '❌', 'warning': '⚠️', 'info': 'ℹ️'}.get(issue.severity, '•')
-                    lines.append(f"{icon} **{issue.description}**")
-                    
-                    if issue.expected:
-                        lines.append(f"  - Ожидается: `{issue.expected}`")
-                    if issue.actual:
-                        lines.append(f"  - Фактически: `{issue.actual}`")
-                    if issue.location:
-                        lines.append(f"  - Расположение: {issue.location}")
-                    lines.append("")
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(lines))
-    
-    def to_text(self, filepath: Path):
-        """Export report as plain text."""
-        lines = []
-        lines.append("=" * 80)
-        lines.append("ОТЧЁТ ПРОВЕРКИ НОРМОКОНТРОЛЯ")
-        lines.append("=" * 80)
-        lines.append(f"Дата: {self.timestamp}\n")
-        
-        summary = self.generate_summary()
-        lines.append("СВОДКА:")
-        lines.append(f"  Проверено документов: {summary['total_documents']}")
-        lines.append(f"  Всего проблем: {summary['total_issues']}")
-        lines.append(f"    - Ошибки: {summary['errors']}")
-        lines.append(f"    - Предупреждения: {summary['warnings']}")
-        lines.append(f"    - Информация: {summary['info']}\n")
-        
-        for doc in self.documents_checked:
-            doc_issues = self.get_issues_by_document(doc)
-            
-            lines.append("-" * 80)
-            lines.append(f"ДОКУМЕНТ: {doc}")
-            lines.append("-" * 80)
-            
-            if not doc_issues:
-                lines.append("  ✓ Проблем не обнаружено\n")
-                continue
-            
-            lines.append(f"  Найдено проблем: {len(doc_issues)}\n")
-            
-            for i, issue in enumerate(doc_issues, 1):
-                severity_label = {'error': 'ОШИБКА', 'warning': 'ПРЕДУПРЕЖДЕНИЕ', 'info': 'ИНФОРМАЦИЯ'}
-                lines.append(f"  {i}. [{severity_label[issue.severity]}] {issue.category.upper()}")
-                lines.append(f"     {issue.description}")
-                
+                self.line(f"- **{category}:** {count}")
+            self.line("")
+
+        # Cross-document summary table (batch runs)
+        if len(report.documents_checked) > 1:
+            self.line("### По документам\n")
+            self.line("| Документ | ❌ Ошибки | ⚠️ Предупреждения | ℹ️ Информация |")
+            self.line("|---|---|---|---|")
+            for doc, counts in report._count_by_document_severity().items():
+                self.line(f"| {doc} | {counts['error']} | {counts['warning']} | {counts['info']} |")
+            self.line("")
+
+    def document(self, doc: str, doc_issues: List[Issue], checked: bool):
+        if not checked:
+            return  # documents not marked as checked are only counted in the summary
+
+        self.line(f"## {doc}\n")
+
+        if not doc_issues:
+            self.line("✅ Проблем не обнаружено\n")
+            return
+
+        self.line(f"**Найдено проблем:** {len(doc_issues)}\n")
+
+        # Group by category
+        by_cat: Dict[str, List[Issue]] = {}
+        for issue in doc_issues:
+            by_cat.setdefault(issue.category, []).append(issue)
+
+        for category, cat_issues in sorted(by_cat.items()):
+            self.line(f"### {category.title()}\n")
+
+            for issue in cat_issues:
+                icon = {'error': '❌', 'warning': '⚠️', 'info': 'ℹ️'}.get(issue.severity, '•')
+                self.line(f"{icon} **{issue.description}**")
+
                 if issue.expected:
-                    lines.append(f"     Ожидается: {issue.expected}")
+                    self.line(f"  - Ожидается: `{issue.expected}`")
                 if issue.actual:
-                    lines.append(f"     Фактически: {issue.actual}")
+                    self.line(f"  - Фактически: `{issue.actual}`")
                 if issue.location:
-                    lines.append(f"     Расположение: {issue.location}")
-                lines.append("")
-        
-        lines.append("=" * 80)
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(lines))
+                    self.line(f"  - Расположение: {issue.location}")
+                self.line("")
+
+    def end(self):
+        pass
+
+
+class _TextWriter(_LineWriter):
+    """Plain-text report: summary and numbered issues per document."""
+
+    def begin(self, summary: Dict):
+        self.line("=" * 80)
+        self.line("ОТЧЁТ ПРОВЕРКИ НОРМОКОНТРОЛЯ")
+        self.line("=" * 80)
+        self.line(f"Дата: {self.report.timestamp}\n")
+
+        self.line("СВОДКА:")
+        self.line(f"  Проверено документов: {summary['total_documents']}")
+        self.line(f"  Всего проблем: {summary['total_issues']}")
+        self.line(f"    - Ошибки: {summary['errors']}")
+        self.line(f"    - Предупреждения: {summary['warnings']}")
+        self.line(f"    - Информация: {summary['info']}\n")
+
+    def document(self, doc: str, doc_issues: List[Issue], checked: bool):
+        if not checked:
+            return
+
+        self.line("-" * 80)
+        self.line(f"ДОКУМЕНТ: {doc}")
+        self.line("-" * 80)
+
+        if not doc_issues:
+            self.line("  ✓ Проблем не обнаружено\n")
+            return
+
+        self.line(f"  Найдено проблем: {len(doc_issues)}\n")
+
+        severity_label = {'error': 'ОШИБКА', 'warning': 'ПРЕДУПРЕЖДЕНИЕ', 'info': 'ИНФОРМАЦИЯ'}
+        for i, issue in enumerate(doc_issues, 1):
+            self.line(f"  {i}. [{severity_label[issue.severity]}] {issue.category.upper()}")
+            self.line(f"     {issue.description}")
+
+            if issue.expected:
+                self.line(f"     Ожидается: {issue.expected}")
+            if issue.actual:
+                self.line(f"     Фактически: {issue.actual}")
+            if issue.location:
+                self.line(f"     Расположение: {issue.location}")
+            self.line("")
+
+    def end(self):
+        self.line("=" * 80)
+
+
+class _JsonWriter:
+    """JSON report streamed issue by issue (same text as `json.dump(to_dict(), indent=2)`).
+
+    Issues are written in insertion order after the document sections,
+    not grouped by document.
+    """
+
+    def __init__(self, report: NormocontrolReport, out: TextIO):
+        self.report = report
+        self._out = out
+
+    @staticmethod
+    def _dumps(value, indent: int) -> str:
+        text = json.dumps(value, ensure_ascii=False, indent=2)
+        return text.replace("\n", "\n" + " " * indent)
+
+    def begin(self, summary: Dict):
+        write = self._out.write
+        write("{\n")
+        write(f'  "timestamp": {self._dumps(self.report.timestamp, 2)},\n')
+        write(f'  "summary": {self._dumps(summary, 2)},\n')
+        write(f'  "documents": {self._dumps(self.report.documents_checked, 2)},\n')
+        write('  "issues": [')
+
+    def document(self, doc: str, doc_issues: List[Issue], checked: bool):
+        pass
+
+    def end(self):
+        write = self._out.write
+        for i, issue in enumerate(self.report.issues):
+            write(",\n    " if i else "\n    ")
+            write(self._dumps(_issue_dict(issue), 4))
+        write("\n  ]\n}" if self.report.issues else "]\n}")
+
+
+_WRITERS = {
+    'markdown': _MarkdownWriter,
+    'json': _JsonWriter,
+    'text': _TextWriter,
+}
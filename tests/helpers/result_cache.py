@@ -0,0 +1,168 @@
+"""
+Persistent content-addressed cache of normocontrol results.
+
+Entries are keyed by the SHA-256 of the document bytes combined with a salt
+(hash of the checklist markdown + checker version), so a re-run on an
+unchanged document returns the stored issues without parsing anything.
+Least recently used entries are evicted once the entry count or total size
+exceeds the configured caps.
+
+`FactsStore` keeps, per document name, the per-paragraph facts table of the
+last check (see `paragraph_facts`), so a new revision of the same document
+is re-checked incrementally.
+"""
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import asdict
+from pathlib import Path
+from typing import List, Optional
+
+from tests.helpers.report import Issue
+
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+def file_sha256(path: Path) -> str:
+    """Return hex SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _write_atomic(path: Path, data: dict) -> None:
+    """
+    Write JSON to a temp file first so concurrent readers never see a partial entry.
+
+    The temp file is unique per call (not per process): threads of the check
+    server may write the same entry at once.
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(data, ensure_ascii=False))
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _evict_lru(cache_dir: Path, max_entries: int, max_bytes: int) -> None:
+    """Drop the oldest `*.json` entries of a directory until both caps are satisfied."""
+    entries = []
+    for path in cache_dir.glob("*.json"):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+
+    total_bytes = sum(size for _, size, _ in entries)
+    count = len(entries)
+    if count <= max_entries and total_bytes <= max_bytes:
+        return
+
+    entries.sort()
+    for _, size, path in entries:
+        if count <= max_entries and total_bytes <= max_bytes:
+            break
+        try:
+            path.unlink()
+        except OSError:
+            continue
+        count -= 1
+        total_bytes -= size
+
+
+class ResultCache:
+    """
+    On-disk cache mapping document content to its list of issues.
+
+    Issues are stored without the document name, so the same entry serves
+    a document regardless of the name it is reported under.
+    """
+
+    def __init__(self, cache_dir: Path, salt: str,
+                 max_entries: int = 512, max_bytes: int = 32 * 1024 * 1024):
+        self.cache_dir = Path(cache_dir)
+        self.salt = salt
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+    def key_for(self, docx_path: Path) -> str:
+        """Cache key of a document: hash of its bytes plus the cache salt."""
+        return hashlib.sha256(f"{self.salt}:{file_sha256(docx_path)}".encode()).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str, document: str) -> Optional[List[Issue]]:
+        """
+        Return cached issues for a key (re-labelled with `document`), or None on miss.
+
+        A hit refreshes the entry's mtime, which drives LRU eviction.
+        """
+        path = self._entry_path(key)
+        try:
+            data = json.loads(path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        return [Issue(document=document, **fields) for fields in data.get('issues', [])]
+
+    def put(self, key: str, issues: List[Issue]) -> None:
+        """Store issues for a key and evict least recently used entries if needed."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        records = []
+        for issue in issues:
+            fields = asdict(issue)
+            fields.pop('document')
+            records.append(fields)
+
+        _write_atomic(self._entry_path(key), {'issues': records})
+        _evict_lru(self.cache_dir, self.max_entries, self.max_bytes)
+
+
+class FactsStore:
+    """
+    On-disk per-document store of paragraph facts tables.
+
+    Entries are keyed by document path or name (not content): the point is
+    to find the previous revision of a changed document. A table written with
+    another salt (checklist or checker changed) is ignored.
+    """
+
+    def __init__(self, cache_dir: Path, salt: str,
+                 max_entries: int = 256, max_bytes: int = 128 * 1024 * 1024):
+        self.cache_dir = Path(cache_dir)
+        self.salt = salt
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+    def _entry_path(self, document: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha256(document.encode()).hexdigest()}.json"
+
+    def load(self, document: str) -> Optional[dict]:
+        """Return the facts table stored for a document, or None."""
+        try:
+            data = json.loads(self._entry_path(document).read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(data, dict) or data.get('salt') != self.salt:
+            return None
+        return data.get('facts')
+
+    def save(self, document: str, facts: dict) -> None:
+        """Store the facts table of a document and evict least recently written entries if needed."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        _write_atomic(self._entry_path(document), {'salt': self.salt, 'facts': facts})
+        _evict_lru(self.cache_dir, self.max_entries, self.max_bytes)
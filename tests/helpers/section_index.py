@@ -0,0 +1,229 @@
+"""
+Structural sections of a document: «Реферат», «Введение», «Заключение», …
+
+`SectionIndex` is a facts-aware scanner visitor (see `ooxml_scan`) that
+collects heading candidates in the single streaming pass: headings by
+outline level (as detected by the paragraph index) and short standalone
+body paragraphs (documents without heading styles). Contents entries are
+left out — paragraphs with a «toc N» style or a TOC/PAGEREF field, lines
+ending with a tab and a page number, and everything from the
+«Содержание»/«Оглавление» title to the next heading or page/section break.
+
+`find_sections` then matches all candidates against all section titles at
+once: the titles are normalized (case, «ё», numbering, punctuation,
+parenthetical remarks such as «(при необходимости)») and compiled into a
+keyword trie, which every candidate walks once from its first character.
+Headings must *start* with a title, so this is the goto part of an
+Aho–Corasick automaton without failure links: "3.5 Запуск приложения"
+does not match «Приложения».
+"""
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from lxml import etree
+
+from tests.helpers.ooxml_utils import NS, get_paragraph_text
+
+
+CONTENTS_TITLES = ("содержание", "оглавление")
+TITLE_PAGE = "титульный лист"
+MAIN_PART = "основная часть"
+INTRODUCTION = "введение"
+
+# Accepted spellings of a normalized title besides the title itself.
+SECTION_ALIASES: Dict[str, Tuple[str, ...]] = {
+    "оглавление": ("содержание",),
+    "содержание": ("оглавление",),
+    "приложения": ("приложение",),
+    "приложение": ("приложения",),
+    "список использованных источников": ("список использованной литературы", "список литературы"),
+}
+
+MAX_TITLE_LENGTH = 100
+
+_PARENTHETICAL_RE = re.compile(r"\([^()]*\)")
+_OPTIONAL_RE = re.compile(r"\(\s*при\s+необходимости\s*\)", re.IGNORECASE)
+_NUMBERING_RE = re.compile(r"^(?:\d+(?:\.\d+)*\.?|[ivx]+\.)\s+")
+_NON_WORD_RE = re.compile(r"[\W_]+")
+# "Введение\t3", "Введение ........ 3": a contents entry with its page number.
+_CONTENTS_ENTRY_RE = re.compile(r"\t[\s.…·_]*\d+$")
+_TOC_STYLE_RE = re.compile(r"^(?:toc|оглавление)\s*\d", re.IGNORECASE)
+# Text after a title that still makes a standalone paragraph a section title ("Приложение А").
+_LABEL_RE = re.compile(r"^\w{1,2}$")
+
+_BODY_PARENTS = {f"{{{NS['w']}}}body", f"{{{NS['w']}}}sdtContent"}
+_W_P_PR = f"{{{NS['w']}}}pPr"
+_W_SECT_PR = f"{{{NS['w']}}}sectPr"
+_W_BR = f"{{{NS['w']}}}br"
+_W_TYPE = f"{{{NS['w']}}}type"
+_W_INSTR_TEXT = f"{{{NS['w']}}}instrText"
+
+_END = ""  # trie node key of a complete title (never a character of normalized text)
+
+
+def normalize_title(text: str) -> str:
+    """Comparable form of a heading or title: "1.2 Введение (кратко)." → "введение"."""
+    text = _PARENTHETICAL_RE.sub(" ", text.lower().replace("ё", "е")).strip()
+    text = _NUMBERING_RE.sub("", text)
+    return " ".join(_NON_WORD_RE.sub(" ", text).split())
+
+
+def is_optional_title(title: str) -> bool:
+    """Whether a checklist title is marked «(при необходимости)»."""
+    return _OPTIONAL_RE.search(title) is not None
+
+
+class TitleTrie:
+    """
+    Keyword trie over normalized section titles and their aliases.
+
+    Args:
+        titles: Section titles as written in the checklist; matches report
+            these original strings
+    """
+
+    def __init__(self, titles: Iterable[str]):
+        self._root: dict = {}
+        for title in titles:
+            key = normalize_title(title)
+            for variant in (key, *SECTION_ALIASES.get(key, ())):
+                if not variant:
+                    continue
+                node = self._root
+                for char in variant:
+                    node = node.setdefault(char, {})
+                node.setdefault(_END, title)
+
+    def match(self, text: str) -> Optional[Tuple[str, str]]:
+        """(title, remaining text) of the longest title `text` starts with (at a word boundary), or None."""
+        node = self._root
+        found = None
+        length = len(text)
+        for position, char in enumerate(text):
+            node = node.get(char)
+            if node is None:
+                break
+            if _END in node and (position + 1 == length or text[position + 1] == " "):
+                found = (node[_END], text[position + 1:].strip())
+        return found
+
+
+class SectionIndex:
+    """
+    Scanner visitor collecting section heading candidates outside the contents.
+
+    Args:
+        index: `ParagraphIndex` visited before this index
+        styles: `StyleResolver` of the document (contents entry styles)
+    """
+
+    facts_name = "sections"
+
+    def __init__(self, index, styles):
+        self._index = index
+        self._styles = styles
+
+        # (ordinal, outline level or None for a standalone paragraph, normalized text).
+        self.candidates: List[Tuple[int, Optional[int], str]] = []
+        self.contents_heading: Optional[int] = None
+        self._in_contents = False
+
+    def paragraph_facts(self, paragraph: etree._Element) -> Optional[List]:
+        """[normalized text, contents entry, page end] of a body paragraph, None if irrelevant."""
+        parent = paragraph.getparent()
+        if parent is None or parent.tag not in _BODY_PARENTS:
+            return None
+
+        p_pr = paragraph.find(_W_P_PR)
+        page_end = (p_pr is not None and p_pr.find(_W_SECT_PR) is not None) or any(
+            br.get(_W_TYPE) == "page" for br in paragraph.iter(_W_BR)
+        )
+        text = get_paragraph_text(paragraph).strip()
+        title = normalize_title(text) if len(text) <= MAX_TITLE_LENGTH else ""
+        if not title and not page_end:
+            return None
+
+        entry = False
+        if title:
+            style_name = self._styles.style_name(self._styles.paragraph_style_id(paragraph))
+            entry = (
+                _CONTENTS_ENTRY_RE.search(text) is not None
+                or (style_name is not None and _TOC_STYLE_RE.match(style_name) is not None)
+                or any(
+                    word in (instr.text or "")
+                    for instr in paragraph.iter(_W_INSTR_TEXT)
+                    for word in ("TOC", "PAGEREF")
+                )
+            )
+        return [title, entry, page_end]
+
+    def visit_paragraph_facts(self, paragraph: etree._Element, facts: Optional[List]) -> None:
+        """Record a heading candidate, or skip it inside the contents."""
+        ordinal = self._index.last
+        level = self._index.heading_levels.get(ordinal)
+        if level is not None:
+            self._in_contents = False
+        if facts is None:
+            return
+
+        title, entry, page_end = facts
+        if title and not entry and not self._in_contents:
+            self.candidates.append((ordinal, level, title))
+            if self.contents_heading is None and title in CONTENTS_TITLES:
+                self.contents_heading = ordinal
+                self._in_contents = True
+                return
+        if page_end:
+            self._in_contents = False
+
+    def find_sections(self, titles: List[str]) -> Dict[str, int]:
+        """
+        Ordinal of the first paragraph of every found section, by title.
+
+        A heading by outline level matches if it is the title (level 0: if it
+        starts with the title, "Задание на курсовой проект"); a standalone
+        paragraph matches if it is the title, optionally followed by a label
+        ("Приложение А"). Heading matches win over standalone ones.
+
+        «Титульный лист» and «Основная часть» have no heading of their own:
+        the title page is found if some paragraph precedes the first found
+        section; the main part starts at the first heading between «Введение»
+        and the next found section (without such headings: right after the
+        introduction, if other paragraphs precede the next section).
+        """
+        trie = TitleTrie(titles)
+        best: Dict[str, Tuple[bool, int]] = {}
+        for ordinal, level, text in self.candidates:
+            match = trie.match(text)
+            if match is None:
+                continue
+            title, remainder = match
+            if remainder and level != 0 and _LABEL_RE.match(remainder) is None:
+                continue
+            rank = (level is None, ordinal)
+            if title not in best or rank < best[title]:
+                best[title] = rank
+        positions = {title: ordinal for title, (_, ordinal) in best.items()}
+
+        keys = {normalize_title(title): title for title in titles}
+        main_part = keys.get(MAIN_PART)
+        if main_part is not None:
+            start = self._main_part_start(positions, keys.get(INTRODUCTION))
+            if start is not None:
+                positions[main_part] = start
+        title_page = keys.get(TITLE_PAGE)
+        if title_page is not None and positions and min(positions.values()) > 0:
+            positions[title_page] = 0
+        return positions
+
+    def _main_part_start(self, positions: Dict[str, int], introduction: Optional[str]) -> Optional[int]:
+        """First paragraph of the main part (see `find_sections`), or None."""
+        after = positions.get(introduction, self.contents_heading if self.contents_heading is not None else -1)
+        following = [ordinal for ordinal in positions.values() if ordinal > after]
+        end = min(following) if following else self._index.count
+        for ordinal, level, _ in self.candidates:
+            if after < ordinal < end and level is not None:
+                return ordinal
+        if introduction in positions and after + 1 < end:
+            return after + 1
+        return None
@@ -0,0 +1,313 @@
+"""
+Effective (inherited) formatting of paragraphs and runs.
+
+Word resolves formatting in layers: document defaults (w:docDefaults) →
+paragraph style with its w:basedOn chain → character style chain → direct
+w:pPr/w:rPr. `StyleResolver` applies the same layering; every style is
+resolved once per document and memoized, so looking up a run's effective
+font and size is a dictionary hit plus the overlay of its own w:rPr.
+
+Property dicts use the same keys as `ooxml_utils.get_paragraph_properties`
+and `ooxml_utils.get_run_properties`:
+- paragraph: 'spacing', 'ind' (dicts of raw attribute strings), 'jc',
+  'pageBreakBefore', 'outlineLvl' (int, 0 = top-level heading), 'style'
+- run: 'sz' (half-points), 'rFonts' (ascii/hAnsi/cs, theme fonts resolved),
+  'b', 'i'
+
+Returned dicts may be shared between calls and must not be modified.
+Table styles and conditional formatting are not applied.
+"""
+from typing import Any, Dict, Optional, Tuple
+
+from lxml import etree
+
+from tests.helpers.ooxml_utils import NS
+
+
+_W = NS['w']
+_A = "http://schemas.openxmlformats.org/drawingml/2006/main"
+
+W_STYLE = f"{{{_W}}}style"
+W_NAME = f"{{{_W}}}name"
+W_PPR = f"{{{_W}}}pPr"
+W_RPR = f"{{{_W}}}rPr"
+W_RSTYLE = f"{{{_W}}}rStyle"
+W_P = f"{{{_W}}}p"
+W_SPACING = f"{{{_W}}}spacing"
+W_IND = f"{{{_W}}}ind"
+W_JC = f"{{{_W}}}jc"
+W_PAGE_BREAK_BEFORE = f"{{{_W}}}pageBreakBefore"
+W_OUTLINE_LVL = f"{{{_W}}}outlineLvl"
+W_SZ = f"{{{_W}}}sz"
+W_RFONTS = f"{{{_W}}}rFonts"
+W_B = f"{{{_W}}}b"
+W_I = f"{{{_W}}}i"
+_W_VAL = f"{{{_W}}}val"
+_W_TYPE = f"{{{_W}}}type"
+_W_STYLE_ID = f"{{{_W}}}styleId"
+_W_DEFAULT = f"{{{_W}}}default"
+
+_SPACING_ATTRS = ('line', 'lineRule', 'before', 'after')
+_IND_ATTRS = ('left', 'right', 'firstLine', 'hanging')
+_FONT_SLOTS = (('ascii', 'asciiTheme'), ('hAnsi', 'hAnsiTheme'), ('cs', 'cstheme'))
+
+_OFF_VALUES = ("0", "false", "off")
+
+_XP_DOC_PPR = etree.XPath("w:docDefaults/w:pPrDefault/w:pPr", namespaces=NS)
+_XP_DOC_RPR = etree.XPath("w:docDefaults/w:rPrDefault/w:rPr", namespaces=NS)
+_XP_P_STYLE = etree.XPath("w:pPr/w:pStyle/@w:val", namespaces=NS)
+
+Properties = Dict[str, Any]
+
+
+def _on(element: etree._Element) -> bool:
+    """Value of an OOXML on/off property element."""
+    return element.get(_W_VAL, "true") not in _OFF_VALUES
+
+
+def _theme_fonts(theme: Optional[etree._Element]) -> Dict[str, str]:
+    """Map theme font references (e.g. 'minorHAnsi') to typeface names."""
+    if theme is None:
+        return {}
+    fonts = {}
+    for kind in ('major', 'minor'):
+        font = theme.find(f".//{{{_A}}}{kind}Font")
+        if font is None:
+            continue
+        latin = font.find(f"{{{_A}}}latin")
+        cs = font.find(f"{{{_A}}}cs")
+        east_asia = font.find(f"{{{_A}}}ea")
+        if latin is not None and latin.get("typeface"):
+            fonts[f"{kind}Ascii"] = fonts[f"{kind}HAnsi"] = latin.get("typeface")
+        if cs is not None and cs.get("typeface"):
+            fonts[f"{kind}Bidi"] = cs.get("typeface")
+        if east_asia is not None and east_asia.get("typeface"):
+            fonts[f"{kind}EastAsia"] = east_asia.get("typeface")
+    return fonts
+
+
+def _merge(base: Properties, overlay: Properties) -> Properties:
+    """Overlay one property layer on another (nested dicts merge per attribute)."""
+    if not overlay:
+        return base
+    if not base:
+        return overlay
+    merged = dict(base)
+    for key, value in overlay.items():
+        if isinstance(value, dict):
+            merged[key] = {**base.get(key, {}), **value}
+        else:
+            merged[key] = value
+    return merged
+
+
+class StyleResolver:
+    """
+    Memoizing resolver of effective paragraph and run formatting.
+
+    Usage:
+        styles = StyleResolver(parsed.styles, parsed.theme)
+        p_props = styles.paragraph_properties(paragraph)
+        r_props = styles.run_properties(run, p_props.get('style'))
+    """
+
+    def __init__(self, styles: Optional[etree._Element], theme: Optional[etree._Element] = None):
+        self._theme_fonts = _theme_fonts(theme)
+        self._styles: Dict[str, etree._Element] = {}
+        self._default_style: Dict[str, str] = {}
+
+        doc_ppr: Properties = {}
+        doc_rpr: Properties = {}
+        if styles is not None:
+            for style in styles.iter(W_STYLE):
+                style_id = style.get(_W_STYLE_ID)
+                if style_id is None:
+                    continue
+                self._styles[style_id] = style
+                style_type = style.get(_W_TYPE, 'paragraph')
+                if style.get(_W_DEFAULT) in ("1", "true", "on"):
+                    self._default_style.setdefault(style_type, style_id)
+            defaults = _XP_DOC_PPR(styles)
+            if defaults:
+                doc_ppr = self._ppr_layer(defaults[0])
+            defaults = _XP_DOC_RPR(styles)
+            if defaults:
+                doc_rpr = self._rpr_layer(defaults[0])
+        self._doc_defaults: Tuple[Properties, Properties] = (doc_ppr, doc_rpr)
+
+        self._style_cache: Dict[Optional[str], Tuple[Properties, Properties]] = {}
+        self._paragraph_base_cache: Dict[Optional[str], Properties] = {}
+        self._run_base_cache: Dict[Tuple[Optional[str], Optional[str]], Properties] = {}
+        self._resolving: set = set()
+        # Runs are visited paragraph by paragraph: remember the last paragraph's style.
+        self._last_paragraph: Optional[etree._Element] = None
+        self._last_paragraph_style: Optional[str] = None
+        # Several checks look up the same paragraph in a row.
+        self._last_props_paragraph: Optional[etree._Element] = None
+        self._last_props: Properties = {}
+
+    # -- layers ------------------------------------------------------------
+
+    def _ppr_layer(self, p_pr: etree._Element) -> Properties:
+        """Properties set by a single w:pPr element."""
+        layer: Properties = {}
+        for child in p_pr:
+            tag = child.tag
+            if tag == W_SPACING:
+                values = {a: child.get(f"{{{_W}}}{a}") for a in _SPACING_ATTRS}
+                layer['spacing'] = {k: v for k, v in values.items() if v is not None}
+            elif tag == W_IND:
+                values = {a: child.get(f"{{{_W}}}{a}") for a in _IND_ATTRS}
+                # Word 2010+ writes start/end instead of left/right.
+                values['left'] = values['left'] or child.get(f"{{{_W}}}start")
+                values['right'] = values['right'] or child.get(f"{{{_W}}}end")
+                layer['ind'] = {k: v for k, v in values.items() if v is not None}
+                if 'firstLine' in layer['ind']:
+                    layer['ind'].setdefault('hanging', None)
+                elif 'hanging' in layer['ind']:
+                    layer['ind']['firstLine'] = None
+            elif tag == W_JC:
+                layer['jc'] = child.get(_W_VAL)
+            elif tag == W_PAGE_BREAK_BEFORE:
+                layer['pageBreakBefore'] = _on(child)
+            elif tag == W_OUTLINE_LVL:
+                try:
+                    layer['outlineLvl'] = int(child.get(_W_VAL))
+                except (TypeError, ValueError):
+                    pass
+        return layer
+
+    def _rpr_layer(self, r_pr: etree._Element) -> Properties:
+        """Properties set by a single w:rPr element (theme fonts resolved)."""
+        layer: Properties = {}
+        for child in r_pr:
+            tag = child.tag
+            if tag == W_SZ:
+                try:
+                    layer['sz'] = int(child.get(_W_VAL))
+                except (TypeError, ValueError):
+                    pass
+            elif tag == W_RFONTS:
+                fonts = {}
+                for slot, theme_attr in _FONT_SLOTS:
+                    theme_ref = child.get(f"{{{_W}}}{theme_attr}")
+                    value = self._theme_fonts.get(theme_ref) if theme_ref else None
+                    value = value or child.get(f"{{{_W}}}{slot}")
+                    if value:
+                        fonts[slot] = value
+                if fonts:
+                    layer['rFonts'] = fonts
+            elif tag == W_B:
+                layer['b'] = _on(child)
+            elif tag == W_I:
+                layer['i'] = _on(child)
+        return layer
+
+    # -- styles ------------------------------------------------------------
+
+    def _style_layers(self, style_id: Optional[str]) -> Tuple[Properties, Properties]:
+        """Resolved (pPr, rPr) of a style including its basedOn chain, without doc defaults."""
+        if style_id in self._style_cache:
+            return self._style_cache[style_id]
+
+        style = self._styles.get(style_id) if style_id is not None else None
+        if style is None or style_id in self._resolving:
+            return {}, {}
+
+        self._resolving.add(style_id)
+        try:
+            based_on = style.find("w:basedOn", namespaces=NS)
+            if based_on is not None:
+                ppr, rpr = self._style_layers(based_on.get(_W_VAL))
+            else:
+                ppr, rpr = {}, {}
+            p_pr = style.find("w:pPr", namespaces=NS)
+            if p_pr is not None:
+                ppr = _merge(ppr, self._ppr_layer(p_pr))
+            r_pr = style.find("w:rPr", namespaces=NS)
+            if r_pr is not None:
+                rpr = _merge(rpr, self._rpr_layer(r_pr))
+        finally:
+            self._resolving.discard(style_id)
+
+        self._style_cache[style_id] = (ppr, rpr)
+        return ppr, rpr
+
+    def paragraph_style_id(self, paragraph: etree._Element) -> Optional[str]:
+        """Style id applied to a paragraph (explicit w:pStyle or the default paragraph style)."""
+        style = _XP_P_STYLE(paragraph)
+        if style and style[0] in self._styles:
+            return style[0]
+        return self._default_style.get('paragraph')
+
+    def style_name(self, style_id: Optional[str]) -> Optional[str]:
+        """Name of a style as stored in styles.xml (e.g. "toc 1"), None for unknown styles."""
+        style = self._styles.get(style_id) if style_id is not None else None
+        name = style.find(W_NAME) if style is not None else None
+        return name.get(_W_VAL) if name is not None else None
+
+    def paragraph_style_properties(self, style_id: Optional[str]) -> Properties:
+        """Effective paragraph properties of a paragraph style (doc defaults included)."""
+        cached = self._paragraph_base_cache.get(style_id)
+        if cached is None:
+            cached = _merge(self._doc_defaults[0], self._style_layers(style_id)[0])
+            if style_id is not None:
+                cached = {**cached, 'style': style_id}
+            self._paragraph_base_cache[style_id] = cached
+        return cached
+
+    def default_run_properties(self, paragraph_style_id: Optional[str],
+                               character_style_id: Optional[str] = None) -> Properties:
+        """Effective run properties given by doc defaults and the styles alone."""
+        key = (paragraph_style_id, character_style_id)
+        cached = self._run_base_cache.get(key)
+        if cached is None:
+            cached = _merge(self._doc_defaults[1], self._style_layers(paragraph_style_id)[1])
+            if character_style_id is not None:
+                cached = _merge(cached, self._style_layers(character_style_id)[1])
+            self._run_base_cache[key] = cached
+        return cached
+
+    # -- elements ----------------------------------------------------------
+
+    def paragraph_properties(self, paragraph: etree._Element) -> Properties:
+        """Effective properties of a w:p: doc defaults → style chain → direct w:pPr."""
+        if paragraph is self._last_props_paragraph:
+            return self._last_props
+        props = self.paragraph_style_properties(self.paragraph_style_id(paragraph))
+        p_pr = paragraph.find(W_PPR)
+        if p_pr is not None:
+            props = _merge(props, self._ppr_layer(p_pr))
+        self._last_props_paragraph = paragraph
+        self._last_props = props
+        return props
+
+    def run_properties(self, run: etree._Element, paragraph_style_id: Optional[str] = None) -> Properties:
+        """
+        Effective properties of a w:r: doc defaults → paragraph style chain →
+        character style chain → direct w:rPr.
+
+        Args:
+            run: Run element
+            paragraph_style_id: Style id of the containing paragraph, as
+                returned by `paragraph_style_id` (looked up when omitted)
+        """
+        if paragraph_style_id is None:
+            paragraph = run.getparent()
+            if paragraph is not None and paragraph.tag != W_P:
+                paragraph = next(paragraph.iterancestors(W_P), None)
+            if paragraph is not self._last_paragraph:
+                self._last_paragraph = paragraph
+                self._last_paragraph_style = self.paragraph_style_id(paragraph) if paragraph is not None else None
+            paragraph_style_id = self._last_paragraph_style
+        r_pr = run.find(W_RPR)
+        character_style = r_pr.find(W_RSTYLE) if r_pr is not None else None
+        if character_style is not None:
+            character_style_id = character_style.get(_W_VAL)
+        else:
+            character_style_id = self._default_style.get('character')
+        base = self.default_run_properties(paragraph_style_id, character_style_id)
+
+        if r_pr is None:
+            return base
+        return _merge(base, self._rpr_layer(r_pr))
@@ -0,0 +1,48 @@
+"""
+Synthetic word/document.xml for unit tests of the scanner visitors.
+
+Blocks are WordprocessingML fragments with the `w:` prefix (paragraphs
+built by `paragraph`, raw `<w:tbl>`, `<w:sectPr>`, …); `document_xml`
+wraps them into a document body and `scan` runs visitors over it in one
+streaming pass, as the checker does for a real document.
+"""
+from io import BytesIO
+from typing import List
+
+from tests.helpers.ooxml_scan import scan_stream
+from tests.helpers.paragraph_index import ParagraphIndex
+from tests.helpers.styles import StyleResolver
+
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+PAGE_BREAK = '<w:r><w:br w:type="page"/></w:r>'
+
+
+def outline_level(level: int = 0) -> str:
+    """pPr content making a paragraph a heading by direct formatting."""
+    return f'<w:outlineLvl w:val="{level}"/>'
+
+
+def text_run(text: str) -> str:
+    return f"<w:r><w:t>{text}</w:t></w:r>"
+
+
+def paragraph(text: str = "", ppr: str = "", runs: str = "") -> str:
+    """`w:p` with optional pPr content, raw runs and then a run with `text`."""
+    p_pr = f"<w:pPr>{ppr}</w:pPr>" if ppr else ""
+    return f"<w:p>{p_pr}{runs}{text_run(text) if text else ''}</w:p>"
+
+
+def document_xml(*blocks: str) -> bytes:
+    return f'<w:document xmlns:w="{W_NS}"><w:body>{"".join(blocks)}</w:body></w:document>'.encode()
+
+
+def paragraph_index() -> ParagraphIndex:
+    """Paragraph index of a document without styles.xml (headings by direct outline level)."""
+    return ParagraphIndex(StyleResolver(None))
+
+
+def scan(*blocks: str, visitors: List, facts=None) -> None:
+    """Run `visitors` (in order) over the document made of `blocks`."""
+    scan_stream(BytesIO(document_xml(*blocks)), visitors, facts=facts)
@@ -0,0 +1,50 @@
+"""
+Tests for the benchmark comparison with the stored baseline (benchmarks/bench_normocontrol.py).
+"""
+import json
+
+from benchmarks.bench_normocontrol import BASELINE_PATH, compare
+
+
+def _results(phases, rss=100.0):
+    return {"10": {"phases_ms": phases, "peak_rss_mb": rss}}
+
+
+def _compare(results, baseline):
+    return compare(results, {"sizes": baseline}, tolerance=0.25, rss_tolerance=0.2, min_delta_ms=10)
+
+
+class TestCompare:
+    """Замедления, рост памяти и расхождение набора фаз с эталоном."""
+
+    def test_within_tolerance(self):
+        assert _compare(_results({"parse": 110.0}), _results({"parse": 100.0})) == []
+
+    def test_slowdown_and_rss(self):
+        regressions = _compare(_results({"parse": 200.0}, rss=150.0), _results({"parse": 100.0}))
+        assert regressions == [
+            "10 p, parse: 200.0 ms (baseline 100.0 ms)",
+            "10 p, peak RSS: 150.0 MB (baseline 100.0 MB)",
+        ]
+
+    def test_small_absolute_slowdown_is_ignored(self):
+        assert _compare(_results({"parse": 5.0}), _results({"parse": 1.0})) == []
+
+    def test_new_and_missing_phases(self):
+        regressions = _compare(
+            _results({"parse": 100.0, "check:citations": 5.0}),
+            _results({"parse": 100.0, "check:old": 5.0}),
+        )
+        assert regressions == [
+            "10 p, check:old: in the baseline but not measured (baseline mismatch)",
+            "10 p, check:citations: not in the baseline (baseline mismatch)",
+        ]
+
+    def test_size_missing_in_baseline(self):
+        assert _compare(_results({"parse": 100.0}), {}) == ["10 p: not in the baseline (baseline mismatch)"]
+
+    def test_stored_baseline_covers_every_check(self, checker):
+        baseline = json.loads(BASELINE_PATH.read_text(encoding="utf-8"))
+        expected = {f"check:{spec.name}" for kind in ("scanner", "check") for spec in checker.CHECKS.specs(kind)}
+        for size in baseline["sizes"].values():
+            assert expected <= set(size["phases_ms"])
@@ -0,0 +1,121 @@
+"""
+Tests for the figure, table and caption index (tests/helpers/caption_index.py).
+"""
+import pytest
+
+from tests.helpers.caption_index import FIGURE, TABLE, CaptionIndex, numbering_gaps, parse_mentions
+from tests.helpers.synthetic_xml import outline_level, paragraph, paragraph_index, scan
+
+
+A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+
+HEADING = outline_level(0)
+FIGURE_XML = paragraph(runs=(
+    f'<w:r><w:drawing><a:graphic xmlns:a="{A_NS}">'
+    '<a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/picture"/>'
+    "</a:graphic></w:drawing></w:r>"
+))
+TABLE_XML = f"<w:tbl><w:tr><w:tc>{paragraph('Ячейка')}</w:tc></w:tr></w:tbl>"
+
+
+def _captions(*blocks: str) -> CaptionIndex:
+    index = paragraph_index()
+    captions = CaptionIndex(index)
+    scan(*blocks, visitors=[index, captions])
+    return captions
+
+
+class TestParseMentions:
+    """Упоминания рисунков и таблиц в тексте."""
+
+    @pytest.mark.parametrize("text, mentions", [
+        ("как показано на рисунке 3", [[FIGURE, "3"]]),
+        ("см. рис. 2.1", [[FIGURE, "2.1"]]),
+        ("в таблицах 1 и 2", [[TABLE, "1"], [TABLE, "2"]]),
+        ("табл. 4–6", [[TABLE, "4"], [TABLE, "5"], [TABLE, "6"]]),
+        ("рисунки 1, 3", [[FIGURE, "1"], [FIGURE, "3"]]),
+        ("таблица № 7 и рисунок 2", [[TABLE, "7"], [FIGURE, "2"]]),
+        ("рисунки 1.1–1.2", [[FIGURE, "1.1"], [FIGURE, "1.2"]]),
+        ("таблица users и рисование", []),
+    ])
+    def test_mentions(self, text, mentions):
+        assert parse_mentions(text) == mentions
+
+
+class TestNumberingGaps:
+    """Сквозная нумерация или нумерация по разделам."""
+
+    @pytest.mark.parametrize("numbers, gaps", [
+        (["1", "2", "3"], []),
+        (["1.1", "1.2", "2.1", "3.1"], []),
+        (["2", "3"], [0]),
+        (["1", "3", "4"], [1]),
+        (["1.1", "1.3"], [1]),
+        (["1.1", "2.2"], [1]),
+        (["1", "1.1"], [1]),
+        (["1.1", "1.2", "1.1"], [2]),
+        ([], []),
+    ])
+    def test_gaps(self, numbers, gaps):
+        assert numbering_gaps(numbers) == gaps
+
+
+class TestCaptionIndex:
+    """Подписи, их объекты и ссылки в тексте."""
+
+    def test_caption_placement(self):
+        captions = _captions(
+            paragraph("1 Раздел", HEADING),
+            paragraph("Схема на рисунке 1 и данные в таблице 1."),
+            FIGURE_XML,
+            paragraph("Рисунок 1 – Схема"),
+            paragraph("Таблица 1 – Данные"),
+            TABLE_XML,
+            paragraph("Рисунок 2 – Подпись над рисунком"),
+            FIGURE_XML,
+        )
+        figure, table, second_figure = captions.objects
+        assert (figure.kind, table.kind) == (FIGURE, TABLE)
+        assert [caption.target for caption in captions.captions] == [0, 1, 2]
+        assert [caption.text for caption in captions.misplaced(FIGURE)] == ["Рисунок 2 – Подпись над рисунком"]
+        assert captions.misplaced(TABLE) == []
+        assert [caption.number for caption in captions.unreferenced(FIGURE)] == ["2"]
+        assert captions.unreferenced(TABLE) == []
+
+    def test_continuation_is_not_a_reference(self):
+        captions = _captions(
+            paragraph("1 Раздел", HEADING),
+            paragraph("Таблица 1 – Данные"),
+            TABLE_XML,
+            paragraph("Продолжение таблицы 1"),
+            TABLE_XML,
+        )
+        assert len(captions.objects) == 1  # the continued table is the same object
+        assert captions.mentions == {}
+        assert [caption.number for caption in captions.unreferenced(TABLE)] == ["1"]
+
+    def test_caption_is_not_a_reference_but_a_sentence_is(self):
+        captions = _captions(
+            paragraph("Таблица 1 содержит исходные данные."),
+            paragraph("Таблица 1 – Исходные данные"),
+            TABLE_XML,
+        )
+        assert captions.mentions == {(TABLE, "1"): [0]}
+        assert captions.unreferenced(TABLE) == []
+        # Both lines start with «Таблица»: the format check sees them as caption lines.
+        assert [line for _, line, _ in captions.caption_lines] == [
+            "Таблица 1 содержит исходные данные.",
+            "Таблица 1 – Исходные данные",
+        ]
+
+    def test_uncaptioned_objects_after_first_heading(self):
+        captions = _captions(
+            FIGURE_XML,  # title page
+            paragraph("1 Раздел", HEADING),
+            FIGURE_XML,
+            TABLE_XML,
+            paragraph("Текст"),
+        )
+        assert [obj.ordinal for obj in captions.uncaptioned(FIGURE)] == [2]
+        assert [obj.ordinal for obj in captions.uncaptioned(TABLE)] == [3]
+        assert captions.uncaptioned(FIGURE, before=2) == []
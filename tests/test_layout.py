@@ -0,0 +1,131 @@
+"""
+Tests for the render-free page layout estimator (tests/helpers/layout.py) on synthetic document.xml.
+"""
+from tests.helpers.layout import LayoutEstimator, PageGeometry
+from tests.helpers.ooxml_utils import get_paragraph_text
+from tests.helpers.report import NormocontrolReport
+from tests.helpers.synthetic_xml import PAGE_BREAK, paragraph, scan, text_run
+
+
+# 14 pt text: 15 characters per line, 6 lines per page.
+GEOMETRY = PageGeometry(text_width_pt=100, text_height_pt=100)
+
+RENDERED_BREAK = '<w:r><w:lastRenderedPageBreak/></w:r>'
+
+
+def _p(*runs: str, ppr: str = "") -> str:
+    return paragraph(ppr=ppr, runs="".join(runs))
+
+
+def _section(start: int = None, kind: str = None) -> str:
+    pg_num_type = f'<w:pgNumType w:start="{start}"/>' if start is not None else ""
+    section_type = f'<w:type w:val="{kind}"/>' if kind else ""
+    return f"<w:sectPr>{section_type}{pg_num_type}</w:sectPr>"
+
+
+class _Pages:
+    """Records the estimated start page of every non-empty paragraph (visited after the layout)."""
+
+    def __init__(self, layout: LayoutEstimator):
+        self.layout = layout
+        self.pages = {}
+
+    def visit_paragraph(self, element):
+        text = get_paragraph_text(element)
+        if text:
+            self.pages[text] = (self.layout.last_page, self.layout.last_at_page_top)
+
+
+def _layout(*blocks: str):
+    layout = LayoutEstimator(GEOMETRY)
+    pages = _Pages(layout)
+    scan(*blocks, visitors=[layout, pages])
+    return layout, pages.pages
+
+
+class TestPageFlow:
+    """Перенос по заполнению страницы и явные разрывы."""
+
+    def test_overflow_moves_to_next_page(self):
+        _, pages = _layout(_p(text_run("x" * 15 * 7)), _p(text_run("B")))
+        assert pages["B"] == (2, False)
+
+    def test_explicit_page_break(self):
+        _, pages = _layout(_p(text_run("A"), PAGE_BREAK, text_run("B")), _p(text_run("C")))
+        # The paragraph starts on page 1; its text after the break and the next paragraph are on page 2.
+        assert pages["AB"] == (1, True)
+        assert pages["C"] == (2, False)
+
+    def test_page_break_before(self):
+        _, pages = _layout(_p(text_run("A")), _p(text_run("B"), ppr="<w:pageBreakBefore/>"))
+        assert pages["B"] == (2, True)
+
+    def test_break_on_a_fresh_page_is_not_doubled(self):
+        layout, pages = _layout(
+            _p(text_run("A"), PAGE_BREAK),
+            _p(text_run("B"), ppr="<w:pageBreakBefore/>"),
+        )
+        assert pages["B"] == (2, True)
+        assert layout.page_count == 2
+
+
+class TestRenderedBreaks:
+    """Маркеры w:lastRenderedPageBreak синхронизируют оценку с вёрсткой Word."""
+
+    def test_rendered_break_discards_estimated_overflow(self):
+        # The estimate puts 3 pages of text before B; Word rendered it on page 2.
+        _, pages = _layout(_p(text_run("x" * 15 * 14)), _p(RENDERED_BREAK, text_run("B")), _p(text_run("C")))
+        assert pages["B"] == (2, True)
+        assert pages["C"] == (2, False)
+
+    def test_rendered_break_after_explicit_break(self):
+        # Word leaves a rendered marker right after an explicit break: one new page, not two.
+        layout, pages = _layout(_p(text_run("A"), PAGE_BREAK), _p(RENDERED_BREAK, text_run("B")))
+        assert pages["B"] == (2, True)
+        assert layout.rendered_breaks == 1
+
+
+class TestSections:
+    """Разрывы разделов и согласование w:pgNumType w:start с оценкой страниц."""
+
+    def test_next_page_section_break(self):
+        _, pages = _layout(_p(text_run("A"), ppr=_section()), _p(text_run("B")))
+        assert pages["B"] == (2, True)
+
+    def test_continuous_section_break(self):
+        _, pages = _layout(_p(text_run("A"), ppr=_section(kind="continuous")), _p(text_run("B")))
+        assert pages["B"] == (1, False)
+
+    def test_section_geometry_applies_to_followingtext_run(self):
+        narrow = '<w:sectPr><w:pgSz w:w="2000" w:h="2000"/><w:pgMar w:left="0" w:right="0" w:top="0" w:bottom="0"/></w:sectPr>'
+        layout, _ = _layout(_p(text_run("A"), ppr=narrow), _p(text_run("B")))
+        assert layout.geometry == PageGeometry(text_width_pt=100, text_height_pt=100)
+
+    def _numbering_issues(self, checker, *blocks: str):
+        layout = LayoutEstimator(GEOMETRY)
+        check = checker._PageLayoutCheck(None, layout, None)
+        scan(*blocks, visitors=[layout, check])
+        report = NormocontrolReport()
+        check._report_numbering_restarts("ПЗ.docx", report)
+        return check, report.issues
+
+    def test_section_start_page_matches_numbering(self, checker):
+        check, issues = self._numbering_issues(
+            checker,
+            _p(text_run("Титульный лист")),
+            _p(text_run("x" * 15 * 8), ppr=_section(start=1)),
+            _p(text_run("Раздел 2")),
+            _section(start=3),
+        )
+        assert [start for start, _ in check.sections] == [1, 3]
+        assert issues == []
+
+    def test_restarted_numbering_is_reported(self, checker):
+        _, issues = self._numbering_issues(
+            checker,
+            _p(text_run("Титульный лист"), ppr=_section()),
+            _p(text_run("Раздел 2")),
+            _section(start=1),
+        )
+        assert len(issues) == 1
+        assert issues[0].actual == "раздел 2: с 1 (≈ стр. 2)"
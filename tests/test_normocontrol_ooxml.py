@@ -12,13 +12,11 @@ Tests formatting requirements from docs/Требования_к_нормокон
 """
 import pytest
 from pathlib import Path
-from docx import Document
 from tests.helpers.ooxml_utils import (
-    get_document_xml,
     get_page_margins,
     get_page_size,
-    get_paragraph_properties,
-    get_run_properties,
+    paragraph_properties,
+    run_properties,
     check_margins,
     mm_to_twips,
     cm_to_twips,
@@ -33,7 +31,7 @@ from tests.helpers.ooxml_utils import (
 class TestPageSetup:
     """Tests for page setup: margins, size, orientation."""
     
-    def test_page_margins(self, any_docx):
+    def test_page_margins(self, any_docx, any_document):
         """
         Проверка полей страницы:
         - Левое: 30 мм
@@ -41,7 +39,7 @@ class TestPageSetup:
         - Верхнее: 20 мм
         - Нижнее: 20 мм
         """
-        doc_xml = get_document_xml(any_docx)
+        doc_xml = any_document.document_xml
         margins = get_page_margins(doc_xml)
         
         assert margins is not None, f"Не найдены поля страницы в {any_docx.name}"
@@ -69,9 +67,9 @@ class TestPageSetup:
                 f"ожидается {expected_mm:.1f} мм, фактически {actual_mm:.1f} мм"
             )
     
-    def test_page_size_a4(self, any_docx):
+    def test_page_size_a4(self, any_docx, any_document):
         """Проверка размера страницы A4 (210×297 мм)."""
-        doc_xml = get_document_xml(any_docx)
+        doc_xml = any_document.document_xml
         page_size = get_page_size(doc_xml)
         
         assert page_size is not None, f"Размер страницы не найден в {any_docx.name}"
@@ -94,12 +92,12 @@ class TestPageSetup:
 class TestParagraphFormatting:
     """Tests for paragraph formatting: indents, spacing, alignment."""
     
-    def test_first_line_indent(self, any_docx):
+    def test_first_line_indent(self, any_docx, any_document):
         """
         Проверка отступа первой строки абзаца: 1.25 см (или 1.5 см).
         Проверяем параграфы с явно заданным отступом.
         """
-        doc_xml = get_document_xml(any_docx)
+        doc_xml = any_document.document_xml
         paragraphs = doc_xml.xpath(".//w:p", namespaces=NS)
         
         # Expected values in twips
@@ -111,10 +109,10 @@ class TestParagraphFormatting:
         invalid_indents = []
         
         for p in paragraphs:
-            props = get_paragraph_properties(p)
-            if 'ind' in props and props['ind'].get('firstLine'):
+            props = paragraph_properties(p)
+            if props.ind is not None and props.ind.first_line:
                 # Handle both int and float strings
-                first_line = float(props['ind']['firstLine'])
+                first_line = float(props.ind.first_line)
                 first_line = int(round(first_line))
                 paragraphs_with_indent += 1
                 
@@ -133,22 +131,22 @@ class TestParagraphFormatting:
                 f"(ожидается 1.25 см или 1.5 см)"
             )
     
-    def test_line_spacing_15(self, any_docx):
+    def test_line_spacing_15(self, any_docx, any_document):
         """
         Проверка межстрочного интервала: полуторный (1.5).
         В OOXML обычно lineRule="auto" и line="360" (или больше).
         """
-        doc_xml = get_document_xml(any_docx)
+        doc_xml = any_document.document_xml
         paragraphs = doc_xml.xpath(".//w:p[w:pPr/w:spacing]", namespaces=NS)
         
         invalid_spacing = []
         
         for p in paragraphs:
-            props = get_paragraph_properties(p)
-            if 'spacing' in props:
-                spacing = props['spacing']
-                line = spacing.get('line')
-                line_rule = spacing.get('lineRule')
+            props = paragraph_properties(p)
+            if props.spacing is not None:
+                spacing = props.spacing
+                line = spacing.line
+                line_rule = spacing.line_rule
                 
                 # For 1.5 line spacing with auto rule, line should be around 360
                 # (240 = single, 360 = 1.5, 480 = double)
@@ -169,13 +167,12 @@ class TestParagraphFormatting:
                     f"{len(invalid_spacing)} из {len(paragraphs)}"
                 )
     
-    def test_justified_alignment(self, any_docx):
+    def test_justified_alignment(self, any_docx, any_document):
         """
         Проверка выравнивания текста: по ширине (both).
         Основной текст должен быть выровнен по ширине.
         """
-        doc = Document(any_docx)
-        doc_xml = get_document_xml(any_docx)
+        doc_xml = any_document.document_xml
         
         paragraphs = doc_xml.xpath(".//w:p", namespaces=NS)
         
@@ -183,10 +180,10 @@ class TestParagraphFormatting:
         total_with_alignment = 0
         
         for p in paragraphs:
-            props = get_paragraph_properties(p)
-            if 'jc' in props:
+            props = paragraph_properties(p)
+            if props.jc is not None:
                 total_with_alignment += 1
-                if props['jc'] == 'both':  # 'both' = justified
+                if props.jc == 'both':  # 'both' = justified
                     justified_count += 1
         
         # At least 50% of paragraphs with explicit alignment should be justified
@@ -201,22 +198,21 @@ class TestParagraphFormatting:
 class TestFonts:
     """Tests for font properties."""
     
-    def test_times_new_roman_font(self, any_docx):
+    def test_times_new_roman_font(self, any_docx, any_document):
         """
         Проверка использования шрифта Times New Roman.
         Проверяем runs с явно заданным шрифтом.
         """
-        doc_xml = get_document_xml(any_docx)
+        doc_xml = any_document.document_xml
         runs = doc_xml.xpath(".//w:r", namespaces=NS)
         
         fonts_used = set()
         
         for run in runs[:100]:  # Check first 100 runs
-            props = get_run_properties(run)
-            if 'rFonts' in props:
-                r_fonts = props['rFonts']
-                for font_type in ['ascii', 'hAnsi', 'cs']:
-                    font_name = r_fonts.get(font_type)
+            props = run_properties(run)
+            if props.fonts is not None:
+                r_fonts = props.fonts
+                for font_name in (r_fonts.ascii, r_fonts.h_ansi, r_fonts.cs):
                     if font_name:
                         fonts_used.add(font_name)
         
@@ -227,7 +223,7 @@ class TestFonts:
                 f"Найдены: {', '.join(sorted(fonts_used))}"
             )
     
-    def test_font_size_14pt_main_text(self, any_docx):
+    def test_font_size_14pt_main_text(self, any_docx, any_document):
         """
         Проверка размера шрифта: 14 пт для основного текста.
         Проверяем, что большинство runs используют 14pt или 12pt.
@@ -236,7 +232,7 @@ class TestFonts:
         может не быть задан явно. Этот тест пропускается, если размеры
         не заданы явно, или проверяет только явно заданные.
         """
-        doc_xml = get_document_xml(any_docx)
+        doc_xml = any_document.document_xml
         runs = doc_xml.xpath(".//w:r[w:rPr/w:sz]", namespaces=NS)
         
         size_14pt = pt_to_half_points(14)  # 28
@@ -245,9 +241,9 @@ class TestFonts:
         sizes = []
         
         for run in runs:
-            props = get_run_properties(run)
-            if 'sz' in props:
-                sizes.append(props['sz'])
+            props = run_properties(run)
+            if props.sz is not None:
+                sizes.append(props.sz)
         
         if not sizes:
             pytest.skip(f"Размеры шрифта не заданы явно в {any_docx.name}")
@@ -271,7 +267,7 @@ class TestFonts:
 class TestDocumentStructure:
     """Tests for document structure and required sections."""
     
-    def test_has_required_sections(self, any_docx):
+    def test_has_required_sections(self, any_docx, any_document):
         """
         Проверка наличия обязательных разделов:
         - Содержание (или Оглавление)
@@ -282,8 +278,7 @@ class TestDocumentStructure:
         Примечание: это упрощённая проверка по наличию ключевых слов.
         Приложения не требуют всех разделов, только ПЗ.
         """
-        doc = Document(any_docx)
-        text = "\n".join([p.text for p in doc.paragraphs]).upper()
+        text = any_document.text.upper()
         
         # Приложения не требуют полной структуры
         if 'ПРИЛОЖЕНИЕ' in any_docx.name.upper():
@@ -309,19 +304,18 @@ class TestDocumentStructure:
                 f"{', '.join(missing)}"
             )
     
-    def test_has_tables(self, pz_docx):
+    def test_has_tables(self, pz_docx, pz_document):
         """Проверка наличия таблиц в основном документе (ПЗ)."""
-        doc = Document(pz_docx)
+        doc = pz_document.docx
         
         assert len(doc.tables) > 0, f"Не найдены таблицы в {pz_docx.name}"
     
-    def test_table_caption_format(self, any_docx):
+    def test_table_caption_format(self, any_docx, any_document):
         """
         Проверка формата подписей таблиц: "Таблица X.Y — Название".
         Упрощённая проверка по наличию слова "Таблица" и тире.
         """
-        doc = Document(any_docx)
-        text = "\n".join([p.text for p in doc.paragraphs])
+        text = any_document.text
         
         # Look for table captions (simplified check)
         table_patterns = []
@@ -343,14 +337,14 @@ class TestDocumentStructure:
 class TestAdvanced:
     """Advanced checks (optional, may be skipped)."""
     
-    def test_no_direct_font_formatting_in_body(self, any_docx):
+    def test_no_direct_font_formatting_in_body(self, any_docx, any_document):
         """
         Проверка: в основном тексте не должно быть прямого форматирования шрифта.
         Всё форматирование должно идти через стили (best practice).
         
         Примечание: это строгая проверка, может не пройти для многих документов.
         """
-        doc_xml = get_document_xml(any_docx)
+        doc_xml = any_document.document_xml
         
         # Count runs with direct font formatting
         direct_fonts = doc_xml.xpath("//w:r/w:rPr/w:rFonts", namespaces=NS)
@@ -368,14 +362,12 @@ class TestAdvanced:
 
 
 # Summary test that can be run separately
-def test_normocontrol_summary(any_docx):
+def test_normocontrol_summary(any_docx, any_document):
     """
     Сводная проверка основных требований нормоконтроля.
     Можно запускать отдельно для быстрой валидации.
     """
-    doc_xml = get_document_xml(any_docx)
-    doc = Document(any_docx)
-    
+    doc_xml = any_document.document_xml
     issues = []
     
     # Check margins
@@ -383,7 +375,7 @@ def test_normocontrol_summary(any_docx):
         issues.append("Некорректные поля страницы")
     
     # Check structure
-    text = "\n".join([p.text for p in doc.paragraphs]).upper()
+    text = any_document.text.upper()
     if 'ВВЕДЕНИЕ' not in text:
         issues.append("Отсутствует раздел 'Введение'")
     if 'ЗАКЛЮЧЕНИЕ' not in text:
@@ -4,15 +4,15 @@ Normocontrol tests with report generation (non-failing mode).
 These tests collect all issues into a report instead of failing immediately.
 Run with: pytest tests/test_normocontrol_report.py --report-format=markdown
 """
+import json
 import pytest
+from dataclasses import asdict
 from pathlib import Path
-from docx import Document
 from tests.helpers.ooxml_utils import (
-    get_document_xml,
     get_page_margins,
     get_page_size,
-    get_paragraph_properties,
-    get_run_properties,
+    paragraph_properties,
+    run_properties,
     mm_to_twips,
     cm_to_twips,
     twips_to_mm,
@@ -23,9 +23,10 @@ from tests.helpers.ooxml_utils import (
     get_paragraph_text_preview,
     NS,
 )
+from tests.helpers.report import NormocontrolReport
 
 
-def test_all_documents_normocontrol(any_docx, normocontrol_report):
+def test_all_documents_normocontrol(any_docx, any_document, normocontrol_report):
     """
     Comprehensive normocontrol check that collects all issues.
     This test never fails - it only collects issues into the report.
@@ -33,8 +34,7 @@ def test_all_documents_normocontrol(any_docx, normocontrol_report):
     doc_name = any_docx.name
     normocontrol_report.add_document(doc_name)
     
-    doc_xml = get_document_xml(any_docx)
-    doc = Document(any_docx)
+    doc_xml = any_document.document_xml
     
     # Check page margins
     _check_page_margins(any_docx, doc_xml, normocontrol_report)
@@ -52,8 +52,8 @@ def test_all_documents_normocontrol(any_docx, normocontrol_report):
     _check_font_sizes(any_docx, doc_xml, normocontrol_report)
     
     # Check structure
-    _check_document_structure(any_docx, doc, normocontrol_report)
-    _check_table_captions(any_docx, doc, normocontrol_report)
+    _check_document_structure(any_docx, any_document.text, normocontrol_report)
+    _check_table_captions(any_docx, any_document.text, normocontrol_report)
 
 
 def _check_page_margins(docx_path, doc_xml, report):
@@ -150,10 +150,10 @@ def _check_paragraph_indents(docx_path, doc_xml, report):
     problem_locations = []
     
     for idx, p in enumerate(paragraphs):
-        props = get_paragraph_properties(p)
-        if 'ind' in props and props['ind'].get('firstLine'):
+        props = paragraph_properties(p)
+        if props.ind is not None and props.ind.first_line:
             try:
-                first_line = float(props['ind']['firstLine'])
+                first_line = float(props.ind.first_line)
                 first_line = int(round(first_line))
                 
                 diff_125 = abs(first_line - indent_125)
@@ -192,11 +192,11 @@ def _check_line_spacing(docx_path, doc_xml, report):
     first_problem_para = None
     
     for idx, p in enumerate(paragraphs):
-        props = get_paragraph_properties(p)
-        if 'spacing' in props:
-            spacing = props['spacing']
-            line = spacing.get('line')
-            line_rule = spacing.get('lineRule')
+        props = paragraph_properties(p)
+        if props.spacing is not None:
+            spacing = props.spacing
+            line = spacing.line
+            line_rule = spacing.line_rule
             
             if line and line_rule == 'auto':
                 try:
@@ -230,10 +230,10 @@ def _check_alignment(docx_path, doc_xml, report):
     total_with_alignment = 0
     
     for p in paragraphs:
-        props = get_paragraph_properties(p)
-        if 'jc' in props:
+        props = paragraph_properties(p)
+        if props.jc is not None:
             total_with_alignment += 1
-            if props['jc'] == 'both':
+            if props.jc == 'both':
                 justified_count += 1
     
     if total_with_alignment > 0:
@@ -255,11 +255,10 @@ def _check_fonts(docx_path, doc_xml, report):
     fonts_used = set()
     
     for run in runs[:100]:
-        props = get_run_properties(run)
-        if 'rFonts' in props:
-            r_fonts = props['rFonts']
-            for font_type in ['ascii', 'hAnsi', 'cs']:
-                font_name = r_fonts.get(font_type)
+        props = run_properties(run)
+        if props.fonts is not None:
+            r_fonts = props.fonts
+            for font_name in (r_fonts.ascii, r_fonts.h_ansi, r_fonts.cs):
                 if font_name:
                     fonts_used.add(font_name)
     
@@ -283,9 +282,9 @@ def _check_font_sizes(docx_path, doc_xml, report):
     sizes = []
     
     for run in runs:
-        props = get_run_properties(run)
-        if 'sz' in props:
-            sizes.append(props['sz'])
+        props = run_properties(run)
+        if props.sz is not None:
+            sizes.append(props.sz)
     
     if sizes:
         count_14 = sizes.count(size_14pt)
@@ -302,7 +301,7 @@ def _check_font_sizes(docx_path, doc_xml, report):
             )
 
 
-def _check_document_structure(docx_path, doc, report):
+def _check_document_structure(docx_path, text, report):
     """Check document structure."""
     doc_name = docx_path.name
     
@@ -310,7 +309,7 @@ def _check_document_structure(docx_path, doc, report):
     if 'ПРИЛОЖЕНИЕ' in doc_name.upper():
         return
     
-    text = "\n".join([p.text for p in doc.paragraphs]).upper()
+    text = text.upper()
     
     required_keywords = {
         'содержание': (['СОДЕРЖАНИЕ', 'ОГЛАВЛЕНИЕ'], 'Начало документа'),
@@ -330,10 +329,9 @@ def _check_document_structure(docx_path, doc, report):
             )
 
 
-def _check_table_captions(docx_path, doc, report):
+def _check_table_captions(docx_path, text, report):
     """Check table caption format."""
     doc_name = docx_path.name
-    text = "\n".join([p.text for p in doc.paragraphs])
     
     table_patterns = []
     table_line_numbers = []
@@ -359,3 +357,160 @@ def _check_table_captions(docx_path, doc, report):
                 actual=f"{len(table_patterns) - has_dash} из {len(table_patterns)} без тире",
                 location=location
             )
+
+
+def _sample_report():
+    """Three checked documents, issues added out of document order, one unchecked document."""
+    report = NormocontrolReport(timestamp="2026-01-01T10:00:00")
+    for doc in ("ПЗ.docx", "Приложение А.docx", "Приложение Б.docx"):
+        report.add_document(doc)
+    report.add_issue("ПЗ.docx", "fonts", "error", "Размер шрифта", expected="14 pt", actual="12 pt", location="Абзац 3")
+    report.add_issue("Приложение Б.docx", "margins", "warning", "Левое поле", expected="30 мм", actual="25 мм")
+    report.add_issue("ПЗ.docx", "captions", "info", "Подпись таблицы", location="Таблица 1")
+    report.add_issue("Черновик.docx", "structure", "error", "Нет раздела «Введение»")
+    report.add_issue("ПЗ.docx", "fonts", "warning", "Шрифт", actual="Arial")
+    return report
+
+
+# Output of the in-memory writers that preceded the streaming ones.
+EXPECTED_MARKDOWN = "\n".join([
+    "# Отчёт проверки нормоконтроля\n",
+    "**Дата проверки:** 2026-01-01T10:00:00\n",
+    "## Сводка\n",
+    "- **Проверено документов:** 3",
+    "- **Всего проблем:** 5",
+    "  - ❌ Ошибки: 2",
+    "  - ⚠️ Предупреждения: 2",
+    "  - ℹ️ Информация: 1\n",
+    "### По категориям\n",
+    "- **captions:** 1",
+    "- **fonts:** 2",
+    "- **margins:** 1",
+    "- **structure:** 1",
+    "",
+    "### По документам\n",
+    "| Документ | ❌ Ошибки | ⚠️ Предупреждения | ℹ️ Информация |",
+    "|---|---|---|---|",
+    "| ПЗ.docx | 1 | 1 | 1 |",
+    "| Приложение А.docx | 0 | 0 | 0 |",
+    "| Приложение Б.docx | 0 | 1 | 0 |",
+    "| Черновик.docx | 1 | 0 | 0 |",
+    "",
+    "## ПЗ.docx\n",
+    "**Найдено проблем:** 3\n",
+    "### Captions\n",
+    "ℹ️ **Подпись таблицы**",
+    "  - Расположение: Таблица 1",
+    "",
+    "### Fonts\n",
+    "❌ **Размер шрифта**",
+    "  - Ожидается: `14 pt`",
+    "  - Фактически: `12 pt`",
+    "  - Расположение: Абзац 3",
+    "",
+    "⚠️ **Шрифт**",
+    "  - Фактически: `Arial`",
+    "",
+    "## Приложение А.docx\n",
+    "✅ Проблем не обнаружено\n",
+    "## Приложение Б.docx\n",
+    "**Найдено проблем:** 1\n",
+    "### Margins\n",
+    "⚠️ **Левое поле**",
+    "  - Ожидается: `30 мм`",
+    "  - Фактически: `25 мм`",
+    "",
+])
+
+EXPECTED_TEXT = "\n".join([
+    "=" * 80,
+    "ОТЧЁТ ПРОВЕРКИ НОРМОКОНТРОЛЯ",
+    "=" * 80,
+    "Дата: 2026-01-01T10:00:00\n",
+    "СВОДКА:",
+    "  Проверено документов: 3",
+    "  Всего проблем: 5",
+    "    - Ошибки: 2",
+    "    - Предупреждения: 2",
+    "    - Информация: 1\n",
+    "-" * 80,
+    "ДОКУМЕНТ: ПЗ.docx",
+    "-" * 80,
+    "  Найдено проблем: 3\n",
+    "  1. [ОШИБКА] FONTS",
+    "     Размер шрифта",
+    "     Ожидается: 14 pt",
+    "     Фактически: 12 pt",
+    "     Расположение: Абзац 3",
+    "",
+    "  2. [ИНФОРМАЦИЯ] CAPTIONS",
+    "     Подпись таблицы",
+    "     Расположение: Таблица 1",
+    "",
+    "  3. [ПРЕДУПРЕЖДЕНИЕ] FONTS",
+    "     Шрифт",
+    "     Фактически: Arial",
+    "",
+    "-" * 80,
+    "ДОКУМЕНТ: Приложение А.docx",
+    "-" * 80,
+    "  ✓ Проблем не обнаружено\n",
+    "-" * 80,
+    "ДОКУМЕНТ: Приложение Б.docx",
+    "-" * 80,
+    "  Найдено проблем: 1\n",
+    "  1. [ПРЕДУПРЕЖДЕНИЕ] MARGINS",
+    "     Левое поле",
+    "     Ожидается: 30 мм",
+    "     Фактически: 25 мм",
+    "",
+    "=" * 80,
+])
+
+
+class TestReportWriters:
+    """Потоковая запись отчётов даёт тот же текст, что и сборка отчёта в памяти."""
+
+    def test_markdown(self, tmp_path):
+        _sample_report().to_markdown(tmp_path / "report.md")
+        assert (tmp_path / "report.md").read_text(encoding="utf-8") == EXPECTED_MARKDOWN
+
+    def test_text(self, tmp_path):
+        _sample_report().to_text(tmp_path / "report.txt")
+        assert (tmp_path / "report.txt").read_text(encoding="utf-8") == EXPECTED_TEXT
+
+    def test_json_keeps_insertion_order(self, tmp_path):
+        report = _sample_report()
+        report.to_json(tmp_path / "report.json")
+        payload = {
+            'timestamp': report.timestamp,
+            'summary': report.generate_summary(),
+            'documents': report.documents_checked,
+            'issues': [asdict(issue) for issue in report.issues],
+        }
+
+        assert (tmp_path / "report.json").read_text(encoding="utf-8") == json.dumps(payload, ensure_ascii=False, indent=2)
+        assert [issue['document'] for issue in payload['issues']] == [
+            "ПЗ.docx", "Приложение Б.docx", "ПЗ.docx", "Черновик.docx", "ПЗ.docx",
+        ]
+        assert report.to_dict() == payload
+
+    def test_json_without_issues(self, tmp_path):
+        report = NormocontrolReport(timestamp="2026-01-01T10:00:00")
+        report.add_document("ПЗ.docx")
+        report.to_json(tmp_path / "report.json")
+        assert (tmp_path / "report.json").read_text(encoding="utf-8") == json.dumps(report.to_dict(), ensure_ascii=False, indent=2)
+
+    def test_one_pass_equals_separate_writers(self, tmp_path):
+        report = _sample_report()
+        report.write_reports({'markdown': tmp_path / "all.md", 'json': tmp_path / "all.json", 'text': tmp_path / "all.txt"})
+        report.to_markdown(tmp_path / "report.md")
+        report.to_json(tmp_path / "report.json")
+        report.to_text(tmp_path / "report.txt")
+
+        for suffix in ("md", "json", "txt"):
+            assert (tmp_path / f"all.{suffix}").read_bytes() == (tmp_path / f"report.{suffix}").read_bytes()
+
+    def test_unknown_format(self, tmp_path):
+        with pytest.raises(ValueError):
+            _sample_report().write_reports({'pdf': tmp_path / "report.pdf"})
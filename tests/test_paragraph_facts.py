@@ -0,0 +1,220 @@
+"""
+Tests for incremental re-checks with reused paragraph facts (tests/helpers/paragraph_facts.py).
+
+Reused facts must give exactly the report of a full check: stale facts would
+silently produce a wrong report.
+"""
+import re
+import zipfile
+from dataclasses import asdict
+
+from tests.helpers.ooxml_utils import get_paragraph_text
+from tests.helpers.paragraph_facts import (
+    ParagraphFactsCache,
+    body_chunks,
+    chunk_document,
+    derive_chunk_facts,
+    paragraph_fingerprints,
+)
+from tests.helpers.result_cache import FactsStore
+from tests.helpers.synthetic_xml import document_xml, paragraph, scan
+
+
+def _document(*texts: str) -> bytes:
+    return document_xml(*(paragraph(text) for text in texts))
+
+
+class _CountingVisitor:
+    """Facts-aware visitor recording which paragraphs had their facts derived."""
+
+    facts_name = "text"
+
+    def __init__(self):
+        self.derived = []
+        self.visited = []
+
+    def paragraph_facts(self, element):
+        text = get_paragraph_text(element)
+        self.derived.append(text)
+        return text.upper()
+
+    def visit_paragraph_facts(self, element, facts):
+        self.visited.append(facts)
+
+
+def _scan(*texts: str, previous=None):
+    visitor = _CountingVisitor()
+    facts = ParagraphFactsCache(previous, context="styles v1")
+    facts.start(_document(*texts))
+    scan(*(paragraph(text) for text in texts), visitors=[visitor], facts=facts)
+    return visitor, facts
+
+
+def _edit_docx(source, target, old: str, new: str):
+    """Copy of a .docx with one text replaced in word/document.xml."""
+    with zipfile.ZipFile(source) as src, zipfile.ZipFile(target, "w", zipfile.ZIP_DEFLATED) as dst:
+        for item in src.infolist():
+            data = src.read(item.filename)
+            if item.filename == "word/document.xml":
+                assert data.count(old.encode()) == 1
+                data = data.replace(old.encode(), new.encode())
+            dst.writestr(item, data)
+    return target
+
+
+def _issues(report):
+    return [asdict(issue) for issue in report.issues]
+
+
+class TestFingerprints:
+    """Отпечатки параграфов: изменение одного параграфа меняет только его отпечаток."""
+
+    def test_only_edited_paragraph_changes(self):
+        before = paragraph_fingerprints(_document("Введение", "Текст", "Заключение"))
+        after = paragraph_fingerprints(_document("Введение", "Новый текст", "Заключение"))
+
+        assert len(before) == len(after) == 3
+        assert [a == b for a, b in zip(before, after)] == [True, False, True]
+
+    def test_nested_paragraphs_in_scanner_order(self):
+        text_box = f"<w:r><w:pict><w:txbxContent>{paragraph('Надпись')}</w:txbxContent></w:pict></w:r>"
+        fingerprints = paragraph_fingerprints(document_xml(paragraph(runs=text_box), "<w:p/>"))
+
+        # The text box paragraph completes first (the cache key adds its parent kind),
+        # the empty paragraph is a span of its own.
+        assert len(fingerprints) == 3
+        assert fingerprints[0] == paragraph_fingerprints(_document("Надпись"))[0]
+        assert fingerprints[1] != fingerprints[2]
+
+    def test_unbalanced_markup_is_not_fingerprinted(self):
+        assert paragraph_fingerprints(b"<w:body><w:p><w:r/></w:body>") is None
+
+
+class TestParagraphFactsCache:
+    """Факты неизменённых параграфов берутся из таблицы, изменённый — вычисляется заново."""
+
+    def test_only_changed_paragraph_is_derived_again(self):
+        first, facts = _scan("Введение", "Текст", "Заключение")
+        assert first.derived == ["Введение", "Текст", "Заключение"]
+
+        second, facts = _scan("Введение", "Новый текст", "Заключение", previous=facts.to_dict())
+        fresh, _ = _scan("Введение", "Новый текст", "Заключение")
+
+        assert second.derived == ["Новый текст"]
+        assert (facts.hits, facts.misses) == (2, 1)
+        assert second.visited == fresh.visited
+
+    def test_other_context_discards_previous_table(self):
+        _, facts = _scan("Введение")
+        table = facts.to_dict()
+        table['context'] = "styles v2"
+
+        visitor, _ = _scan("Введение", previous=table)
+        assert visitor.derived == ["Введение"]
+
+    def test_identical_paragraphs_share_one_entry(self):
+        visitor, facts = _scan("Текст", "Текст", "Другой")
+
+        assert visitor.derived == ["Текст", "Другой"]
+        assert visitor.visited == ["ТЕКСТ", "ТЕКСТ", "ДРУГОЙ"]
+        assert facts.complete
+
+    def test_reused_facts_give_the_full_check_report(self, checker, synthetic_docx, tmp_path, capsys):
+        """Проверка редакции документа с таблицей фактов совпадает с полной проверкой."""
+        config = checker.load_it_normocontrol_config(checker._standards_md_path(checker._resolve_repo_root()))
+        store = FactsStore(tmp_path / "facts", "test")
+        edited = _edit_docx(
+            synthetic_docx, tmp_path / "edited.docx",
+            "Пояснительная записка к курсовой работе", "Пояснительная записка к курсовому проекту",
+        )
+
+        for revision in (synthetic_docx, edited):
+            capsys.readouterr()
+            incremental = checker._new_report(config)
+            checker.run_checks(revision, "ПЗ.docx", incremental, config, facts_store=store)
+            output = capsys.readouterr().out
+            full = checker._new_report(config)
+            checker.run_checks(revision, "ПЗ.docx", full, config)
+
+            assert _issues(incremental) == _issues(full)
+
+        reused, total = map(int, re.search(r"Incremental check: (\d+) of (\d+)", output).groups())
+        assert total - reused == 1
+
+    def test_same_named_files_keep_separate_tables(self, checker, synthetic_docx, tmp_path):
+        """Файлы разных студентов с одинаковым именем не вытесняют таблицы фактов друг друга."""
+        ivanov = tmp_path / "Ivanov" / "Пояснительная_записка.docx"
+        petrov = tmp_path / "Petrov" / "Пояснительная_записка.docx"
+        ivanov.parent.mkdir()
+        petrov.parent.mkdir()
+        ivanov.write_bytes(synthetic_docx.read_bytes())
+        _edit_docx(synthetic_docx, petrov, "Пояснительная записка к курсовой работе", "Пояснительная записка к проекту")
+        report_dir = tmp_path / "reports"
+
+        for path in (ivanov, petrov):
+            checker.build_report(path, report_dir)
+
+        store = FactsStore(report_dir / ".cache" / "facts", checker._checker_version(checker._resolve_repo_root()))
+        assert store.load(ivanov.resolve().as_posix()) is not None
+        assert store.load(petrov.resolve().as_posix()) is not None
+        assert store.load("Пояснительная_записка.docx") is None
+
+
+class TestChunkDerivation:
+    """Факты, вычисленные по фрагментам в рабочих процессах, совпадают с последовательным проходом."""
+
+    BLOCKS = (
+        paragraph("Абзац 1"),
+        f"<w:tbl><w:tr><w:tc>{paragraph('Ячейка 1')}</w:tc><w:tc>{paragraph('Ячейка 2')}</w:tc></w:tr></w:tbl>",
+        paragraph("Абзац 2"),
+        f"<w:sdt><w:sdtContent>{paragraph('Поле')}</w:sdtContent></w:sdt>",
+        paragraph("Абзац 3"),
+        "<w:p/>",
+        "<w:sectPr/>",
+    )
+
+    def test_chunks_end_on_top_level_blocks(self):
+        document = document_xml(*self.BLOCKS)
+        chunks = body_chunks(document, 2)
+
+        # The table (2 paragraphs) and the content control stay whole; the last chunk
+        # holds what follows the last full chunk (here only the body w:sectPr).
+        assert [(first, count) for _, _, first, count in chunks] == [(0, 3), (3, 2), (5, 2), (7, 0)]
+        assert chunks[-1][1] == document.rfind(b"</w:body>")
+        assert b"<w:sectPr/>" in chunk_document(document, *chunks[-1][:2])
+
+    def test_chunk_facts_equal_serial_facts(self):
+        document = document_xml(*self.BLOCKS)
+        serial = _CountingVisitor()
+        scan(*self.BLOCKS, visitors=[serial])
+
+        chunked = []
+        for start, end, _, count in body_chunks(document, 2):
+            entries = derive_chunk_facts(chunk_document(document, start, end), [_CountingVisitor()])
+            assert len(entries) == count
+            chunked.extend(entry["text"] for entry in entries)
+
+        assert chunked == serial.visited
+
+    def test_pooled_check_equals_serial_check(self, checker, synthetic_docx, tmp_path, monkeypatch):
+        """Проверка с `--jobs 2` даёт тот же отчёт и ту же таблицу фактов, что и в одном процессе."""
+        config = checker.load_it_normocontrol_config(checker._standards_md_path(checker._resolve_repo_root()))
+        monkeypatch.setattr(checker, "CHUNK_PARAGRAPHS", 20)
+        spans = []
+        pool_call = checker._ChunkFactsPool.__call__
+
+        def record_spans(pool, chunk_spans):
+            spans.extend(chunk_spans)
+            return pool_call(pool, chunk_spans)
+
+        monkeypatch.setattr(checker._ChunkFactsPool, "__call__", record_spans)
+
+        results = {}
+        for jobs in (1, 2):
+            store = FactsStore(tmp_path / f"facts_{jobs}", "test")
+            report = checker._new_report(config)
+            checker.run_checks(synthetic_docx, "ПЗ.docx", report, config, facts_store=store, jobs=jobs)
+            results[jobs] = (_issues(report), store.load("ПЗ.docx"))
+
+        assert len(spans) >= 2
+        assert results[2] == results[1]
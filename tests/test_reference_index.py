@@ -0,0 +1,124 @@
+"""
+Tests for the citation and bibliography index (tests/helpers/reference_index.py).
+"""
+import pytest
+
+from tests.helpers.reference_index import ReferenceIndex, format_number_ranges, parse_citations
+from tests.helpers.synthetic_xml import outline_level, paragraph, paragraph_index, scan
+
+
+HEADING = outline_level(0)
+LIST_ITEM = '<w:numPr><w:ilvl w:val="0"/><w:numId w:val="1"/></w:numPr>'
+
+
+def _references(*blocks: str) -> ReferenceIndex:
+    index = paragraph_index()
+    references = ReferenceIndex(index)
+    scan(*blocks, visitors=[index, references])
+    return references
+
+
+class TestParseCitations:
+    """Ссылки в квадратных скобках: номера, диапазоны, перечисления, страницы."""
+
+    @pytest.mark.parametrize("text, numbers", [
+        ("как показано в [8].", [8]),
+        ("см. [3–5]", [3, 4, 5]),
+        ("см. [3-5] и [7—8]", [3, 4, 5, 7, 8]),
+        ("источники [1, 4]", [1, 4]),
+        ("источники [1; 4–5]", [1, 4, 5]),
+        ("по данным [2, с. 15]", [2]),
+        ("[2, с. 15] и снова [2]", [2, 2]),
+    ])
+    def test_citations(self, text, numbers):
+        assert parse_citations(text) == numbers
+
+    @pytest.mark.parametrize("text", [
+        "value = items[1]",          # indexing in a code listing
+        "matrix[1][2]",
+        "[с. 15]",                    # no source number
+        "[0]",
+        "[5–3]",                      # reversed range
+        "[1–100]",                    # range too long to be a citation
+        "[текст в скобках]",
+    ])
+    def test_not_citations(self, text):
+        assert parse_citations(text) == []
+
+
+class TestFormatNumberRanges:
+    """Сжатие номеров в диапазоны для отчёта."""
+
+    def test_collapses_consecutive_numbers(self):
+        assert format_number_ranges([7, 1, 2, 3, 12, 2]) == "1–3, 7, 12"
+
+    def test_limit(self):
+        assert format_number_ranges([1, 3, 5, 7], limit=2) == "1, 3, …"
+
+
+class TestReferenceIndex:
+    """Индекс ссылок и записей списка источников, построенный за один проход."""
+
+    def test_entries_numbered_in_text(self):
+        references = _references(
+            paragraph("Введение", HEADING),
+            paragraph("Текст со ссылками [1] и [2, с. 15]."),
+            paragraph("Список использованных источников", HEADING),
+            paragraph("1 Иванов И. И. Книга. – Минск, 2024."),
+            paragraph("2. Петров П. П. Статья. – Минск, 2023."),
+        )
+        assert references.citations == {1: [1], 2: [1]}
+        assert sorted(references.entries) == [1, 2]
+        assert references.entry_ordinals == {1: 3, 2: 4}
+        assert references.dotted_entries == [2]
+        assert references.dangling_citations() == []
+        assert references.unused_sources() == []
+
+    def test_entries_numbered_by_word_list(self):
+        references = _references(
+            paragraph("Текст [2]."),
+            paragraph("СПИСОК ИСПОЛЬЗОВАННЫХ ИСТОЧНИКОВ", HEADING),
+            paragraph("Иванов И. И. Книга.", LIST_ITEM),
+            paragraph("Петров П. П. Статья.", LIST_ITEM),
+            paragraph("Сидоров С. С. Отчёт.", LIST_ITEM),
+        )
+        assert references.entries == {1: "Иванов И. И. Книга.", 2: "Петров П. П. Статья.", 3: "Сидоров С. С. Отчёт."}
+        assert references.unused_sources() == [1, 3]
+
+    def test_contents_entry_and_following_sections(self):
+        references = _references(
+            paragraph("Список использованных источников"),  # contents entry: the last match is the section
+            paragraph("Введение", HEADING),
+            paragraph("Текст [1] и [4]."),
+            paragraph("Список использованных источников", HEADING),
+            paragraph("1 Иванов И. И. Книга."),
+            paragraph("ПРИЛОЖЕНИЕ А"),
+            paragraph("2 Листинг программы [3]"),
+        )
+        assert references.sources_heading == 3
+        assert list(references.entries) == [1]
+        # Brackets in appendices count as citations again.
+        assert references.dangling_citations() == [3, 4]
+
+    def test_brackets_inside_bibliography_are_not_citations(self):
+        references = _references(
+            paragraph("Список использованных источников", HEADING),
+            paragraph("1 Документация [Электронный ресурс]. – Режим доступа: [1]."),
+        )
+        assert references.citations == {}
+
+    @pytest.mark.parametrize("title", ["Список литературы", "5 Список использованной литературы", "СПИСОК ЛИТЕРАТУРЫ"])
+    def test_sources_title_aliases(self, title):
+        references = _references(paragraph("Текст [1]."), paragraph(title, HEADING), paragraph("1 Иванов И. И. Книга."))
+        assert references.sources_heading == 1
+        assert list(references.entries) == [1]
+
+    def test_order_violations(self):
+        references = _references(
+            paragraph("Сначала [1], затем [3]."),
+            paragraph("Потом [2] и снова [1], затем [4–5]."),
+            paragraph("И наконец [3]."),
+        )
+        assert references.first_citations == [1, 3, 2, 4, 5]
+        assert references.order_violations() == [(2, 3)]
+        assert references.citations[1] == [0, 1]
@@ -0,0 +1,134 @@
+"""
+Tests for the normocontrol result cache and facts store (tests/helpers/result_cache.py).
+"""
+import os
+import threading
+
+from tests.helpers.report import Issue
+from tests.helpers.result_cache import FactsStore, ResultCache
+
+
+def _issue(message: str) -> Issue:
+    return Issue(document="ПЗ.docx", category="fonts", severity="warning", description=message)
+
+
+def _docx(tmp_path, name: str, content: bytes):
+    path = tmp_path / name
+    path.write_bytes(content)
+    return path
+
+
+class TestResultCacheKeys:
+    """Ключ кэша: содержимое документа + соль (профиль, чек-лист, версия проверки)."""
+
+    def test_put_get_relabels_document(self, tmp_path):
+        cache = ResultCache(tmp_path / "cache", "salt")
+        key = cache.key_for(_docx(tmp_path, "a.docx", b"document"))
+        cache.put(key, [_issue("Размер шрифта")])
+
+        issues = cache.get(key, "Другое имя.docx")
+        assert [(issue.document, issue.description) for issue in issues] == [("Другое имя.docx", "Размер шрифта")]
+
+    def test_miss_for_unknown_key(self, tmp_path):
+        assert ResultCache(tmp_path / "cache", "salt").get("0" * 64, "ПЗ.docx") is None
+
+    def test_key_depends_on_content_not_name(self, tmp_path):
+        cache = ResultCache(tmp_path / "cache", "salt")
+        first = cache.key_for(_docx(tmp_path, "a.docx", b"document"))
+        assert cache.key_for(_docx(tmp_path, "b.docx", b"document")) == first
+        assert cache.key_for(_docx(tmp_path, "c.docx", b"document v2")) != first
+
+    def test_key_depends_on_salt(self, tmp_path):
+        path = _docx(tmp_path, "a.docx", b"document")
+        old = ResultCache(tmp_path / "cache", "1:checklist")
+        old.put(old.key_for(path), [_issue("Старый результат")])
+
+        new = ResultCache(tmp_path / "cache", "2:checklist")
+        assert new.key_for(path) != old.key_for(path)
+        assert new.get(new.key_for(path), "a.docx") is None
+
+    def test_salt_tracks_checker_version(self, checker, monkeypatch):
+        repo_root = checker._resolve_repo_root()
+        profile = checker.PROFILES["it_short"]
+        salt = checker._cache_salt(repo_root, profile)
+
+        monkeypatch.setattr(checker, "CHECKER_VERSION", checker.CHECKER_VERSION + ".test")
+        assert checker._cache_salt(repo_root, profile) != salt
+
+    def test_salt_tracks_checklist_and_profile(self, checker, tmp_path):
+        repo_root = checker._resolve_repo_root()
+        it_short = checker.PROFILES["it_short"]
+        md = tmp_path / "checklist.md"
+        md.write_bytes(it_short.standards_md_path(repo_root).read_bytes())
+        custom = checker.StandardsProfile("it_short", str(md), "копия чек-листа")
+
+        salt = checker._cache_salt(repo_root, custom)
+        assert salt == checker._cache_salt(repo_root, it_short)
+        assert checker._cache_salt(repo_root, checker.PROFILES["appendix"]) != salt
+
+        md.write_text(md.read_text(encoding="utf-8") + "\n- Новое требование\n", encoding="utf-8")
+        assert checker._cache_salt(repo_root, custom) != salt
+
+
+class TestResultCacheEviction:
+    """Вытеснение давно не использованных записей (LRU) по числу записей и размеру."""
+
+    def _put_aged(self, cache, key, age):
+        cache.put(key, [_issue(key)])
+        path = cache.cache_dir / f"{key}.json"
+        os.utime(path, (1_000_000 + age, 1_000_000 + age))
+
+    def test_evicts_least_recently_used_entry(self, tmp_path):
+        cache = ResultCache(tmp_path / "cache", "salt", max_entries=2)
+        self._put_aged(cache, "a", 1)
+        self._put_aged(cache, "b", 2)
+        # A hit refreshes the entry: "b" becomes the least recently used one.
+        assert cache.get("a", "ПЗ.docx") is not None
+        cache.put("c", [_issue("c")])
+
+        assert sorted(path.stem for path in cache.cache_dir.glob("*.json")) == ["a", "c"]
+
+    def test_evicts_by_total_size(self, tmp_path):
+        cache = ResultCache(tmp_path / "cache", "salt")
+        self._put_aged(cache, "a", 1)
+        self._put_aged(cache, "b", 2)
+        cache.max_bytes = sum(path.stat().st_size for path in cache.cache_dir.glob("*.json"))
+        cache.put("c", [_issue("c")])
+
+        assert sorted(path.stem for path in cache.cache_dir.glob("*.json")) == ["b", "c"]
+
+    def test_concurrent_writes_of_one_entry(self, tmp_path):
+        """Потоки сервера проверки пишут одну и ту же запись одновременно."""
+        cache = ResultCache(tmp_path / "cache", "salt")
+        errors = []
+
+        def write(worker):
+            try:
+                for round_ in range(50):
+                    cache.put("same", [_issue(f"{worker}:{round_}")])
+            except Exception as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=write, args=(worker,)) for worker in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(cache.get("same", "ПЗ.docx")) == 1
+        assert list(cache.cache_dir.glob("*.tmp")) == []
+
+
+class TestFactsStore:
+    """Таблицы фактов параграфов: по имени документа, с проверкой соли."""
+
+    def test_round_trip(self, tmp_path):
+        store = FactsStore(tmp_path / "facts", "v1")
+        store.save("ПЗ.docx", {"context": "x", "facts": {"ab": [1]}})
+        assert store.load("ПЗ.docx") == {"context": "x", "facts": {"ab": [1]}}
+        assert store.load("Другой.docx") is None
+
+    def test_other_salt_is_ignored(self, tmp_path):
+        FactsStore(tmp_path / "facts", "v1").save("ПЗ.docx", {"facts": {}})
+        assert FactsStore(tmp_path / "facts", "v2").load("ПЗ.docx") is None
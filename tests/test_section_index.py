@@ -0,0 +1,148 @@
+"""
+Tests for structural section detection (tests/helpers/section_index.py).
+"""
+import pytest
+
+from tests.helpers.section_index import SectionIndex, TitleTrie, is_optional_title, normalize_title
+from tests.helpers.styles import StyleResolver
+from tests.helpers.synthetic_xml import PAGE_BREAK, outline_level, paragraph, paragraph_index, scan
+
+
+HEADING = outline_level(0)
+
+TITLES = [
+    "Титульный лист", "Содержание", "Введение", "Основная часть",
+    "Заключение", "Список использованных источников", "Приложения",
+]
+
+
+def _sections(*blocks: str) -> SectionIndex:
+    index = paragraph_index()
+    sections = SectionIndex(index, StyleResolver(None))
+    scan(*blocks, visitors=[index, sections])
+    return sections
+
+
+class TestNormalizeTitle:
+    """Сравнимая форма заголовка: регистр, «ё», нумерация, пунктуация, пояснения в скобках."""
+
+    @pytest.mark.parametrize("text, title", [
+        ("ВВЕДЕНИЕ", "введение"),
+        ("1.2 Введение (кратко).", "введение"),
+        ("3. Заключение", "заключение"),
+        ("IV. Заключение", "заключение"),
+        ("Список использованных источников (при необходимости)", "список использованных источников"),
+        ("Расчёт  нагрузки:", "расчет нагрузки"),
+        ("ПРИЛОЖЕНИЕ А", "приложение а"),
+        ("...", ""),
+    ])
+    def test_normalize(self, text, title):
+        assert normalize_title(text) == title
+
+    def test_optional_title(self):
+        assert is_optional_title("Приложения (при необходимости)")
+        assert not is_optional_title("Приложения (А, Б)")
+
+
+class TestTitleTrie:
+    """Заголовок должен начинаться с названия раздела (на границе слова)."""
+
+    @pytest.fixture
+    def trie(self):
+        return TitleTrie(TITLES + ["Задание", "Задание на курсовой проект"])
+
+    @pytest.mark.parametrize("text, match", [
+        ("введение", ("Введение", "")),
+        ("приложение а", ("Приложения", "а")),
+        ("оглавление", ("Содержание", "")),
+        ("список литературы", ("Список использованных источников", "")),
+        ("задание на курсовой проект по дисциплине", ("Задание на курсовой проект", "по дисциплине")),
+        ("задание", ("Задание", "")),
+    ])
+    def test_match(self, trie, text, match):
+        assert trie.match(text) == match
+
+    @pytest.mark.parametrize("text", [
+        normalize_title("3.5 Запуск приложения"),  # the title is not at the start
+        "введения",                                 # no word boundary after the title
+        "заключенный договор",
+        "",
+    ])
+    def test_no_match(self, trie, text):
+        assert trie.match(text) is None
+
+
+class TestSectionIndex:
+    """Поиск разделов по заголовкам и коротким отдельным абзацам."""
+
+    def test_contents_entries_are_skipped(self):
+        sections = _sections(
+            paragraph("Пояснительная записка"),
+            paragraph("Содержание", HEADING),
+            paragraph("Введение"),  # contents entry up to the next heading
+            paragraph("Заключение\t12"),
+            paragraph(runs=PAGE_BREAK),
+            paragraph("Введение\t3"),  # entry with a page number
+            paragraph("Заключение", runs='<w:r><w:instrText> PAGEREF _Toc1 </w:instrText></w:r>'),
+            paragraph("Введение", HEADING),
+            paragraph("Текст введения."),
+            paragraph("Заключение", HEADING),
+        )
+        positions = sections.find_sections(TITLES)
+
+        assert sections.contents_heading == 1
+        assert positions["Введение"] == 7
+        assert positions["Заключение"] == 9
+        assert positions["Титульный лист"] == 0
+
+    def test_heading_wins_over_standalone_paragraph(self):
+        sections = _sections(
+            paragraph("Заключение"),
+            paragraph("Введение", HEADING),
+            paragraph("Заключение", HEADING),
+        )
+        assert sections.find_sections(TITLES)["Заключение"] == 2
+
+    def test_standalone_paragraph_with_label(self):
+        sections = _sections(
+            paragraph("Введение", HEADING),
+            paragraph("3.5 Запуск приложения"),
+            paragraph("ПРИЛОЖЕНИЕ А"),
+            paragraph("Приложение к договору"),
+        )
+        assert sections.find_sections(TITLES)["Приложения"] == 2
+
+    def test_main_part_starts_at_first_heading_after_introduction(self):
+        sections = _sections(
+            paragraph("Введение", HEADING),
+            paragraph("Текст введения."),
+            paragraph("1 Анализ предметной области", HEADING),
+            paragraph("2 Проектирование", HEADING),
+            paragraph("Заключение", HEADING),
+        )
+        positions = sections.find_sections(TITLES)
+
+        assert positions["Основная часть"] == 2
+        assert "Титульный лист" not in positions  # nothing precedes the first section
+
+    def test_main_part_without_headings(self):
+        sections = _sections(
+            paragraph("Введение", HEADING),
+            paragraph("Текст введения."),
+            paragraph("Текст основной части."),
+            paragraph("Заключение", HEADING),
+        )
+        assert sections.find_sections(TITLES)["Основная часть"] == 1
+
+    def test_no_main_part_between_adjacent_sections(self):
+        sections = _sections(paragraph("Введение", HEADING), paragraph("Заключение", HEADING))
+        assert "Основная часть" not in sections.find_sections(TITLES)
+
+    def test_main_part_after_contents_without_introduction(self):
+        sections = _sections(
+            paragraph("Содержание", HEADING),
+            paragraph("1 Анализ\t3"),
+            paragraph("1 Анализ", HEADING),
+            paragraph("Заключение", HEADING),
+        )
+        assert sections.find_sections(TITLES)["Основная часть"] == 2
@@ -0,0 +1,90 @@
+"""
+Tests for checklist profiles: `--standards` resolution, config sharing and skipped-checks notes.
+"""
+import pytest
+
+from tests.helpers.report import NormocontrolReport
+
+
+class TestResolveStandards:
+    """Выбор профилей по `--standards` и имени документа."""
+
+    @pytest.mark.parametrize("standards", [None, "auto"])
+    @pytest.mark.parametrize("doc_name, profile", [
+        ("ПЗ.docx", "it_short"),
+        ("Приложение А.docx", "appendix"),
+        ("ПРИЛОЖЕНИЕ Б.docx", "appendix"),
+        ("students/Ivanov/task_03/Приложение В.docx", "appendix"),
+        ("Пояснительная записка (приложение).docx", "it_short"),
+    ])
+    def test_auto(self, checker, standards, doc_name, profile):
+        assert checker.resolve_standards(standards, doc_name) == [checker.PROFILES[profile]]
+
+    def test_names_in_order_without_duplicates(self, checker):
+        profiles = checker.resolve_standards(" appendix, it_short ,auto", "ПЗ.docx")
+        assert [profile.name for profile in profiles] == ["appendix", "it_short"]
+
+    def test_checklist_path(self, checker, tmp_path):
+        md = tmp_path / "my_checklist.md"
+        md.write_text("# Чек-лист\n", encoding="utf-8")
+
+        (profile,) = checker.resolve_standards(str(md), "ПЗ.docx")
+        assert (profile.name, profile.standards_md, profile.skip_checks) == ("my_checklist", str(md.resolve()), ())
+
+    @pytest.mark.parametrize("standards", ["full", "it_short,missing.md", "it_short,"])
+    def test_invalid(self, checker, standards):
+        with pytest.raises(ValueError):
+            checker.resolve_standards(standards, "ПЗ.docx")
+
+
+class TestConfigGroups:
+    """Профили с одинаковым конфигом проверяются одним набором проверок."""
+
+    def test_groups_by_equal_config_in_order(self, checker):
+        runs = [
+            checker.ProfileRun({"font": 14}, "a", None),
+            checker.ProfileRun({"font": 12}, "b", None),
+            checker.ProfileRun({"font": 14}, "c", None, skip=("structure",)),
+        ]
+        groups = checker.config_groups(runs)
+
+        assert [(config, [run.doc_name for run in members]) for config, members in groups] == [
+            ({"font": 14}, ["a", "c"]),
+            ({"font": 12}, ["b"]),
+        ]
+
+    def test_profiles_sharing_a_checklist(self, checker):
+        config = checker.load_it_normocontrol_config(checker._standards_md_path(checker._resolve_repo_root()))
+        profiles = checker.resolve_standards("it_short,appendix", "ПЗ.docx")
+        runs = [
+            checker.ProfileRun(config, name, None, profile.skip_checks)
+            for profile, name in zip(profiles, checker._profile_document_names("ПЗ.docx", profiles))
+        ]
+
+        ((_, members),) = checker.config_groups(runs)
+        assert [run.doc_name for run in members] == ["ПЗ.docx [it_short]", "ПЗ.docx [appendix]"]
+
+
+class TestProfileNote:
+    """Отчёт сообщает, какие проверки профиль не выполнял и почему он применён."""
+
+    def _notes(self, checker, standards, doc_name):
+        report = NormocontrolReport()
+        for profile in checker.resolve_standards(standards, doc_name):
+            checker._add_profile_note(report, standards, doc_name, profile, doc_name)
+        return report.issues
+
+    def test_chosen_by_file_name(self, checker):
+        (note,) = self._notes(checker, None, "Приложение А.docx")
+        assert (note.category, note.severity) == ("profile", "info")
+        assert "structure, references" in note.description
+        assert "по имени файла" in note.actual
+        assert "--standards it_short" in note.actual
+
+    def test_requested_explicitly(self, checker):
+        (note,) = self._notes(checker, "appendix", "Приложение А.docx")
+        assert note.actual == "профиль задан в --standards"
+
+    def test_no_note_without_skipped_checks(self, checker):
+        assert self._notes(checker, None, "ПЗ.docx") == []
+        assert self._notes(checker, "it_short", "Приложение А.docx") == []
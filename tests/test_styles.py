@@ -0,0 +1,144 @@
+"""
+Tests for style inheritance resolution (tests/helpers/styles.py) on synthetic styles.xml.
+"""
+from lxml import etree
+
+from tests.helpers.styles import StyleResolver
+from tests.helpers.synthetic_xml import W_NS
+
+
+A_NS = "http://schemas.openxmlformats.org/drawingml/2006/main"
+
+STYLES_XML = f"""
+<w:styles xmlns:w="{W_NS}">
+  <w:docDefaults>
+    <w:rPrDefault><w:rPr><w:rFonts w:asciiTheme="minorHAnsi" w:hAnsiTheme="minorHAnsi"/><w:sz w:val="22"/></w:rPr></w:rPrDefault>
+    <w:pPrDefault><w:pPr><w:spacing w:after="160" w:line="259" w:lineRule="auto"/></w:pPr></w:pPrDefault>
+  </w:docDefaults>
+  <w:style w:type="paragraph" w:default="1" w:styleId="Normal">
+    <w:name w:val="Normal"/>
+    <w:pPr><w:ind w:firstLine="709"/><w:jc w:val="both"/></w:pPr>
+    <w:rPr><w:sz w:val="28"/></w:rPr>
+  </w:style>
+  <w:style w:type="paragraph" w:styleId="Heading1">
+    <w:name w:val="heading 1"/>
+    <w:basedOn w:val="Normal"/>
+    <w:pPr><w:pageBreakBefore/><w:outlineLvl w:val="0"/><w:jc w:val="center"/></w:pPr>
+    <w:rPr><w:b/><w:sz w:val="32"/></w:rPr>
+  </w:style>
+  <w:style w:type="paragraph" w:styleId="Heading2">
+    <w:name w:val="heading 2"/>
+    <w:basedOn w:val="Heading1"/>
+    <w:pPr><w:pageBreakBefore w:val="0"/><w:outlineLvl w:val="1"/></w:pPr>
+  </w:style>
+  <w:style w:type="paragraph" w:styleId="Loop">
+    <w:basedOn w:val="Loop"/>
+    <w:rPr><w:i/></w:rPr>
+  </w:style>
+  <w:style w:type="character" w:styleId="Code">
+    <w:rPr><w:rFonts w:ascii="Courier New" w:hAnsi="Courier New"/><w:sz w:val="24"/></w:rPr>
+  </w:style>
+</w:styles>
+"""
+
+THEME_XML = f"""
+<a:theme xmlns:a="{A_NS}">
+  <a:themeElements><a:fontScheme>
+    <a:majorFont><a:latin typeface="Cambria"/></a:majorFont>
+    <a:minorFont><a:latin typeface="Times New Roman"/><a:cs typeface="Arial"/></a:minorFont>
+  </a:fontScheme></a:themeElements>
+</a:theme>
+"""
+
+
+def _resolver() -> StyleResolver:
+    return StyleResolver(etree.fromstring(STYLES_XML), etree.fromstring(THEME_XML))
+
+
+def _paragraph(inner: str) -> etree._Element:
+    return etree.fromstring(f'<w:p xmlns:w="{W_NS}">{inner}</w:p>')
+
+
+def _first_run(paragraph: etree._Element) -> etree._Element:
+    return paragraph.find(f"{{{W_NS}}}r")
+
+
+class TestRunProperties:
+    """Размер и шрифт run: docDefaults → цепочка basedOn → стиль символов → прямое форматирование."""
+
+    def test_default_paragraph_style_and_theme_font(self):
+        paragraph = _paragraph("<w:r><w:t>текст</w:t></w:r>")
+        props = _resolver().run_properties(_first_run(paragraph))
+
+        assert props['sz'] == 28
+        assert props['rFonts'] == {'ascii': "Times New Roman", 'hAnsi': "Times New Roman"}
+
+    def test_based_on_chain(self):
+        paragraph = _paragraph('<w:pPr><w:pStyle w:val="Heading2"/></w:pPr><w:r><w:t>1.1 Раздел</w:t></w:r>')
+        props = _resolver().run_properties(_first_run(paragraph))
+
+        # Size and bold come from Heading1, the font from the theme via docDefaults.
+        assert props['sz'] == 32
+        assert props['b'] is True
+        assert props['rFonts']['ascii'] == "Times New Roman"
+
+    def test_character_style_then_direct_formatting(self):
+        paragraph = _paragraph(
+            '<w:r><w:rPr><w:rStyle w:val="Code"/></w:rPr><w:t>x</w:t></w:r>'
+            '<w:r><w:rPr><w:rStyle w:val="Code"/><w:sz w:val="20"/></w:rPr><w:t>y</w:t></w:r>'
+        )
+        resolver = _resolver()
+        styled, direct = paragraph.findall(f"{{{W_NS}}}r")
+
+        assert resolver.run_properties(styled)['sz'] == 24
+        assert resolver.run_properties(styled)['rFonts']['ascii'] == "Courier New"
+        assert resolver.run_properties(direct)['sz'] == 20
+        assert resolver.run_properties(direct)['rFonts']['ascii'] == "Courier New"
+
+    def test_direct_theme_font_reference(self):
+        paragraph = _paragraph('<w:r><w:rPr><w:rFonts w:asciiTheme="majorHAnsi"/></w:rPr><w:t>x</w:t></w:r>')
+        assert _resolver().run_properties(_first_run(paragraph))['rFonts']['ascii'] == "Cambria"
+
+    def test_based_on_cycle_terminates(self):
+        paragraph = _paragraph('<w:pPr><w:pStyle w:val="Loop"/></w:pPr><w:r><w:t>x</w:t></w:r>')
+        props = _resolver().run_properties(_first_run(paragraph))
+
+        assert props['i'] is True
+        assert props['sz'] == 22  # docDefaults only: Loop is not based on Normal
+
+
+class TestParagraphProperties:
+    """Отступы, выравнивание и разрывы страниц абзаца с учётом стилей."""
+
+    def test_inherited_and_overridden_values(self):
+        resolver = _resolver()
+        body = resolver.paragraph_properties(_paragraph("<w:r><w:t>x</w:t></w:r>"))
+        heading = resolver.paragraph_properties(_paragraph('<w:pPr><w:pStyle w:val="Heading2"/></w:pPr>'))
+
+        assert body['jc'] == "both"
+        assert body['ind'] == {'firstLine': "709", 'hanging': None}
+        assert body['spacing'] == {'after': "160", 'line': "259", 'lineRule': "auto"}
+        assert heading['jc'] == "center"
+        assert heading['outlineLvl'] == 1
+        assert heading['pageBreakBefore'] is False
+        assert heading['style'] == "Heading2"
+
+    def test_hanging_replaces_inherited_first_line(self):
+        paragraph = _paragraph('<w:pPr><w:ind w:start="567" w:hanging="283"/></w:pPr>')
+        ind = _resolver().paragraph_properties(paragraph)['ind']
+
+        # firstLine and hanging are mutually exclusive: the direct hanging indent wins.
+        assert ind == {'firstLine': None, 'hanging': "283", 'left': "567"}
+
+    def test_start_end_are_left_right(self):
+        paragraph = _paragraph('<w:pPr><w:ind w:start="100" w:end="200" w:firstLine="0"/></w:pPr>')
+        ind = _resolver().paragraph_properties(paragraph)['ind']
+
+        assert (ind['left'], ind['right'], ind['firstLine']) == ("100", "200", "0")
+        assert ind['hanging'] is None
+
+    def test_style_names(self):
+        resolver = _resolver()
+        assert resolver.style_name("Heading1") == "heading 1"
+        assert resolver.style_name("Missing") is None
+        assert resolver.paragraph_style_id(_paragraph('<w:pPr><w:pStyle w:val="Missing"/></w:pPr>')) == "Normal"
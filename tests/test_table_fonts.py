@@ -0,0 +1,27 @@
+"""
+Tests for the table font size check (`_TableFontsCheck` in check_it_docx).
+"""
+from dataclasses import replace
+
+
+def _table_issues(checker, docx, config):
+    report = checker._new_report(config)
+    checker.run_checks(docx, "ПЗ.docx", report, config)
+    return [issue for issue in report.issues if issue.category == "tables"]
+
+
+class TestTableFonts:
+    """Размер шрифта в таблицах сравнивается с размером из чек-листа."""
+
+    def test_tables_of_checklist_size(self, checker, synthetic_docx):
+        config = checker.load_it_normocontrol_config(checker._standards_md_path(checker._resolve_repo_root()))
+        assert config.inline_objects_font_size_pt == 12
+        assert _table_issues(checker, synthetic_docx, config) == []
+
+    def test_description_follows_config_size(self, checker, synthetic_docx):
+        config = checker.load_it_normocontrol_config(checker._standards_md_path(checker._resolve_repo_root()))
+        (issue,) = _table_issues(checker, synthetic_docx, replace(config, inline_objects_font_size_pt=10.5))
+
+        assert issue.description == "Размер шрифта в таблицах отличается от 10.5pt (с учётом стилей)"
+        assert issue.expected == "10.5pt (текст таблиц)"
+        assert "12pt" in issue.actual